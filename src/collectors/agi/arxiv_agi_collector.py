@@ -3,11 +3,19 @@ arXiv Collector specialized for AGI/ASI research
 """
 
 import arxiv
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Set
 from dataclasses import dataclass
 
+from src.utils.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from src.utils.harvest_state import HarvestState, harvest
+from src.utils.http_transport import HttpTransport
+from src.utils.retry import Retrier, RetryPolicy
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,6 +114,106 @@ class AGIKeywords:
         )
 
 
+class AGIKeywordMatcher:
+    """
+    Precompiled multi-keyword matcher
+
+    All keywords are compiled into a single trie-shaped regular expression
+    with word boundaries, wrapped in a lookahead so that one scan over the
+    lowercased text reports a match at every word start. Keywords contained
+    in a longer matched keyword (e.g. 'reasoning' in 'causal reasoning') are added from a
+    precomputed closure, so every category hit is found in one pass.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        """
+        Initialize the matcher
+
+        Args:
+            categories: Mapping of category name to its keywords
+        """
+        self.keywords: List[str] = []
+        self.categories: Dict[str, Set[str]] = {}
+        for name, keywords in categories.items():
+            self.categories[name] = {kw.lower() for kw in keywords}
+            for kw in keywords:
+                if kw.lower() not in self.keywords:
+                    self.keywords.append(kw.lower())
+
+        self._order = {kw: i for i, kw in enumerate(self.keywords)}
+
+        # Keywords implied by each keyword (itself plus word-bounded sub-keywords)
+        self._implied: Dict[str, Set[str]] = {
+            kw: {
+                other for other in self.keywords
+                if other == kw or re.search(r'\b' + re.escape(other) + r'\b', kw)
+            }
+            for kw in self.keywords
+        }
+
+        self._pattern = re.compile(
+            r'\b(?=(' + self._trie_pattern(self.keywords) + r')\b)'
+        )
+
+    @classmethod
+    def _trie_pattern(cls, keywords: List[str]) -> str:
+        """
+        Build a regex alternation that shares common prefixes
+
+        Longer continuations are tried first, so the longest keyword at a
+        position wins and shorter ones are reached by backtracking.
+
+        Args:
+            keywords: Keywords to compile
+
+        Returns:
+            Regex source (without anchors)
+        """
+        trie: Dict = {}
+        for kw in keywords:
+            node = trie
+            for char in kw:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def build(node: Dict) -> str:
+            terminal = '' in node
+            branches = [
+                re.escape(char) + build(child)
+                for char, child in sorted(node.items())
+                if char != ''
+            ]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            if terminal:
+                return '(?:' + body + ')?'
+            return body
+
+        return build(trie)
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find every keyword in the text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dictionary with 'all' (matched keywords in keyword order) and one
+            entry per category
+        """
+        found: Set[str] = set()
+        for keyword in self._pattern.findall(text.lower()):
+            found |= self._implied[keyword]
+
+        matched = sorted(found, key=self._order.__getitem__)
+        result = {'all': matched}
+        for name, keywords in self.categories.items():
+            result[name] = [kw for kw in matched if kw in keywords]
+        return result
+
+
 class ArxivAGICollector:
     """
     Specialized arXiv collector for AGI/ASI research papers
@@ -123,16 +231,65 @@ class ArxivAGICollector:
         'stat.ML',  # Machine Learning (Statistics)
     ]
 
-    def __init__(self, config: Optional[Dict] = None):
+    def __init__(self, config: Optional[Dict] = None, transport: Optional[HttpTransport] = None):
         """
         Initialize the arXiv AGI collector
 
         Args:
-            config: Configuration dictionary
+            config: Configuration dictionary. Optional keys:
+                page_size (default 100), delay_seconds (default 3, arXiv's
+                minimum spacing between requests), num_retries (default 3),
+                retry_attempts (default 2), retry_delay (default 3),
+                circuit_breakers (see CircuitBreakerRegistry.from_config),
+                http (see HttpTransport.from_config) and
+                harvest_state_path (SQLite file enabling incremental harvesting)
+            transport: Shared HTTP transport (created from config if omitted)
         """
         self.config = config or {}
-        self.client = arxiv.Client()
+        self.transport = transport or HttpTransport.from_config(self.config)
+        self.page_size = int(self.config.get('page_size', 100))
+
+        # The client spaces every request it sends, page fetches and its own
+        # retries alike, by delay_seconds. It is not thread-safe, so all
+        # searches share one worker thread; the event loop stays free while
+        # they queue. Searches deliberately do not run concurrently: arXiv
+        # asks for at most one request every 3 seconds, which a worker pool
+        # could only honour by serializing them again.
+        self.client = arxiv.Client(
+            page_size=self.page_size,
+            delay_seconds=max(3.0, float(self.config.get('delay_seconds', 3))),
+            num_retries=int(self.config.get('num_retries', 3))
+        )
+        # arxiv.Client has no session argument; its private session (arxiv
+        # 2.1, pinned in requirements.txt) is replaced by the pooled one
+        if hasattr(self.client, '_session'):
+            self.client._session = self.transport.session('arxiv')
+        else:
+            logger.warning("arxiv.Client has no _session attribute; arXiv requests use the client's own session")
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="arxiv")
+        # Searches that still fail after the client's own retries back off
+        # on the event loop, without holding a worker thread
+        self.retrier = Retrier(
+            RetryPolicy(
+                max_attempts=int(self.config.get('retry_attempts', 2)),
+                base_delay=self.config.get('retry_delay', 3),
+                deadline=self.config.get('retry_deadline', 120)
+            ),
+            name="arXiv search"
+        )
+        self.breakers = CircuitBreakerRegistry.from_config(self.config)
+
+        state_path = self.config.get('harvest_state_path')
+        self.harvest_state = HarvestState(state_path) if state_path else None
         self.keywords = AGIKeywords()
+        self.matcher = AGIKeywordMatcher({
+            'core_agi': AGIKeywords.CORE_AGI,
+            'capabilities': AGIKeywords.CAPABILITIES,
+            'reasoning': AGIKeywords.REASONING,
+            'architectures': AGIKeywords.ARCHITECTURES,
+            'alignment_safety': AGIKeywords.ALIGNMENT_SAFETY,
+            'emergence': AGIKeywords.EMERGENCE,
+        })
         self.logger = logging.getLogger(__name__)
 
     async def collect(
@@ -170,26 +327,10 @@ class ArxivAGICollector:
         query = f'({keyword_query}) AND ({category_query})'
 
         # Calculate date range
-        from_date = datetime.now() - timedelta(days=days_back)
+        from_date = datetime.now(timezone.utc) - timedelta(days=days_back)
 
         try:
-            # Perform search
-            search = arxiv.Search(
-                query=query,
-                max_results=max_results,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending
-            )
-
-            papers = []
-            for result in self.client.results(search):
-                # Filter by date
-                if result.published.replace(tzinfo=None) < from_date:
-                    continue
-
-                paper = self._process_paper(result)
-                if paper:
-                    papers.append(paper)
+            papers = await self._search(query, max_results, from_date)
 
             self.logger.info(f"Collected {len(papers)} papers from arXiv")
             return papers
@@ -198,6 +339,80 @@ class ArxivAGICollector:
             self.logger.error(f"Error collecting from arXiv: {e}")
             raise
 
+    async def _search(self, query: str, max_results: int, from_date: datetime) -> List[Dict]:
+        """
+        Run an arXiv search on the collector's worker thread
+
+        The blocking arxiv client runs off the event loop; concurrent
+        searches queue for the single worker so arXiv sees one request at a
+        time, spaced by the client's delay. While the
+        arXiv circuit is open, stored papers of the query are returned
+        (or none without a harvest state).
+
+        Args:
+            query: arXiv query string
+            max_results: Maximum number of results
+            from_date: Oldest publication date to keep
+
+        Returns:
+            List of paper dictionaries, newest first
+        """
+        search = arxiv.Search(
+            query=query,
+            max_results=max_results,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending
+        )
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await self.breakers.get('arxiv').call_async(
+                self.retrier.call_async,
+                loop.run_in_executor, self._executor, self._fetch_papers, search, from_date
+            )
+        except CircuitOpenError as e:
+            papers = self.harvest_state.stored(query, from_date)[:max_results] if self.harvest_state else []
+            self.logger.info(f"Skipping arXiv search ({e}); {len(papers)} stored papers served")
+            return papers
+
+    def _fetch_papers(self, search: arxiv.Search, from_date: datetime) -> List[Dict]:
+        """
+        Page through search results (blocking, runs in a worker thread)
+
+        With a harvest state store, paging stops at the first paper an
+        earlier run already stored and the stored papers are merged in.
+
+        Args:
+            search: arXiv search
+            from_date: Oldest publication date to keep
+
+        Returns:
+            List of paper dictionaries
+        """
+        return harvest(
+            self.client.results(search),
+            cutoff=from_date,
+            limit=search.max_results,
+            identify=lambda result: (self._paper_id(result), result.published),
+            convert=self._process_paper,
+            state=self.harvest_state,
+            query=search.query
+        )
+
+    @staticmethod
+    def _paper_id(result: arxiv.Result) -> str:
+        """
+        Get the arXiv ID of a result without its version suffix
+
+        Args:
+            result: arXiv search result
+
+        Returns:
+            Paper ID (e.g. '2301.12345')
+        """
+        # Remove version suffix: 2301.12345v1 -> 2301.12345
+        return result.entry_id.split('/')[-1].split('v')[0]
+
     def _process_paper(self, result: arxiv.Result) -> Dict:
         """
         Process arXiv result into standardized paper format
@@ -209,11 +424,7 @@ class ArxivAGICollector:
             Paper dictionary
         """
         try:
-            # Extract paper ID (remove version suffix like 'v1', 'v2', etc.)
-            paper_id = result.entry_id.split('/')[-1]
-            # Remove version suffix: 2301.12345v1 -> 2301.12345
-            if 'v' in paper_id:
-                paper_id = paper_id.split('v')[0]
+            paper_id = self._paper_id(result)
 
             # Calculate AGI relevance indicators
             agi_indicators = self._calculate_agi_indicators(
@@ -271,26 +482,18 @@ class ArxivAGICollector:
         Returns:
             Dictionary with AGI indicators
         """
-        text = f"{title} {abstract}".lower()
-
-        # Count keyword matches
-        keyword_matches = []
-        for keyword in self.keywords.get_all_keywords():
-            if keyword.lower() in text:
-                keyword_matches.append(keyword)
+        # Single pass over the text finds every keyword and its categories
+        matches = self.matcher.match(f"{title} {abstract}")
+        keyword_matches = matches['all']
 
         # Calculate base score
         score = len(keyword_matches) * 0.1
 
         # Boost for core AGI keywords
-        for core_keyword in self.keywords.CORE_AGI:
-            if core_keyword.lower() in text:
-                score += 0.5
+        score += 0.5 * len(matches['core_agi'])
 
         # Boost for alignment/safety keywords
-        for safety_keyword in self.keywords.ALIGNMENT_SAFETY:
-            if safety_keyword.lower() in text:
-                score += 0.3
+        score += 0.3 * len(matches['alignment_safety'])
 
         # Boost for specific categories
         if 'cs.AI' in categories:
@@ -355,37 +558,28 @@ class ArxivAGICollector:
         Returns:
             List of paper dictionaries
         """
-        all_papers = []
+        from_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+
+        # Author queries are independent; they queue for the arXiv worker
+        results = await asyncio.gather(
+            *(
+                self._search(f'au:"{author}"', max_results_per_author, from_date)
+                for author in authors
+            ),
+            return_exceptions=True
+        )
 
-        for author in authors:
-            try:
-                query = f'au:"{author}"'
-
-                search = arxiv.Search(
-                    query=query,
-                    max_results=max_results_per_author,
-                    sort_by=arxiv.SortCriterion.SubmittedDate,
-                    sort_order=arxiv.SortOrder.Descending
-                )
-
-                author_papers = []
-                from_date = datetime.now() - timedelta(days=days_back)
-
-                for result in self.client.results(search):
-                    if result.published.replace(tzinfo=None) >= from_date:
-                        paper = self._process_paper(result)
-                        if paper:
-                            author_papers.append(paper)
-
-                all_papers.extend(author_papers)
-                self.logger.info(
-                    f"Collected {len(author_papers)} papers from author: {author}"
-                )
-
-            except Exception as e:
-                self.logger.error(f"Error collecting papers for author {author}: {e}")
+        all_papers = []
+        for author, author_papers in zip(authors, results):
+            if isinstance(author_papers, Exception):
+                self.logger.error(f"Error collecting papers for author {author}: {author_papers}")
                 continue
 
+            all_papers.extend(author_papers)
+            self.logger.info(
+                f"Collected {len(author_papers)} papers from author: {author}"
+            )
+
         return all_papers
 
     async def collect_by_category(
@@ -406,25 +600,11 @@ class ArxivAGICollector:
             List of paper dictionaries
         """
         try:
-            query = f'cat:{category}'
-
-            search = arxiv.Search(
-                query=query,
-                max_results=max_results,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending
-            )
+            from_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+            results = await self._search(f'cat:{category}', max_results, from_date)
 
-            papers = []
-            from_date = datetime.now() - timedelta(days=days_back)
-
-            for result in self.client.results(search):
-                if result.published.replace(tzinfo=None) >= from_date:
-                    paper = self._process_paper(result)
-                    if paper:
-                        # Only include if it has AGI relevance
-                        if paper['agi_indicator_score'] > 1.0:
-                            papers.append(paper)
+            # Only include if it has AGI relevance
+            papers = [paper for paper in results if paper['agi_indicator_score'] > 1.0]
 
             self.logger.info(
                 f"Collected {len(papers)} AGI-relevant papers from category {category}"
@@ -434,3 +614,47 @@ class ArxivAGICollector:
         except Exception as e:
             self.logger.error(f"Error collecting from category {category}: {e}")
             raise
+
+    async def collect_by_categories(
+        self,
+        categories: List[str],
+        max_results: int = 50,
+        days_back: int = 7
+    ) -> List[Dict]:
+        """
+        Collect AGI-relevant papers from several categories concurrently
+
+        Papers listed in more than one category are returned once.
+
+        Args:
+            categories: arXiv categories (defaults to RELEVANT_CATEGORIES when empty)
+            max_results: Maximum results per category
+            days_back: How many days back to search
+
+        Returns:
+            List of paper dictionaries
+        """
+        categories = categories or self.RELEVANT_CATEGORIES
+        results = await asyncio.gather(
+            *(self.collect_by_category(cat, max_results, days_back) for cat in categories),
+            return_exceptions=True
+        )
+
+        papers = {}
+        for category, category_papers in zip(categories, results):
+            if isinstance(category_papers, Exception):
+                continue
+            for paper in category_papers:
+                papers.setdefault(paper['paper_id'], paper)
+
+        return list(papers.values())
+
+    def close(self):
+        """Release the worker thread used for arXiv requests"""
+        self._executor.shutdown(wait=True)
+
+    def __del__(self):
+        # Collectors that were never closed must not keep the worker alive
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
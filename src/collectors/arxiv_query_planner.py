@@ -0,0 +1,182 @@
+"""Batch many small arXiv searches into a few combined queries."""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.utils.config_loader import ConfigLoader
+
+
+@dataclass
+class PaperRequest:
+    """One logical paper search, e.g. for a competition or a category.
+
+    Attributes:
+        key: Identifier the routed papers are returned under
+        terms: Words that must all appear in a paper's title or summary
+        categories: arXiv categories, at least one of which a paper must have
+        limit: Number of papers wanted
+    """
+
+    key: Any
+    terms: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    limit: int = 3
+
+    @property
+    def clause(self) -> str:
+        """arXiv query clause selecting this request's papers."""
+        parts = [f"all:{term}" for term in self.terms]
+        if self.categories:
+            cats = " OR ".join(f"cat:{cat}" for cat in self.categories)
+            parts.append(f"({cats})" if len(self.categories) > 1 else cats)
+        return " AND ".join(parts)
+
+    def matches(self, paper: Dict[str, Any]) -> bool:
+        """Check whether a paper satisfies this request.
+
+        Args:
+            paper: Paper dictionary with title, summary and categories
+
+        Returns:
+            True if the paper should be routed to this request
+        """
+        if self.categories and not set(self.categories) & set(paper.get('categories') or []):
+            return False
+        if self.terms:
+            text = f"{paper.get('title', '')} {paper.get('summary', '')}".lower()
+            return all(term in text for term in self.terms)
+        return True
+
+
+class ArxivQueryPlanner:
+    """Plan combined OR queries for a set of paper requests.
+
+    Requests are grouped into batches of at most `max_clauses` clauses; each
+    batch is sent as one query whose results are routed back to the requests
+    they satisfy on the client side.
+    """
+
+    def __init__(self, max_clauses: int = 8, overfetch: int = 5, max_fetch: int = 100):
+        """Initialize query planner.
+
+        Args:
+            max_clauses: Maximum number of request clauses per combined query
+            overfetch: Results fetched per wanted paper, so each request can
+                still be filled after routing
+            max_fetch: Upper bound on results fetched for one combined query
+        """
+        self.max_clauses = max(1, int(max_clauses))
+        self.overfetch = max(1, int(overfetch))
+        self.max_fetch = max(1, int(max_fetch))
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> "ArxivQueryPlanner":
+        """Create a planner from the research.query_planner config section.
+
+        Args:
+            config: Configuration loader instance
+
+        Returns:
+            ArxivQueryPlanner
+        """
+        settings = config.get('research.query_planner', {})
+        if not isinstance(settings, dict):
+            settings = {}
+        return cls(
+            max_clauses=settings.get('max_clauses', 8),
+            overfetch=settings.get('overfetch', 5),
+            max_fetch=settings.get('max_fetch', 100)
+        )
+
+    def plan(self, requests: List[PaperRequest]) -> List[List[PaperRequest]]:
+        """Group requests into batches that share one query.
+
+        Identical clauses are only sent once.
+
+        Args:
+            requests: Paper requests
+
+        Returns:
+            List of batches
+        """
+        batches: List[List[PaperRequest]] = []
+        clauses: List[set] = []
+        for request in requests:
+            if not request.clause:
+                continue
+            for batch, batch_clauses in zip(batches, clauses):
+                if request.clause in batch_clauses or len(batch_clauses) < self.max_clauses:
+                    batch.append(request)
+                    batch_clauses.add(request.clause)
+                    break
+            else:
+                batches.append([request])
+                clauses.append({request.clause})
+        return batches
+
+    @staticmethod
+    def combined_query(batch: List[PaperRequest]) -> str:
+        """Build the OR query for a batch.
+
+        Args:
+            batch: Requests in the batch
+
+        Returns:
+            arXiv query string
+        """
+        unique = list(dict.fromkeys(request.clause for request in batch))
+        if len(unique) == 1:
+            return unique[0]
+        return " OR ".join(f"({clause})" for clause in unique)
+
+    @staticmethod
+    def clauses(batch: List[PaperRequest]) -> Dict[str, Tuple[int, Callable[[Dict[str, Any]], bool]]]:
+        """Harvest keys of a batch's combined query.
+
+        Harvest marks are kept per clause, so they stay valid when the same
+        clause is batched with different ones on a later run.
+
+        Args:
+            batch: Requests in the batch
+
+        Returns:
+            Dictionary mapping each distinct clause to the number of papers
+            its requests want and a predicate selecting its papers
+        """
+        clauses: Dict[str, Tuple[int, Callable[[Dict[str, Any]], bool]]] = {}
+        for request in batch:
+            wanted = clauses.get(request.clause, (0, None))[0]
+            clauses[request.clause] = (max(wanted, request.limit), request.matches)
+        return clauses
+
+    def fetch_size(self, batch: List[PaperRequest]) -> int:
+        """Number of results to fetch for a batch.
+
+        Args:
+            batch: Requests in the batch
+
+        Returns:
+            Result count
+        """
+        return min(sum(request.limit for request in batch) * self.overfetch, self.max_fetch)
+
+    @staticmethod
+    def route(papers: List[Dict[str, Any]], batch: List[PaperRequest]) -> Dict[Any, List[Dict[str, Any]]]:
+        """Route a batch's results back to the requests they satisfy.
+
+        A paper can satisfy several requests. Each request keeps its first
+        `limit` matches in result order.
+
+        Args:
+            papers: Papers returned for the combined query
+            batch: Requests in the batch
+
+        Returns:
+            Dictionary mapping request key to its papers
+        """
+        routed: Dict[Any, List[Dict[str, Any]]] = {request.key: [] for request in batch}
+        for paper in papers:
+            for request in batch:
+                selected = routed[request.key]
+                if len(selected) < request.limit and request.matches(paper):
+                    selected.append(paper)
+        return routed
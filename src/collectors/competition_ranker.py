@@ -0,0 +1,306 @@
+"""Vectorized competition ranking."""
+import math
+import re
+from typing import List, Dict, Any
+
+import numpy as np
+import pandas as pd
+
+from src.utils.config_loader import ConfigLoader
+
+
+class CompetitionRanker:
+    """Score competitions in one vectorized pass over a feature matrix.
+
+    The feature matrix holds prize value, team count, complexity indicator
+    hits and industry hits for every competition. Scores use the same
+    formula as the original per-competition ranking:
+
+        score = min(prize / 100000, 1) * w_prize
+              + min(teams / 5000, 1) * w_participants
+              + min(indicator_hits / n_indicators, 1) * w_complexity
+              + min(industry_hits / n_industries, 1) * w_industry
+    """
+
+    FEATURES = ['prize_value', 'team_count', 'indicator_hits', 'industry_hits']
+
+    # Lower bounds of each complexity level, highest first
+    COMPLEXITY_LEVELS = [
+        (0.7, "Very Complex"),
+        (0.5, "Complex"),
+        (0.3, "Moderate"),
+    ]
+
+    def __init__(
+        self,
+        weights: Dict[str, float],
+        complexity_indicators: List[str],
+        industries: List[str]
+    ):
+        """Initialize ranker.
+
+        Args:
+            weights: Ranking weights (prize_money, participants, complexity, industry_relevance)
+            complexity_indicators: Keywords indicating a complex competition
+            industries: Industry keywords
+        """
+        self.weights = weights
+        self.complexity_indicators = [str(i).lower() for i in complexity_indicators]
+        self.industries = [str(i).lower() for i in industries]
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> "CompetitionRanker":
+        """Create a ranker from the competition_selection config section.
+
+        Args:
+            config: Configuration loader instance
+
+        Returns:
+            CompetitionRanker
+        """
+        weights = config.get('competition_selection.ranking_weights', {})
+        indicators = config.get('competition_selection.complexity_indicators', [])
+        industries = config.get('competition_selection.industries', [])
+
+        return cls(
+            weights=weights if isinstance(weights, dict) else {},
+            complexity_indicators=indicators if isinstance(indicators, list) else [],
+            industries=industries if isinstance(industries, list) else []
+        )
+
+    def build_features(self, frame: pd.DataFrame) -> np.ndarray:
+        """Build the feature matrix for a frame of competitions.
+
+        Args:
+            frame: DataFrame with title, description, reward, teamCount and tags columns
+
+        Returns:
+            Array of shape (n_competitions, 4) ordered as FEATURES
+        """
+        n = len(frame)
+
+        def column(name: str, default: Any) -> pd.Series:
+            if name in frame.columns:
+                return frame[name]
+            return pd.Series([default] * n, index=frame.index, dtype=object)
+
+        # Prize: strip currency formatting in bulk; unparseable rewards (e.g. 'Kudos') are 0
+        rewards = column('reward', '').fillna('').astype(str)
+        cleaned = (
+            rewards.str.replace('$', '', regex=False)
+            .str.replace(',', '', regex=False)
+            .str.replace('USD', '', regex=False)
+            .str.strip()
+        )
+        prize = pd.to_numeric(cleaned, errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+        teams = pd.to_numeric(column('teamCount', 0), errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+        text = (
+            column('title', '').fillna('').astype(str) + ' ' +
+            column('description', '').fillna('').astype(str)
+        ).tolist()
+        tags = column('tags', None).map(
+            lambda t: ' '.join(str(tag) for tag in t) if isinstance(t, (list, tuple)) else ''
+        ).tolist()
+
+        text_hits = self._keyword_hits(text, self.complexity_indicators + self.industries)
+        tag_hits = self._keyword_hits(tags, self.complexity_indicators)
+
+        n_indicators = len(self.complexity_indicators)
+        indicator_hits = (text_hits[:, :n_indicators] | tag_hits).sum(axis=1).astype(np.float64)
+        industry_hits = text_hits[:, n_indicators:].sum(axis=1).astype(np.float64)
+
+        return np.column_stack([prize, teams, indicator_hits, industry_hits])
+
+    @staticmethod
+    def _keyword_hits(texts: List[str], keywords: List[str]) -> np.ndarray:
+        """Find which texts contain each keyword (case-insensitive substring).
+
+        All texts are joined into one NUL-separated buffer and scanned once
+        per keyword; match offsets are mapped back to rows with a binary
+        search, so the cost scales with the number of matches rather than
+        the number of rows.
+
+        Args:
+            texts: Texts to search
+            keywords: Lowercase keywords
+
+        Returns:
+            Boolean array of shape (len(texts), len(keywords))
+        """
+        hits = np.zeros((len(texts), len(keywords)), dtype=bool)
+        if not texts or not keywords:
+            return hits
+
+        # Lowercase per text so offsets stay aligned when case mapping changes length
+        texts = [t.lower() for t in texts]
+        lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=len(texts))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        buffer = '\x00'.join(texts)
+
+        for j, keyword in enumerate(keywords):
+            if not keyword:
+                hits[:, j] = True
+                continue
+            positions = np.fromiter(
+                (m.start() for m in re.finditer(re.escape(keyword), buffer)),
+                dtype=np.int64
+            )
+            if len(positions):
+                hits[np.searchsorted(starts, positions, side='right') - 1, j] = True
+
+        return hits
+
+    def features_one(self, comp: Dict[str, Any]) -> List[float]:
+        """Build the feature vector of one competition without a DataFrame.
+
+        Matches build_features for a single row.
+
+        Args:
+            comp: Competition dictionary
+
+        Returns:
+            Features ordered as FEATURES
+        """
+        reward = str(comp.get('reward') or '')
+        cleaned = reward.replace('$', '').replace(',', '').replace('USD', '').strip()
+        try:
+            prize = float(cleaned)
+        except ValueError:
+            prize = 0.0
+
+        try:
+            teams = float(comp.get('teamCount') or 0)
+        except (TypeError, ValueError):
+            teams = 0.0
+
+        text = f"{comp.get('title') or ''} {comp.get('description') or ''}".lower()
+        tags = comp.get('tags')
+        tags = ' '.join(str(tag) for tag in tags).lower() if isinstance(tags, (list, tuple)) else ''
+
+        indicator_hits = sum(1 for keyword in self.complexity_indicators if keyword in text or keyword in tags)
+        industry_hits = sum(1 for keyword in self.industries if keyword in text)
+
+        return [
+            0.0 if math.isnan(prize) else prize,
+            0.0 if math.isnan(teams) else teams,
+            float(indicator_hits),
+            float(industry_hits),
+        ]
+
+    def score_one(self, comp: Dict[str, Any]) -> Dict[str, Any]:
+        """Score a single competition.
+
+        Args:
+            comp: Competition dictionary
+
+        Returns:
+            Dictionary with prize_value, complexity_score, industry_score,
+            ranking_score and complexity_level
+        """
+        scores = {
+            name: float(values[0])
+            for name, values in self.score_features(np.array([self.features_one(comp)])).items()
+        }
+        scores['complexity_level'] = next(
+            (label for bound, label in self.COMPLEXITY_LEVELS if scores['complexity_score'] >= bound),
+            "Beginner-Friendly"
+        )
+        return scores
+
+    def score_features(self, features: np.ndarray) -> Dict[str, np.ndarray]:
+        """Compute scores from a feature matrix.
+
+        Args:
+            features: Matrix from build_features
+
+        Returns:
+            Dictionary of per-competition arrays: prize_value, complexity_score,
+            industry_score, ranking_score
+        """
+        prize, teams, indicator_hits, industry_hits = features.T
+        w = self.weights
+
+        if self.complexity_indicators:
+            complexity = np.minimum(indicator_hits / len(self.complexity_indicators), 1.0)
+        else:
+            complexity = np.full(len(features), 0.5)
+
+        if self.industries:
+            industry = np.minimum(industry_hits / len(self.industries), 1.0)
+        else:
+            industry = np.full(len(features), 0.5)
+
+        ranking_score = (
+            np.minimum(prize / 100000, 1.0) * w.get('prize_money', 0.3) +
+            np.minimum(teams / 5000, 1.0) * w.get('participants', 0.25) +
+            complexity * w.get('complexity', 0.25) +
+            industry * w.get('industry_relevance', 0.2)
+        )
+
+        return {
+            'prize_value': prize,
+            'complexity_score': complexity,
+            'industry_score': industry,
+            'ranking_score': ranking_score,
+        }
+
+    def complexity_levels(self, complexity: np.ndarray) -> np.ndarray:
+        """Map complexity scores to human-readable levels.
+
+        Args:
+            complexity: Complexity scores (0-1)
+
+        Returns:
+            Array of level labels
+        """
+        conditions = [complexity >= bound for bound, _ in self.COMPLEXITY_LEVELS]
+        labels = [label for _, label in self.COMPLEXITY_LEVELS]
+        return np.select(conditions, labels, default="Beginner-Friendly")
+
+    def score_frame(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Score a frame of competitions, e.g. a full historical catalog.
+
+        Args:
+            frame: DataFrame of competitions
+
+        Returns:
+            DataFrame (same index) with prize_value, complexity_score,
+            industry_score, ranking_score and complexity_level columns
+        """
+        scores = self.score_features(self.build_features(frame))
+        result = pd.DataFrame(scores, index=frame.index)
+        result['complexity_level'] = self.complexity_levels(scores['complexity_score'])
+        return result
+
+    def rank(self, competitions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Annotate and sort competitions by ranking score.
+
+        Each dictionary gains ranking_score, prize_value and complexity_level.
+        Ties keep their input order.
+
+        Args:
+            competitions: List of competition dictionaries
+
+        Returns:
+            Competitions sorted by descending score
+        """
+        if not competitions:
+            return []
+
+        scored = self.score_frame(pd.DataFrame.from_records(competitions))
+        ranking_score = scored['ranking_score'].to_numpy()
+
+        for comp, score, prize, level in zip(
+            competitions,
+            ranking_score,
+            scored['prize_value'].to_numpy(),
+            scored['complexity_level'].to_numpy()
+        ):
+            comp['ranking_score'] = float(score)
+            comp['prize_value'] = float(prize)
+            comp['complexity_level'] = str(level)
+
+        order = np.argsort(-ranking_score, kind='stable')
+        return [competitions[i] for i in order]
@@ -1,8 +1,12 @@
 """GitHub repository collector."""
 import os
-from typing import List, Dict, Any
-from github import Github, GithubException
+from typing import List, Dict, Any, Optional
 
+from src.collectors.github_search import GitHubSearchClient, RateLimitBudget
+from src.collectors.repo_store import RepoStore
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.disk_cache import DiskCache
+from src.utils.http_transport import HttpTransport
 from src.utils.logger import setup_logger
 from src.utils.config_loader import ConfigLoader
 
@@ -13,22 +17,42 @@ logger = setup_logger("github_collector")
 class GitHubCollector:
     """Collect relevant GitHub repositories."""
 
-    def __init__(self, config: ConfigLoader):
+    def __init__(self, config: ConfigLoader, transport: Optional[HttpTransport] = None):
         """Initialize GitHub collector.
 
         Args:
             config: Configuration loader instance
+            transport: Shared HTTP transport (created from config if omitted)
         """
         self.config = config
+        self.transport = transport or HttpTransport.from_config(config)
         github_token = config.get_env('GITHUB_TOKEN')
 
         if github_token:
-            self.github = Github(github_token)
             logger.info("GitHub API authenticated with token")
         else:
-            self.github = Github()
             logger.warning("GitHub API initialized without token (rate limits apply)")
 
+        # Repository metadata and star history kept across runs
+        self.repo_store = RepoStore.from_config(config)
+        self.breakers = CircuitBreakerRegistry.from_config(config)
+
+        # Batched GraphQL search (token required) with conditional REST fallback
+        self.search_client = GitHubSearchClient(
+            token=github_token,
+            session=self.transport.session('github'),
+            etag_cache=DiskCache.from_config(config, 'github'),
+            use_graphql=config.get('github.use_graphql', True) is not False,
+            budget=RateLimitBudget(max_wait=self._number('github.max_rate_limit_wait', 120)),
+            repo_store=self.repo_store,
+            breakers=self.breakers
+        )
+
+    def _number(self, key: str, default: float) -> float:
+        """Read a numeric setting, falling back to the default."""
+        value = self.config.get(key, default)
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
     def search_repositories_by_algorithms(
         self,
         competition_name: str,
@@ -43,83 +67,69 @@ class GitHubCollector:
         Returns:
             List of repository dictionaries
         """
+        return self.search_repositories_for_competitions([competition_name], algorithms)[competition_name]
+
+    def search_repositories_for_competitions(
+        self,
+        competition_names: List[str],
+        algorithms: List[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search repositories for several competitions in one batch.
+
+        Every competition/algorithm search is sent together (one GraphQL
+        request when a token is available). Searches are ordered by
+        competition, so when the rate-limit budget runs short the
+        highest-ranked competitions (first in the list) are served first.
+
+        Args:
+            competition_names: Names of the competitions, highest-ranked first
+            algorithms: List of algorithms to search for
+
+        Returns:
+            Dictionary mapping competition name to its repository dictionaries
+        """
         if algorithms is None:
             algorithms = self.config.get('github.search_algorithms', [])
 
         max_repos = self.config.get('github.max_repos_per_competition', 5)
         min_stars = self.config.get('github.min_stars', 10)
-
-        logger.info(f"Searching repositories for {competition_name}...")
-
-        all_repos = []
-        seen_repos = set()
-
-        # Search for each algorithm
-        for algorithm in algorithms[:3]:  # Limit to avoid rate limits
-            try:
-                query = f"{competition_name} {algorithm} kaggle"
-                logger.debug(f"Searching: {query}")
-
-                repos = self.github.search_repositories(
-                    query=query,
-                    sort='stars',
-                    order='desc'
-                )
-
-                # Get top results
-                repo_count = 0
-                for repo in repos:
-                    if repo_count >= 5:  # Limit per algorithm
-                        break
-
-                    try:
-                        if repo.full_name in seen_repos:
-                            continue
-
-                        stars = repo.stargazers_count if hasattr(repo, 'stargazers_count') else 0
-                        if stars >= min_stars:
-                            repo_dict = {
-                                'name': repo.name if hasattr(repo, 'name') else 'Unknown',
-                                'full_name': repo.full_name if hasattr(repo, 'full_name') else 'Unknown',
-                                'url': repo.html_url if hasattr(repo, 'html_url') else '',
-                                'description': repo.description if hasattr(repo, 'description') and repo.description else 'No description',
-                                'stars': stars,
-                                'language': repo.language if hasattr(repo, 'language') and repo.language else 'Unknown',
-                                'updated_at': repo.updated_at.isoformat() if hasattr(repo, 'updated_at') and repo.updated_at else None,
-                                'algorithm': algorithm
-                            }
-                            all_repos.append(repo_dict)
-                            seen_repos.add(repo.full_name)
-                            repo_count += 1
-
-                            if len(all_repos) >= max_repos:
-                                break
-                    except Exception as repo_error:
-                        logger.debug(f"Error processing repository: {repo_error}")
-                        continue
-
-            except GithubException as e:
-                logger.warning(f"GitHub API error for '{algorithm}': {e.status if hasattr(e, 'status') else 'unknown'} - {e}")
-                continue
-            except Exception as e:
-                logger.warning(f"Unexpected error searching for '{algorithm}': {type(e).__name__}: {e}")
-                continue
-
-            if len(all_repos) >= max_repos:
-                break
-
-        # Sort by stars
-        if all_repos:
-            all_repos.sort(key=lambda x: x.get('stars', 0), reverse=True)
-            logger.info(f"Found {len(all_repos)} relevant repositories")
-        else:
-            logger.info(f"No repositories found for {competition_name}")
-
-        return all_repos[:max_repos]
+        per_query = int(self._number('github.results_per_query', 10))
+
+        logger.info(f"Searching repositories for {len(competition_names)} competitions...")
+
+        searches = [(name, algorithm) for name in competition_names for algorithm in algorithms]
+        queries = [f"{name} {algorithm} kaggle" for name, algorithm in searches]
+        results = self.search_client.search(queries, per_query=per_query)
+
+        found: Dict[str, Dict[str, Dict[str, Any]]] = {name: {} for name in competition_names}
+        for (name, algorithm), repos in zip(searches, results):
+            for repo in repos:
+                # A repository found by several algorithms keeps the first one
+                if repo['stars'] >= min_stars and repo['full_name'] not in found[name]:
+                    found[name][repo['full_name']] = {**repo, 'algorithm': algorithm}
+
+        selected = {}
+        for name, repos in found.items():
+            # Most-starred repositories across all algorithms
+            all_repos = sorted(repos.values(), key=lambda x: x.get('stars', 0), reverse=True)
+            if all_repos:
+                logger.info(f"Found {len(all_repos)} relevant repositories for {name}")
+            else:
+                logger.info(f"No repositories found for {name}")
+            selected[name] = all_repos[:max_repos]
+
+        logger.debug(
+            f"GitHub searches used {self.search_client.request_count} requests so far; "
+            f"search budget left: {self.search_client.budget.remaining('search')}"
+        )
+        return selected
 
     def get_trending_ml_repos(self, days: int = 7) -> List[Dict[str, Any]]:
         """Get trending machine learning repositories.
 
+        Repositories are ranked by the stars they gained over the last days
+        (from the local star history), then by total stars.
+
         Args:
             days: Number of days to look back
 
@@ -128,30 +138,15 @@ class GitHubCollector:
         """
         logger.info("Fetching trending ML repositories...")
 
-        try:
-            # Search for recent ML repos
-            query = "machine learning kaggle stars:>50"
-            repos = self.github.search_repositories(
-                query=query,
-                sort='stars',
-                order='desc'
-            )
-
-            trending = []
-            for repo in repos[:10]:
-                repo_dict = {
-                    'name': repo.name,
-                    'full_name': repo.full_name,
-                    'url': repo.html_url,
-                    'description': repo.description or 'No description',
-                    'stars': repo.stargazers_count,
-                    'language': repo.language or 'Unknown',
-                }
-                trending.append(repo_dict)
-
-            logger.info(f"Found {len(trending)} trending repositories")
-            return trending
-
-        except GithubException as e:
-            logger.error(f"Error fetching trending repos: {e}")
-            return []
+        # Search for recent ML repos
+        query = "machine learning kaggle stars:>50"
+        trending = self.search_client.search([query], per_query=10)[0]
+
+        if self.repo_store:
+            gained = self.repo_store.star_deltas([repo['full_name'] for repo in trending], days)
+            for repo in trending:
+                repo['stars_gained'] = gained.get(repo['full_name'], 0)
+            trending.sort(key=lambda x: (x['stars_gained'], x['stars']), reverse=True)
+
+        logger.info(f"Found {len(trending)} trending repositories")
+        return trending
@@ -0,0 +1,555 @@
+"""Batched GitHub repository search over GraphQL with a conditional REST fallback."""
+import bisect
+import json
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from src.collectors.repo_store import RepoStore
+from src.utils.circuit_breaker import OPEN, CircuitBreakerRegistry, CircuitOpenError
+from src.utils.disk_cache import DiskCache
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("github_search")
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+REST_SEARCH_URL = "https://api.github.com/search/repositories"
+RATE_LIMIT_URL = "https://api.github.com/rate_limit"
+
+# Only the fields the blog renders
+REPOSITORY_FIELDS = """
+        ... on Repository {
+          name
+          nameWithOwner
+          url
+          description
+          stargazerCount
+          primaryLanguage { name }
+          updatedAt
+          pushedAt
+        }"""
+
+# With a repository store, searches only select what changes between runs;
+# the rest comes from the store unless the repository was pushed
+SEARCH_FIELDS = """
+        ... on Repository {
+          nameWithOwner
+          url
+          stargazerCount
+          updatedAt
+          pushedAt
+        }"""
+
+DETAIL_FIELDS = "nameWithOwner description primaryLanguage { name }"
+
+# Repositories per detail request
+DETAIL_BATCH = 100
+
+
+def _iso(timestamp: Optional[str]) -> Optional[str]:
+    """Normalize a GitHub timestamp ('...Z') to datetime.isoformat()."""
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).isoformat()
+    except ValueError:
+        return timestamp
+
+
+class RateLimitBudget:
+    """Shared GitHub request budget per rate-limit resource.
+
+    The budget starts from the /rate_limit endpoint (which is free) and is
+    kept current from the X-RateLimit-* headers of every response. Callers
+    acquire budget before each request; when a resource is exhausted the
+    caller sleeps until its reset time, unless that is further away than
+    `max_wait`, in which case the request is refused so lower-priority
+    work can be dropped instead.
+    """
+
+    def __init__(
+        self,
+        max_wait: float = 120,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize rate-limit budget.
+
+        Args:
+            max_wait: Longest wait for a reset, in seconds
+            clock: Wall clock returning epoch seconds (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._resources: Dict[str, Dict[str, float]] = {}
+
+    def set(self, resource: str, remaining: int, reset: float):
+        """Record the budget of a resource.
+
+        Args:
+            resource: Rate-limit resource ('core', 'search', 'graphql', ...)
+            remaining: Requests (or points) left in the window
+            reset: Epoch seconds at which the window resets
+        """
+        with self._lock:
+            self._resources[resource] = {'remaining': float(remaining), 'reset': float(reset)}
+
+    def update(self, headers: Dict[str, str], default_resource: str):
+        """Update a resource from X-RateLimit-* response headers.
+
+        Args:
+            headers: Response headers
+            default_resource: Resource assumed when the header does not name one
+        """
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = float(headers['X-RateLimit-Reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        self.set(headers.get('X-RateLimit-Resource') or default_resource, remaining, reset)
+
+    def remaining(self, resource: str) -> Optional[float]:
+        """Requests left for a resource (None if unknown)."""
+        with self._lock:
+            state = self._resources.get(resource)
+            return state['remaining'] if state else None
+
+    def acquire(self, resource: str, cost: float = 1) -> bool:
+        """Reserve budget for a request, waiting for the reset if needed.
+
+        Args:
+            resource: Rate-limit resource
+            cost: Requests (or GraphQL points) the request will use
+
+        Returns:
+            True if the request may be sent, False if it would need a
+            longer wait than max_wait
+        """
+        return self.acquire_prefix(resource, [cost]) == 1
+
+    def acquire_prefix(self, resource: str, totals: List[float]) -> int:
+        """Reserve budget for the leading items of a batched request.
+
+        The whole batch waits for the reset like `acquire`. When the reset
+        is further away than max_wait, budget is reserved for as many
+        leading (highest-priority) items as it covers.
+
+        Args:
+            resource: Rate-limit resource
+            totals: Cost of sending the first 1, 2, ... items (non-decreasing)
+
+        Returns:
+            Number of leading items that may be sent
+        """
+        if not totals:
+            return 0
+
+        while True:
+            with self._lock:
+                state = self._resources.get(resource)
+                now = self._clock()
+                if state is not None and now >= state['reset']:
+                    # A new window has started; the next response's headers say how big
+                    del self._resources[resource]
+                    state = None
+                if state is None:
+                    return len(totals)
+
+                if state['remaining'] >= totals[-1]:
+                    state['remaining'] -= totals[-1]
+                    return len(totals)
+
+                wait = state['reset'] - now + 1
+                if wait > self.max_wait:
+                    count = bisect.bisect_right(totals, state['remaining'])
+                    if count:
+                        state['remaining'] -= totals[count - 1]
+                        logger.warning(
+                            f"GitHub {resource} budget covers {count} of {len(totals)} items; "
+                            f"resets in {wait:.0f}s, skipping the rest"
+                        )
+                    else:
+                        logger.warning(
+                            f"GitHub {resource} budget exhausted; resets in {wait:.0f}s, skipping request"
+                        )
+                    return count
+
+            logger.info(f"GitHub {resource} budget exhausted, waiting {wait:.1f}s for reset")
+            self._sleep(wait)
+
+
+class GitHubSearchClient:
+    """Search GitHub repositories with as few round-trips as possible.
+
+    With a token, all searches of a batch are sent as aliased `search`
+    fields of a single GraphQL request that selects only the rendered
+    fields. Searches GraphQL cannot serve (no token, request failure or a
+    failed alias) go to the REST search API, where ETag/If-None-Match
+    revalidation returns unchanged results from the cache.
+
+    With a repository store, GraphQL searches leave out descriptions and
+    languages; those are read from the store, and fetched in one batched
+    request only for repositories that are new or were pushed since.
+
+    GraphQL ('github.graphql') and REST search ('github.search') each have
+    a circuit breaker. While GraphQL's is open searches go straight to REST;
+    while REST's is open searches are answered from the ETag cache, or
+    empty.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        etag_cache: Optional[DiskCache] = None,
+        use_graphql: bool = True,
+        timeout: float = 30,
+        budget: Optional[RateLimitBudget] = None,
+        repo_store: Optional[RepoStore] = None,
+        breakers: Optional[CircuitBreakerRegistry] = None
+    ):
+        """Initialize search client.
+
+        Args:
+            token: GitHub token (GraphQL requires one)
+            session: HTTP session to use
+            etag_cache: Cache of REST responses keyed by request, with ETags
+            use_graphql: Use GraphQL batching when a token is available
+            timeout: Request timeout in seconds
+            budget: Shared rate-limit budget
+            repo_store: Store of repository metadata and star history
+            breakers: Circuit breakers of the GitHub endpoints
+        """
+        self.token = token
+        self.session = session or requests.Session()
+        self.etag_cache = etag_cache
+        self.use_graphql = use_graphql and bool(token)
+        self.timeout = timeout
+        self.budget = budget or RateLimitBudget()
+        self.repo_store = repo_store
+        self.breakers = breakers or CircuitBreakerRegistry()
+        self.request_count = 0
+        self._budget_loaded = False
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {'Accept': 'application/vnd.github+json'}
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        return headers
+
+    def load_budget(self):
+        """Initialize the budget from the /rate_limit endpoint (once).
+
+        The endpoint does not count against any limit.
+        """
+        if self._budget_loaded:
+            return
+        self._budget_loaded = True
+
+        try:
+            response = self.session.get(RATE_LIMIT_URL, headers=self._headers(), timeout=self.timeout)
+            response.raise_for_status()
+            resources = response.json().get('resources')
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            logger.debug(f"Could not read GitHub rate limits: {e}")
+            return
+        if not isinstance(resources, dict):
+            return
+
+        for resource, state in resources.items():
+            try:
+                self.budget.set(resource, state['remaining'], state['reset'])
+            except (KeyError, TypeError):
+                continue
+        logger.debug(f"GitHub budget: search {self.budget.remaining('search')}, "
+                     f"graphql {self.budget.remaining('graphql')}")
+
+    def search(self, queries: List[str], per_query: int = 10) -> List[List[Dict[str, Any]]]:
+        """Run repository searches sorted by stars.
+
+        Queries should be given in priority order: when the rate-limit
+        budget runs out and its reset is too far away, the trailing queries
+        are skipped and get empty results.
+
+        Args:
+            queries: GitHub search queries
+            per_query: Results per query
+
+        Returns:
+            One list of repository dictionaries per query, in query order
+        """
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+        if not queries:
+            return []
+        self.load_budget()
+
+        # GraphQL charges roughly one point per 100 requested nodes. Aliases
+        # are costed one by one, so a short budget sends the leading
+        # queries and leaves the rest to REST search and its own budget.
+        graphql = self.breakers.get('github.graphql')
+        affordable = 0
+        if self.use_graphql and graphql.state != OPEN:
+            totals = [max(1, math.ceil(n * per_query / 100)) for n in range(1, len(queries) + 1)]
+            affordable = self.budget.acquire_prefix('graphql', totals)
+        if affordable:
+            try:
+                results[:affordable] = graphql.call(self._search_graphql, queries[:affordable], per_query)
+            except CircuitOpenError as e:
+                logger.debug(f"GraphQL search skipped: {e}")
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"GraphQL search failed, using REST: {type(e).__name__}: {e}")
+
+        rest = self.breakers.get('github.search')
+        for i, query in enumerate(queries):
+            if results[i] is not None:
+                continue
+            if rest.state == OPEN:
+                results[i] = self._cached_search(query, per_query)
+                continue
+            if not self.budget.acquire('search'):
+                skipped = sum(1 for r in results[i:] if r is None)
+                logger.warning(f"Skipping {skipped} lower-priority GitHub searches")
+                return [r if r is not None else [] for r in results]
+            try:
+                results[i] = rest.call(self._search_rest, query, per_query)
+            except CircuitOpenError:
+                results[i] = self._cached_search(query, per_query)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"GitHub search failed for '{query}': {type(e).__name__}: {e}")
+                results[i] = []
+
+        if rest.state == OPEN:
+            logger.warning("GitHub search is unavailable; served cached results")
+        return results
+
+    def _post_graphql(self, document: str) -> Dict[str, Any]:
+        """Send a GraphQL query and return its data.
+
+        Args:
+            document: GraphQL query document
+
+        Returns:
+            The `data` object of the response (fields that failed are None)
+        """
+        response = self.session.post(
+            GRAPHQL_URL,
+            json={'query': document},
+            headers=self._headers(),
+            timeout=self.timeout
+        )
+        self.request_count += 1
+        self.budget.update(response.headers, 'graphql')
+        response.raise_for_status()
+        payload = response.json()
+
+        for error in payload.get('errors') or []:
+            logger.debug(f"GraphQL error: {error.get('message')}")
+
+        data = payload.get('data') or {}
+        rate_limit = data.get('rateLimit') or {}
+        if rate_limit:
+            logger.debug(f"GraphQL query cost {rate_limit.get('cost')}, {rate_limit.get('remaining')} remaining")
+        return data
+
+    def _search_graphql(self, queries: List[str], per_query: int) -> List[Optional[List[Dict[str, Any]]]]:
+        """Send all searches as aliases of one GraphQL query.
+
+        Args:
+            queries: GitHub search queries
+            per_query: Results per query
+
+        Returns:
+            Repository lists per query; None where an alias failed
+        """
+        selection = SEARCH_FIELDS if self.repo_store else REPOSITORY_FIELDS
+        fields = "\n".join(
+            f"  q{i}: search(query: {json.dumps(query + ' sort:stars-desc')}, "
+            f"type: REPOSITORY, first: {int(per_query)}) {{\n"
+            f"    nodes {{{selection}\n    }}\n  }}"
+            for i, query in enumerate(queries)
+        )
+        data = self._post_graphql("query {\n" + fields + "\n  rateLimit { cost remaining }\n}")
+
+        results = []
+        for i in range(len(queries)):
+            search = data.get(f"q{i}")
+            if search is None:
+                results.append(None)
+                continue
+            results.append([
+                {
+                    'name': node.get('name') or (node.get('nameWithOwner') or 'Unknown').split('/')[-1],
+                    'full_name': node.get('nameWithOwner') or 'Unknown',
+                    'url': node.get('url') or '',
+                    'description': node.get('description') or 'No description',
+                    'stars': node.get('stargazerCount') or 0,
+                    'language': (node.get('primaryLanguage') or {}).get('name') or 'Unknown',
+                    'updated_at': _iso(node.get('updatedAt')),
+                    'pushed_at': _iso(node.get('pushedAt')),
+                }
+                for node in search.get('nodes') or []
+                if node
+            ])
+
+        if self.repo_store:
+            self._complete_from_store([repo for repos in results if repos for repo in repos])
+        return results
+
+    def _complete_from_store(self, repos: List[Dict[str, Any]]):
+        """Fill in descriptions and languages of searched repositories.
+
+        Unchanged repositories are served from the store; new and pushed
+        ones are fetched. Repositories are stored (with today's stars) only
+        once their metadata is complete, so a failed fetch is retried on
+        the next run.
+
+        Args:
+            repos: Repository dictionaries from a light search (updated in place)
+        """
+        pushed = {repo['full_name']: repo['pushed_at'] for repo in repos}
+        stale = self.repo_store.stale(pushed)
+        stale_names = set(stale)
+        details = self.repo_store.get(name for name in pushed if name not in stale_names)
+
+        fetched = {}
+        for i in range(0, len(stale), DETAIL_BATCH):
+            try:
+                fetched.update(self.breakers.get('github.graphql').call(
+                    self._fetch_details, stale[i:i + DETAIL_BATCH]
+                ))
+            except (requests.RequestException, ValueError, CircuitOpenError) as e:
+                logger.warning(f"Could not fetch repository details: {type(e).__name__}: {e}")
+                break
+        if stale:
+            logger.debug(f"Refreshed {len(fetched)} of {len(stale)} new or pushed repositories; "
+                         f"{len(details)} served from the store")
+        details.update(fetched)
+
+        complete = []
+        for repo in repos:
+            known = details.get(repo['full_name'])
+            if known is None:
+                continue
+            repo['description'] = known.get('description') or 'No description'
+            repo['language'] = known.get('language') or 'Unknown'
+            complete.append(repo)
+        self.repo_store.upsert(complete)
+
+    def _fetch_details(self, full_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch descriptions and languages of repositories in one request.
+
+        Args:
+            full_names: Repository names ('owner/name')
+
+        Returns:
+            Dictionary mapping repository name to its description and language
+        """
+        if not self.budget.acquire('graphql'):
+            return {}
+
+        fields = []
+        for i, full_name in enumerate(full_names):
+            owner, _, name = full_name.partition('/')
+            fields.append(
+                f"  r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+                f"{{ {DETAIL_FIELDS} }}"
+            )
+        data = self._post_graphql("query {\n" + "\n".join(fields) + "\n}")
+
+        details = {}
+        for i, full_name in enumerate(full_names):
+            node = data.get(f"r{i}")
+            if node is None:
+                continue
+            details[full_name] = {
+                'description': node.get('description') or 'No description',
+                'language': (node.get('primaryLanguage') or {}).get('name') or 'Unknown',
+            }
+        return details
+
+    @staticmethod
+    def _rest_request(query: str, per_query: int) -> tuple:
+        """Build the REST search parameters and their ETag cache key."""
+        params = {'q': query, 'sort': 'stars', 'order': 'desc', 'per_page': int(per_query)}
+        return params, DiskCache.make_key('github-search', params)
+
+    def _cached_search(self, query: str, per_query: int) -> List[Dict[str, Any]]:
+        """Results of the last successful REST search for a query, if cached.
+
+        Args:
+            query: GitHub search query
+            per_query: Results per query
+
+        Returns:
+            Cached repository dictionaries, or an empty list
+        """
+        if not self.etag_cache:
+            return []
+        cached = self.etag_cache.get(self._rest_request(query, per_query)[1])
+        return cached['repos'] if cached else []
+
+    def _search_rest(self, query: str, per_query: int) -> List[Dict[str, Any]]:
+        """Run one REST search, revalidating a cached response by ETag.
+
+        Args:
+            query: GitHub search query
+            per_query: Results per query
+
+        Returns:
+            List of repository dictionaries
+        """
+        params, key = self._rest_request(query, per_query)
+        cached = self.etag_cache.get(key) if self.etag_cache else None
+
+        headers = self._headers()
+        if cached:
+            headers['If-None-Match'] = cached['etag']
+
+        response = self.session.get(REST_SEARCH_URL, params=params, headers=headers, timeout=self.timeout)
+        self.request_count += 1
+        self.budget.update(response.headers, 'search')
+
+        if response.status_code in (403, 429) and self.budget.remaining('search') == 0:
+            # Budget drained by someone else (e.g. another job on the same token)
+            if not self.budget.acquire('search'):
+                return []
+            response = self.session.get(REST_SEARCH_URL, params=params, headers=headers, timeout=self.timeout)
+            self.request_count += 1
+            self.budget.update(response.headers, 'search')
+
+        if response.status_code == 304 and cached:
+            logger.debug(f"Search results unchanged for '{query}'")
+            if self.repo_store:
+                self.repo_store.upsert(cached['repos'])
+            return cached['repos']
+        response.raise_for_status()
+
+        repos = [
+            {
+                'name': item.get('name') or 'Unknown',
+                'full_name': item.get('full_name') or 'Unknown',
+                'url': item.get('html_url') or '',
+                'description': item.get('description') or 'No description',
+                'stars': item.get('stargazers_count') or 0,
+                'language': item.get('language') or 'Unknown',
+                'updated_at': _iso(item.get('updated_at')),
+                'pushed_at': _iso(item.get('pushed_at')),
+            }
+            for item in response.json().get('items', [])[:per_query]
+        ]
+        if self.repo_store:
+            self.repo_store.upsert(repos)
+
+        etag = response.headers.get('ETag')
+        if self.etag_cache and etag:
+            self.etag_cache.set(key, {'etag': etag, 'repos': repos})
+        return repos
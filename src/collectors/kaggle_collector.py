@@ -1,137 +1,358 @@
 """Kaggle competition data collector."""
 import os
 import json
-from typing import List, Dict, Any, Optional
+import operator
+import tempfile
+import threading
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional
 from kaggle.api.kaggle_api_extended import KaggleApi
 from datetime import datetime, timedelta
 import pandas as pd
 
 from src.utils.logger import setup_logger
 from src.utils.config_loader import ConfigLoader
+from src.utils.disk_cache import DiskCache
+from src.utils.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from src.utils.http_transport import HttpTransport
+from src.collectors.competition_ranker import CompetitionRanker
+from src.collectors import leaderboard_analytics, leaderboard_frame
+from src.collectors.leaderboard_store import LeaderboardStore
 
 
 logger = setup_logger("kaggle_collector")
 
 
+@dataclass
+class CompetitionSnapshot:
+    """Competition listing fetched once per run and shared by all lookups."""
+
+    competitions: List[Dict[str, Any]]
+    featured: List[Dict[str, Any]]
+    fetched_at: datetime
+
+
 class KaggleCollector:
     """Collect data from Kaggle competitions."""
 
-    def __init__(self, config: ConfigLoader):
+    def __init__(self, config: ConfigLoader, transport: Optional[HttpTransport] = None):
         """Initialize Kaggle collector.
 
         Args:
             config: Configuration loader instance
+            transport: Shared HTTP transport (created from config if omitted)
         """
         self.config = config
+        self.transport = transport or HttpTransport.from_config(config)
         self.api = KaggleApi()
         self.api.authenticate()
         logger.info("Kaggle API authenticated successfully")
 
-    def get_active_competitions(self, filter_featured=True) -> List[Dict[str, Any]]:
-        """Get list of active competitions, optionally filtered for Featured competitions.
+        # The Kaggle client keeps its own urllib3 pool; size it and add timeouts
+        rest_client = getattr(getattr(self.api, 'api_client', None), 'rest_client', None)
+        self.transport.configure_pool_manager(getattr(rest_client, 'pool_manager', None))
+
+        self.response_cache = self._create_response_cache()
+        # One circuit per API method, so e.g. private leaderboards stop being
+        # requested without blocking the competition listing
+        self.breakers = CircuitBreakerRegistry.from_config(config)
+        self.ranker = CompetitionRanker.from_config(config)
+        leaderboard_settings = config.get('data_collection.leaderboard', {})
+        self.leaderboard_settings = leaderboard_settings if isinstance(leaderboard_settings, dict) else {}
+        self.leaderboard_store = LeaderboardStore.from_config(config)
+
+        self._competition_snapshot: Optional[CompetitionSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+
+    def _create_response_cache(self) -> Optional[DiskCache]:
+        """Create the on-disk cache for Kaggle API responses.
+
+        Entries live for data_collection.kaggle.cache_duration seconds; the
+        cache is disabled when that setting is missing or not positive.
+
+        Returns:
+            DiskCache or None
+        """
+        ttl = self.config.get('data_collection.kaggle.cache_duration')
+        if not isinstance(ttl, (int, float)) or ttl <= 0:
+            return None
+
+        cache_dir = self.config.get('cache.dir', '.cache')
+        try:
+            cache = DiskCache(Path(cache_dir) / "kaggle.sqlite", ttl=ttl, max_entries=2000)
+            logger.info(f"Kaggle response cache enabled (ttl={ttl}s)")
+            return cache
+        except Exception as e:
+            logger.warning(f"Kaggle response cache unavailable: {type(e).__name__}: {e}")
+            return None
+
+    def _call_api(self, method: str, *args, **kwargs) -> Any:
+        """Call a Kaggle API method, reusing a cached response when available.
+
+        Responses are keyed by method name and arguments, so retries and
+        same-day re-runs do not repeat the network round-trip. Calls go
+        through the method's circuit breaker; while it is open they raise
+        CircuitOpenError instead of reaching the API.
 
         Args:
-            filter_featured: If True, only return Featured competitions
+            method: KaggleApi method name
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
 
         Returns:
-            List of competition dictionaries
+            API response
+        """
+        call = operator.methodcaller(method, *args, **kwargs)
+        breaker = self.breakers.get(f"kaggle.{method}")
+        if self.response_cache is None:
+            return breaker.call(call, self.api)
+
+        cache_key = DiskCache.make_key(method, args, kwargs)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Kaggle {method}{args} served from cache")
+            return cached
+
+        response = breaker.call(call, self.api)
+        if response is not None:
+            self.response_cache.set(cache_key, response)
+        return response
+
+    def get_competition_snapshot(self) -> Optional[CompetitionSnapshot]:
+        """Get the competition listing for this run, fetching it at most once.
+
+        The snapshot is shared by every caller (active and new competition
+        lookups) until invalidate_competition_snapshot() is called.
+
+        Returns:
+            CompetitionSnapshot, or None if the listing could not be fetched
+        """
+        with self._snapshot_lock:
+            if self._competition_snapshot is None:
+                self._competition_snapshot = self._fetch_competition_snapshot()
+            return self._competition_snapshot
+
+    def invalidate_competition_snapshot(self):
+        """Drop the memoized competition listing so the next lookup refetches it."""
+        with self._snapshot_lock:
+            self._competition_snapshot = None
+
+    def _fetch_competition_snapshot(self) -> Optional[CompetitionSnapshot]:
+        """Fetch and convert the competition listing.
+
+        Pages are walked lazily up to data_collection.kaggle.max_pages. The
+        snapshot always holds every listed competition, since new-competition
+        and per-competition lookups read it as well as the ranking.
+
+        Returns:
+            CompetitionSnapshot, or None on error
         """
         logger.info("Fetching active competitions...")
 
+        sort_by = self.config.get('data_collection.kaggle.listing_sort_by')
+        sort_by = sort_by if isinstance(sort_by, str) else None
+
         try:
-            competitions = self.api.competitions_list()
-
-            active_comps = []
-            for comp in competitions:
-                comp_dict = {
-                    'id': comp.id,
-                    'title': comp.title,
-                    'url': comp.url,
-                    'deadline': comp.deadline,
-                    'category': comp.category,
-                    'reward': comp.reward,
-                    'teamCount': comp.teamCount,
-                    'userHasEntered': comp.userHasEntered,
-                    'description': comp.description if hasattr(comp, 'description') else '',
-                    'tags': comp.tags if hasattr(comp, 'tags') else [],
-                    'enabledDate': comp.enabledDate if hasattr(comp, 'enabledDate') else None,
-                    'maxDailySubmissions': comp.maxDailySubmissions if hasattr(comp, 'maxDailySubmissions') else None,
-                    'maxTeamSize': comp.maxTeamSize if hasattr(comp, 'maxTeamSize') else None,
-                }
-
-                # Filter for Featured competitions if requested
-                if filter_featured:
-                    # Featured competitions have category 'featured'
-                    # Some competitions may have different categorization
-                    category = str(comp.category).lower() if hasattr(comp, 'category') else ''
-
-                    # Check if competition is featured
-                    # Kaggle uses 'featured' category for official competitions
-                    is_featured = (
-                        'featured' in category or
-                        category == 'featured' or
-                        (hasattr(comp, 'isKernelsSubmissionsOnly') and not comp.isKernelsSubmissionsOnly)
-                    )
-
-                    if is_featured:
-                        active_comps.append(comp_dict)
-                        logger.debug(f"Featured competition found: {comp_dict['title']} (category: {category})")
-                else:
-                    active_comps.append(comp_dict)
-
-            if filter_featured:
-                logger.info(f"Found {len(active_comps)} Featured competitions out of {len(competitions)} total")
-            else:
-                logger.info(f"Found {len(active_comps)} active competitions")
+            all_comps = []
+            featured_comps = []
 
-            return active_comps
+            for comp in self._iter_listing(sort_by=sort_by):
+                comp_dict = self._to_competition_dict(comp)
+                all_comps.append(comp_dict)
+
+                if self._is_featured(comp):
+                    featured_comps.append(comp_dict)
+                    logger.debug(f"Featured competition found: {comp_dict['title']} (category: {comp_dict['category']})")
+
+            return CompetitionSnapshot(
+                competitions=all_comps,
+                featured=featured_comps,
+                fetched_at=datetime.now()
+            )
 
         except Exception as e:
             logger.error(f"Error fetching competitions: {e}")
-            return []
+            return None
 
-    def rank_competitions(self, competitions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Rank competitions based on configured criteria.
+    def iter_competitions(
+        self,
+        filter_featured: bool = True,
+        sort_by: Optional[str] = None,
+        max_pages: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream competitions across every listing page.
+
+        Pages are requested only as the caller consumes the iterator, and each
+        competition is filtered before it is converted to a dictionary.
 
         Args:
-            competitions: List of competition dictionaries
+            filter_featured: If True, only yield Featured competitions
+            sort_by: Kaggle listing order (e.g. 'prize', 'recentlyCreated')
+            max_pages: Maximum pages to walk (defaults to data_collection.kaggle.max_pages)
+
+        Yields:
+            Competition dictionaries
+        """
+        for comp in self._iter_listing(sort_by=sort_by, max_pages=max_pages):
+            if filter_featured and not self._is_featured(comp):
+                continue
+            yield self._to_competition_dict(comp)
+
+    def _iter_listing(
+        self,
+        sort_by: Optional[str] = None,
+        max_pages: Optional[int] = None
+    ) -> Iterator[Any]:
+        """Walk the raw competition listing page by page.
+
+        The Kaggle API serves a fixed number of competitions per page, so a
+        page shorter than data_collection.kaggle.page_size marks the end.
+
+        Args:
+            sort_by: Kaggle listing order
+            max_pages: Maximum pages to walk
+
+        Yields:
+            Competition objects from the Kaggle API
+        """
+        page_size = self._int_setting('data_collection.kaggle.page_size', 20)
+        if max_pages is None:
+            max_pages = self._int_setting('data_collection.kaggle.max_pages', 10)
+
+        page = 1
+        while page <= max_pages:
+            kwargs = {'page': page}
+            if sort_by:
+                kwargs['sort_by'] = sort_by
+
+            competitions = self._call_api('competitions_list', **kwargs)
+            if not competitions:
+                return
+
+            logger.debug(f"Listing page {page}: {len(competitions)} competitions")
+            yield from competitions
+
+            if len(competitions) < page_size:
+                return
+            page += 1
+
+        logger.info(f"Stopped competition listing at max_pages={max_pages}")
+
+    def _to_competition_dict(self, comp: Any) -> Dict[str, Any]:
+        """Convert a Kaggle competition object to a dictionary.
+
+        Args:
+            comp: Competition object from the Kaggle API
 
         Returns:
-            Sorted list of competitions with scores
+            Competition dictionary
         """
-        logger.info("Ranking competitions...")
+        return {
+            'id': comp.id,
+            'title': comp.title,
+            'url': comp.url,
+            'deadline': comp.deadline,
+            'category': comp.category,
+            'reward': comp.reward,
+            'teamCount': comp.teamCount,
+            'userHasEntered': comp.userHasEntered,
+            'description': comp.description if hasattr(comp, 'description') else '',
+            'tags': comp.tags if hasattr(comp, 'tags') else [],
+            'enabledDate': comp.enabledDate if hasattr(comp, 'enabledDate') else None,
+            'maxDailySubmissions': comp.maxDailySubmissions if hasattr(comp, 'maxDailySubmissions') else None,
+            'maxTeamSize': comp.maxTeamSize if hasattr(comp, 'maxTeamSize') else None,
+        }
+
+    def _int_setting(self, key: str, default: int) -> int:
+        """Read a positive integer setting, falling back to the default.
 
-        weights = self.config.get('competition_selection.ranking_weights', {})
+        Args:
+            key: Dot-separated config key
+            default: Value used when the setting is missing or invalid
 
-        for comp in competitions:
-            score = 0
+        Returns:
+            Integer setting
+        """
+        value = self.config.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            return default
+        return value
 
-            # Prize money score
-            reward = comp.get('reward', '')
-            prize_value = self._extract_prize_value(reward)
-            prize_score = min(prize_value / 100000, 1.0) * weights.get('prize_money', 0.3)
+    def _is_featured(self, comp: Any) -> bool:
+        """Check whether a listed competition is a Featured competition.
 
-            # Participants score
-            team_count = comp.get('teamCount', 0)
-            participant_score = min(team_count / 5000, 1.0) * weights.get('participants', 0.25)
+        Args:
+            comp: Competition object from the Kaggle API
 
-            # Complexity score
-            complexity_score = self._assess_complexity(comp) * weights.get('complexity', 0.25)
+        Returns:
+            True if the competition is featured
+        """
+        # Featured competitions have category 'featured'
+        # Some competitions may have different categorization
+        category = str(comp.category).lower() if hasattr(comp, 'category') else ''
+
+        # Check if competition is featured
+        # Kaggle uses 'featured' category for official competitions
+        return (
+            'featured' in category or
+            category == 'featured' or
+            (hasattr(comp, 'isKernelsSubmissionsOnly') and not comp.isKernelsSubmissionsOnly)
+        )
+
+    def get_active_competitions(self, filter_featured=True) -> List[Dict[str, Any]]:
+        """Get list of active competitions, optionally filtered for Featured competitions.
 
-            # Industry relevance score
-            industry_score = self._assess_industry_relevance(comp) * weights.get('industry_relevance', 0.2)
+        Args:
+            filter_featured: If True, only return Featured competitions
+
+        Returns:
+            List of competition dictionaries
+        """
+        snapshot = self.get_competition_snapshot()
+        if snapshot is None:
+            return []
+
+        # Copies, so callers annotating the dicts (e.g. ranking) don't touch the snapshot
+        if filter_featured:
+            active_comps = [dict(comp) for comp in snapshot.featured]
+            logger.info(f"Found {len(active_comps)} Featured competitions out of {len(snapshot.competitions)} total")
+        else:
+            active_comps = [dict(comp) for comp in snapshot.competitions]
+            logger.info(f"Found {len(active_comps)} active competitions")
+
+        return active_comps
+
+    def rank_competitions(self, competitions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Rank competitions based on configured criteria.
+
+        Args:
+            competitions: List of competition dictionaries
 
-            # Total score
-            comp['ranking_score'] = score + prize_score + participant_score + complexity_score + industry_score
-            comp['prize_value'] = prize_value
-            comp['complexity_level'] = self._get_complexity_level(comp)
+        Returns:
+            Sorted list of competitions with scores
+        """
+        logger.info("Ranking competitions...")
 
-        # Sort by score
-        ranked = sorted(competitions, key=lambda x: x['ranking_score'], reverse=True)
+        # Scores for all competitions are computed in one vectorized pass
+        ranked = self.ranker.rank(competitions)
 
         logger.info(f"Ranked {len(ranked)} competitions")
         return ranked
 
+    def _score_one(self, comp: Dict[str, Any]) -> Dict[str, Any]:
+        """Score a single competition with the ranker's scalar path.
+
+        Args:
+            comp: Competition dictionary
+
+        Returns:
+            Dictionary with prize_value, complexity_score, industry_score,
+            ranking_score and complexity_level
+        """
+        return self.ranker.score_one(comp)
+
     def _extract_prize_value(self, reward: str) -> float:
         """Extract numeric prize value from reward string.
 
@@ -161,18 +382,7 @@ class KaggleCollector:
         Returns:
             Complexity score (0-1)
         """
-        indicators = self.config.get('competition_selection.complexity_indicators', [])
-
-        text = f"{comp.get('title', '')} {comp.get('description', '')}".lower()
-        tags = [str(tag).lower() for tag in comp.get('tags', [])]
-
-        matches = 0
-        for indicator in indicators:
-            if indicator.lower() in text or indicator.lower() in ' '.join(tags):
-                matches += 1
-
-        # Higher complexity = more indicators matched
-        return min(matches / len(indicators), 1.0) if indicators else 0.5
+        return float(self._score_one(comp)['complexity_score'])
 
     def _get_complexity_level(self, comp: Dict[str, Any]) -> str:
         """Get human-readable complexity level.
@@ -183,16 +393,7 @@ class KaggleCollector:
         Returns:
             Complexity level string
         """
-        score = self._assess_complexity(comp)
-
-        if score >= 0.7:
-            return "Very Complex"
-        elif score >= 0.5:
-            return "Complex"
-        elif score >= 0.3:
-            return "Moderate"
-        else:
-            return "Beginner-Friendly"
+        return str(self._score_one(comp)['complexity_level'])
 
     def _assess_industry_relevance(self, comp: Dict[str, Any]) -> float:
         """Assess competition industry relevance.
@@ -203,16 +404,7 @@ class KaggleCollector:
         Returns:
             Industry relevance score (0-1)
         """
-        industries = self.config.get('competition_selection.industries', [])
-
-        text = f"{comp.get('title', '')} {comp.get('description', '')}".lower()
-
-        matches = 0
-        for industry in industries:
-            if industry.lower() in text:
-                matches += 1
-
-        return min(matches / len(industries), 1.0) if industries else 0.5
+        return float(self._score_one(comp)['industry_score'])
 
     def get_competition_leaderboard(self, competition_id: str) -> Optional[pd.DataFrame]:
         """Get competition leaderboard.
@@ -225,42 +417,20 @@ class KaggleCollector:
         """
         try:
             logger.info(f"Fetching leaderboard for {competition_id}...")
-            leaderboard = self.api.competition_leaderboard_view(competition_id)
-
-            if leaderboard:
-                entries = []
-                for idx, entry in enumerate(leaderboard):
-                    try:
-                        # Extract fields with proper fallbacks
-                        # Use actual rank if available, otherwise use index + 1
-                        rank = getattr(entry, 'rank', idx + 1)
-                        team_id = getattr(entry, 'teamId', 0)
-                        team_name = getattr(entry, 'teamName', 'Unknown')
-                        score = getattr(entry, 'score', 0.0)
-                        submission_date = getattr(entry, 'submissionDate', None)
-
-                        entries.append({
-                            'rank': rank,
-                            'teamId': team_id,
-                            'teamName': team_name,
-                            'score': score,
-                            'submissionDate': submission_date
-                        })
-                    except Exception as entry_error:
-                        logger.debug(f"Error processing leaderboard entry {idx}: {entry_error}")
-                        continue
-
-                if entries:
-                    df = pd.DataFrame(entries)
-                    logger.info(f"Successfully fetched {len(entries)} leaderboard entries for {competition_id}")
-                    return df
-                else:
-                    logger.warning(f"No valid leaderboard entries found for {competition_id}")
-                    return None
-            else:
+            df = self._fetch_leaderboard_frame(competition_id)
+
+            if df is None:
                 logger.info(f"No leaderboard data available for {competition_id} (may be private or unavailable)")
                 return None
 
+            logger.info(f"Successfully fetched {len(df)} leaderboard entries for {competition_id}")
+            if self.leaderboard_store:
+                self.leaderboard_store.save(competition_id, df)
+            return df
+
+        except CircuitOpenError as e:
+            logger.info(f"Skipping leaderboard for {competition_id}: {e}")
+            return None
         except Exception as e:
             logger.warning(f"Could not fetch leaderboard for {competition_id}: {type(e).__name__}: {e}")
             # Log more details for debugging
@@ -268,6 +438,86 @@ class KaggleCollector:
             logger.debug(f"Leaderboard fetch traceback: {traceback.format_exc()}")
             return None
 
+    def _fetch_leaderboard_frame(self, competition_id: str) -> Optional[pd.DataFrame]:
+        """Fetch a leaderboard and build it as typed columns.
+
+        The raw leaderboard endpoint returns plain submission dictionaries,
+        which skips the client building (and date-parsing every field of)
+        one entry object per team. Clients without it fall back to
+        `competition_leaderboard_view`.
+
+        Args:
+            competition_id: Competition ID
+
+        Returns:
+            Leaderboard dataframe, or None if the leaderboard is empty
+        """
+        if self.leaderboard_settings.get('full_download', False):
+            try:
+                df = self._download_leaderboard_frame(competition_id)
+                if df is not None:
+                    return df
+            except Exception as e:
+                logger.info(f"Full leaderboard download failed for {competition_id} "
+                            f"({type(e).__name__}: {e}); using the leaderboard view")
+
+        if hasattr(self.api, 'competition_view_leaderboard'):
+            result = self._call_api('competition_view_leaderboard', competition_id)
+            if isinstance(result, dict) and isinstance(result.get('submissions'), list):
+                records = result['submissions']
+                return leaderboard_frame.from_records(records) if records else None
+
+        entries = self._call_api('competition_leaderboard_view', competition_id)
+        return leaderboard_frame.from_entries(entries) if entries else None
+
+    def _download_leaderboard_frame(self, competition_id: str) -> Optional[pd.DataFrame]:
+        """Download the full leaderboard and parse it in chunks.
+
+        The view endpoint only returns the top of the leaderboard. The
+        download holds every team (plus submission counts); its CSV is
+        decompressed and parsed straight from the zip, and the zip is
+        removed once parsed.
+
+        Args:
+            competition_id: Competition ID
+
+        Returns:
+            Leaderboard dataframe, or None if the download holds no rows
+        """
+        chunksize = self.leaderboard_settings.get('download_chunksize', 50000)
+        breaker = self.breakers.get('kaggle.competition_leaderboard_download')
+
+        with tempfile.TemporaryDirectory(prefix='leaderboard-') as download_dir:
+            breaker.call(self.api.competition_leaderboard_download, competition_id, download_dir, quiet=True)
+
+            archive = next(Path(download_dir).glob('*.zip'), None)
+            if archive is None:
+                return None
+            with zipfile.ZipFile(archive) as zf:
+                member = next((name for name in zf.namelist() if name.lower().endswith('.csv')), None)
+                if member is None:
+                    return None
+                with zf.open(member) as handle:
+                    df = leaderboard_frame.read_csv(handle, chunksize=chunksize)
+
+        if df is not None:
+            logger.info(f"Downloaded full leaderboard for {competition_id} ({len(df)} teams)")
+        return df
+
+    def get_leaderboard_changes(self, competition_id: str) -> Optional[pd.DataFrame]:
+        """Get rank and score movement since the previous leaderboard snapshot.
+
+        Args:
+            competition_id: Competition ID
+
+        Returns:
+            Leaderboard with rank_change, score_change and is_new columns, or
+            None if change tracking is off or there is no earlier snapshot
+        """
+        if not self.leaderboard_store:
+            return None
+        return self.leaderboard_store.deltas(competition_id)
+
     def get_competition_kernels(self, competition_id: str, max_kernels: int = 10) -> List[Dict[str, Any]]:
         """Get top kernels for a competition.
 
@@ -280,7 +530,8 @@ class KaggleCollector:
         """
         try:
             logger.info(f"Fetching kernels for {competition_id}...")
-            kernels = self.api.kernels_list(competition=competition_id, page_size=max_kernels, sort_by='voteCount')
+            kernels = self._call_api('kernels_list', competition=competition_id,
+                                    page_size=max_kernels, sort_by='voteCount')
 
             kernel_list = []
             for kernel in kernels[:max_kernels]:
@@ -304,71 +555,81 @@ class KaggleCollector:
 
             return kernel_list
 
+        except CircuitOpenError as e:
+            logger.info(f"Skipping kernels for {competition_id}: {e}")
+            return []
         except Exception as e:
             logger.warning(f"Could not fetch kernels for {competition_id}: {type(e).__name__}: {e}")
             return []
 
-    def get_daily_submission_stats(self, competition_id: str) -> Dict[str, Any]:
+    def get_daily_submission_stats(
+        self,
+        competition_id: str,
+        leaderboard: Optional[pd.DataFrame] = None
+    ) -> Dict[str, Any]:
         """Get daily submission statistics for a competition.
 
+        Competition details come from this run's competition snapshot; the
+        leaderboard is only fetched when the caller does not pass one.
+
         Args:
             competition_id: Competition ID
+            leaderboard: Already-fetched leaderboard of the competition
 
         Returns:
             Dictionary with submission statistics
         """
         try:
-            logger.info(f"Fetching submission statistics for {competition_id}...")
-
-            # Get competition details to find max daily submissions
-            try:
-                comp_list = self.api.competition_list_cli(competition=competition_id)
-                comp_details = comp_list[0] if comp_list else None
-            except:
-                comp_details = None
-
-            # Get leaderboard to analyze submission patterns
-            leaderboard = self.get_competition_leaderboard(competition_id)
+            logger.info(f"Computing submission statistics for {competition_id}...")
+            if leaderboard is None:
+                leaderboard = self.get_competition_leaderboard(competition_id)
+
+            stats = leaderboard_analytics.submission_stats(
+                competition_id, self._find_competition(competition_id), leaderboard
+            )
+            logger.info(f"Submission stats: {stats['unique_submitters']} submitters")
+            return stats
 
-            stats = {
+        except Exception as e:
+            logger.warning(f"Error fetching submission stats for {competition_id}: {type(e).__name__}: {e}")
+            return {
                 'competition_id': competition_id,
                 'max_daily_submissions': None,
                 'total_submissions': 0,
                 'unique_submitters': 0,
                 'avg_submissions_per_team': 0,
-                'submission_trend': 'unknown'
+                'submission_trend': 'error'
             }
 
-            # Extract max daily submissions limit
-            if comp_details and hasattr(comp_details, 'maxDailySubmissions'):
-                stats['max_daily_submissions'] = comp_details.maxDailySubmissions
-                logger.debug(f"Max daily submissions: {stats['max_daily_submissions']}")
+    def get_submission_stats(
+        self,
+        competitions: List[Dict[str, Any]],
+        leaderboards: Dict[str, pd.DataFrame]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get submission statistics for several competitions without API calls.
 
-            # Analyze leaderboard for submission patterns
-            if leaderboard is not None and not leaderboard.empty:
-                stats['unique_submitters'] = len(leaderboard)
+        Args:
+            competitions: Competition dictionaries (e.g. the ranked top competitions)
+            leaderboards: Leaderboards already fetched this run, by competition ID
 
-                # If leaderboard has submission counts, calculate average
-                if 'submissions' in leaderboard.columns:
-                    stats['total_submissions'] = leaderboard['submissions'].sum()
-                    stats['avg_submissions_per_team'] = leaderboard['submissions'].mean()
+        Returns:
+            Dictionary mapping competition ID to its statistics
+        """
+        return leaderboard_analytics.submission_stats_batch(competitions, leaderboards)
 
-                logger.info(f"Submission stats: {stats['unique_submitters']} submitters")
-            else:
-                logger.info(f"No leaderboard data available for submission analysis")
+    def _find_competition(self, competition_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a competition in this run's competition snapshot.
 
-            return stats
+        Args:
+            competition_id: Competition ID
 
-        except Exception as e:
-            logger.warning(f"Error fetching submission stats for {competition_id}: {type(e).__name__}: {e}")
-            return {
-                'competition_id': competition_id,
-                'max_daily_submissions': None,
-                'total_submissions': 0,
-                'unique_submitters': 0,
-                'avg_submissions_per_team': 0,
-                'submission_trend': 'error'
-            }
+        Returns:
+            Competition dictionary or None
+        """
+        snapshot = self.get_competition_snapshot()
+        if snapshot is None:
+            return None
+        return next((comp for comp in snapshot.competitions if str(comp['id']) == str(competition_id)), None)
 
     def get_algorithms_from_submissions(self, competition_id: str, max_kernels: int = 20) -> List[str]:
         """Extract algorithms from recent submission kernels when leaderboard is unavailable.
@@ -0,0 +1,287 @@
+"""Numeric summaries of full leaderboards for the analysis prompt."""
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Rank cut-offs reported as "top x%"
+BANDS = (0.01, 0.10, 0.25, 0.50)
+
+
+@dataclass
+class LeaderboardSummary:
+    """Score distribution, shake-up risk and movement of one leaderboard.
+
+    Attributes:
+        teams: Teams with a score
+        higher_is_better: Whether the metric is maximized
+        leader_score: Score of rank 1
+        lead: Score gap between ranks 1 and 2
+        bands: Score needed to be in the top fraction of teams, by fraction
+        gap_median: Median score gap between neighbouring ranks
+        gap_p90: 90th percentile of the neighbouring-rank gaps
+        largest_gap: Largest neighbouring-rank gap and the rank above it
+        near_leader: Teams within 0.1% and 1% of the leader's score
+        ties: Teams whose score equals the team ranked above them
+        shake_up: Public/private comparison (see `shake_up`), if private scores exist
+        velocity: Rank movement per day (see `rank_velocity`), if changes are known
+        total_teams: Teams in the whole competition, if known
+    """
+
+    teams: int
+    higher_is_better: bool
+    leader_score: float
+    lead: float
+    bands: Dict[float, float]
+    gap_median: float
+    gap_p90: float
+    largest_gap: Tuple[float, int]
+    near_leader: Tuple[int, int]
+    ties: int
+    shake_up: Optional[Dict[str, float]] = None
+    velocity: Optional[Dict[str, float]] = None
+    total_teams: Optional[int] = None
+
+    @property
+    def complete(self) -> bool:
+        """Whether the summary covers every team of the competition."""
+        return self.total_teams is not None and self.teams >= self.total_teams
+
+    def to_prompt(self) -> str:
+        """Format the summary as compact prompt lines.
+
+        A summary of only the top of the leaderboard says so, and leaves out
+        the figures that need the whole field (cut-offs, new teams).
+
+        Returns:
+            Formatted summary
+        """
+        better = "≥" if self.higher_is_better else "≤"
+        direction = "higher" if self.higher_is_better else "lower"
+        gap, above = self.largest_gap
+        if self.complete:
+            scope = ""
+            lines = [f"Score distribution ({self.teams} teams, {direction} is better):"]
+        else:
+            scope = f" among the top {self.teams} shown"
+            of_total = f" of {self.total_teams}" if self.total_teams else ""
+            lines = [f"Score distribution of the top {self.teams}{of_total} teams ({direction} is better):"]
+
+        lines.append(f"- Leader {self.leader_score:.5g}; lead over #2: {self.lead:.3g}")
+        if self.complete:
+            cut_offs = ", ".join(
+                f"median {score:.5g}" if fraction == 0.5 else f"top {fraction:.0%} {better} {score:.5g}"
+                for fraction, score in self.bands.items()
+            )
+            lines.append(f"- Cut-offs: {cut_offs}")
+        lines += [
+            f"- Gaps between neighbouring ranks{scope}: median {self.gap_median:.3g}, "
+            f"90th percentile {self.gap_p90:.3g}, largest {gap:.3g} (#{above} to #{above + 1})",
+            f"- {self.near_leader[0]} teams{scope} within 0.1% of the leader's score, "
+            f"{self.near_leader[1]} within 1%; {self.ties} tied with the team above",
+        ]
+        if self.shake_up:
+            lines.append(
+                f"- Public/private shake-up: rank correlation {self.shake_up['rank_correlation']:.2f}, "
+                f"{self.shake_up['top_dropped']:.0f} of the public top {self.shake_up['top']:.0f} "
+                f"outside the private top {self.shake_up['top']:.0f}, "
+                f"mean shift {self.shake_up['mean_shift']:.1f} places"
+            )
+        if self.velocity:
+            new_teams = f", {self.velocity['new_teams']:.0f} new teams" if self.complete else ""
+            lines.append(
+                f"- Rank velocity{scope} over {self.velocity['days']:.0f} day(s): median "
+                f"{self.velocity['median_moves']:.1f} places/day, "
+                f"{self.velocity['top_moved']:.0%} of the top {self.velocity['top']:.0f} moved, "
+                f"largest climb {self.velocity['max_climb']:.0f} places/day{new_teams}"
+            )
+        return "\n".join(lines)
+
+
+def _ranked_scores(leaderboard: pd.DataFrame, column: str = 'score') -> np.ndarray:
+    """Scores ordered by rank, without missing values."""
+    scores = pd.to_numeric(leaderboard[column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    if 'rank' in leaderboard.columns:
+        ranks = pd.to_numeric(leaderboard['rank'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.inf)
+        scores = scores[np.argsort(ranks, kind='stable')]
+    return scores[~np.isnan(scores)]
+
+
+def shake_up(public_ranks: np.ndarray, private_ranks: np.ndarray, top: int = 10) -> Dict[str, float]:
+    """Compare public and private standings of the same teams.
+
+    Args:
+        public_ranks: Public rank of each team
+        private_ranks: Private rank of the same teams
+        top: Size of the top group checked for turnover
+
+    Returns:
+        Dictionary with rank_correlation (Spearman), top, top_dropped
+        (public top teams outside the private top) and mean_shift (mean
+        absolute rank change)
+    """
+    public = pd.Series(public_ranks).rank(method='average').to_numpy()
+    private = pd.Series(private_ranks).rank(method='average').to_numpy()
+    top = min(top, len(public))
+    correlation = float(np.corrcoef(public, private)[0, 1]) if len(public) > 1 else 1.0
+
+    in_public_top = public <= top
+    return {
+        'rank_correlation': 1.0 if math.isnan(correlation) else correlation,
+        'top': float(top),
+        'top_dropped': float(np.count_nonzero(in_public_top & (private > top))),
+        'mean_shift': float(np.mean(np.abs(public - private))),
+    }
+
+
+def rank_velocity(changes: pd.DataFrame, top: int = 50) -> Optional[Dict[str, float]]:
+    """Rank movement per day between two leaderboard snapshots.
+
+    Args:
+        changes: Dataframe from LeaderboardStore.deltas
+        top: Size of the top group checked for movement
+
+    Returns:
+        Dictionary with days, median_moves (median absolute rank change per
+        day), top, top_moved (fraction of the current top that moved),
+        max_climb (places per day) and new_teams; None without changes
+    """
+    if changes is None or changes.empty:
+        return None
+
+    start, end = changes.attrs.get('start'), changes.attrs.get('end')
+    days = max(1, (end - start).days) if start and end else 1
+
+    is_new = changes['is_new'].to_numpy(dtype=bool)
+    moves = changes['rank_change'].to_numpy(dtype=np.float64, na_value=np.nan)[~is_new] / days
+    ranks = changes['rank'].to_numpy(dtype=np.float64, na_value=np.inf)[~is_new]
+    top_moves = moves[ranks <= top]
+
+    return {
+        'days': float(days),
+        'median_moves': float(np.median(np.abs(moves))) if len(moves) else 0.0,
+        'top': float(top),
+        'top_moved': float(np.count_nonzero(top_moves)) / len(top_moves) if len(top_moves) else 0.0,
+        'max_climb': float(max(0.0, np.max(moves))) if len(moves) else 0.0,
+        'new_teams': float(np.count_nonzero(is_new)),
+    }
+
+
+def summarize(
+    leaderboard: Any,
+    changes: Optional[pd.DataFrame] = None,
+    total_teams: Optional[int] = None
+) -> Optional[LeaderboardSummary]:
+    """Summarize a leaderboard.
+
+    The metric direction is inferred from the scores of the first and last
+    ranked teams. Public/private shake-up is included when the leaderboard
+    has a `privateScore` column. Unless the leaderboard holds all
+    `total_teams`, it is treated as the top slice only (see
+    LeaderboardSummary.to_prompt).
+
+    Args:
+        leaderboard: Leaderboard dataframe with rank and score columns
+        changes: Movement since the previous snapshot (LeaderboardStore.deltas)
+        total_teams: Teams in the competition (e.g. the listing's teamCount)
+
+    Returns:
+        LeaderboardSummary, or None if no team has a score
+    """
+    if leaderboard is None or getattr(leaderboard, 'empty', True) or 'score' not in leaderboard.columns:
+        return None
+
+    scores = _ranked_scores(leaderboard)
+    if not len(scores):
+        return None
+
+    n = len(scores)
+    leader = scores[0]
+    higher_is_better = bool(leader >= scores[-1])
+
+    gaps = np.abs(np.diff(scores))
+    cut_offs = np.maximum(np.ceil(np.array(BANDS) * n).astype(int), 1) - 1
+    distance = np.abs(scores - leader)
+    scale = abs(leader) or float(np.ptp(scores)) or 1.0
+
+    summary = LeaderboardSummary(
+        teams=n,
+        higher_is_better=higher_is_better,
+        leader_score=float(leader),
+        lead=float(gaps[0]) if len(gaps) else 0.0,
+        bands={fraction: float(scores[i]) for fraction, i in zip(BANDS, cut_offs)},
+        gap_median=float(np.median(gaps)) if len(gaps) else 0.0,
+        gap_p90=float(np.percentile(gaps, 90)) if len(gaps) else 0.0,
+        largest_gap=(float(gaps.max()), int(gaps.argmax()) + 1) if len(gaps) else (0.0, 1),
+        near_leader=(int(np.count_nonzero(distance <= scale * 0.001)) - 1,
+                     int(np.count_nonzero(distance <= scale * 0.01)) - 1),
+        ties=int(np.count_nonzero(gaps == 0)),
+        velocity=rank_velocity(changes),
+        total_teams=total_teams,
+    )
+
+    if 'privateScore' in leaderboard.columns:
+        both = leaderboard[['score', 'privateScore']].apply(pd.to_numeric, errors='coerce').dropna()
+        if len(both) > 1:
+            public = both['score'].rank(method='min', ascending=not higher_is_better).to_numpy()
+            private = both['privateScore'].rank(method='min', ascending=not higher_is_better).to_numpy()
+            summary.shake_up = shake_up(public, private)
+
+    return summary
+
+
+def submission_stats(
+    competition_id: str,
+    competition: Optional[Dict[str, Any]],
+    leaderboard: Optional[pd.DataFrame]
+) -> Dict[str, Any]:
+    """Submission statistics of a competition from already-fetched data.
+
+    Args:
+        competition_id: Competition ID
+        competition: Competition dictionary from the listing (for maxDailySubmissions)
+        leaderboard: Leaderboard dataframe; a `submissions` column (full
+            download) gives submission totals
+
+    Returns:
+        Dictionary with submission statistics
+    """
+    stats = {
+        'competition_id': competition_id,
+        'max_daily_submissions': (competition or {}).get('maxDailySubmissions'),
+        'total_submissions': 0,
+        'unique_submitters': 0,
+        'avg_submissions_per_team': 0,
+        'submission_trend': 'unknown'
+    }
+
+    if leaderboard is not None and not leaderboard.empty:
+        stats['unique_submitters'] = len(leaderboard)
+        if 'submissions' in leaderboard.columns:
+            submissions = pd.to_numeric(leaderboard['submissions'], errors='coerce')
+            stats['total_submissions'] = int(submissions.sum())
+            stats['avg_submissions_per_team'] = float(submissions.mean())
+
+    return stats
+
+
+def submission_stats_batch(
+    competitions: List[Dict[str, Any]],
+    leaderboards: Dict[str, pd.DataFrame]
+) -> Dict[str, Dict[str, Any]]:
+    """Submission statistics of several competitions.
+
+    Args:
+        competitions: Competition dictionaries from the listing
+        leaderboards: Leaderboards by competition ID (missing ones count as empty)
+
+    Returns:
+        Dictionary mapping competition ID to its statistics
+    """
+    return {
+        comp['id']: submission_stats(comp['id'], comp, leaderboards.get(comp['id']))
+        for comp in competitions
+    }
@@ -0,0 +1,138 @@
+"""Build typed leaderboard dataframes column by column."""
+from typing import IO, Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+COLUMNS = ['rank', 'teamId', 'teamName', 'score', 'submissionDate']
+
+# Value used when a column is missing from the source (rank defaults to
+# the row position instead)
+DEFAULTS = {'teamId': 0, 'teamName': 'Unknown', 'score': 0.0, 'submissionDate': None}
+
+
+# Column names of the leaderboard CSV download (compared case-insensitively);
+# SubmissionCount is only present in the full download
+CSV_COLUMNS = {
+    'rank': 'rank',
+    'teamid': 'teamId',
+    'teamname': 'teamName',
+    'score': 'score',
+    'submissiondate': 'submissionDate',
+    'lastsubmissiondate': 'submissionDate',
+    'submissioncount': 'submissions',
+    'privatescore': 'privateScore',
+}
+
+
+def build_frame(columns: Dict[str, Sequence[Any]], length: int, offset: int = 0) -> pd.DataFrame:
+    """Convert raw leaderboard columns to typed arrays in bulk.
+
+    Ranks become int32 (row position where missing or unparseable), team
+    IDs int64 (0 where missing), scores float64 (NaN where unparseable;
+    Kaggle sends them as strings) and submission dates UTC datetime64.
+    A `submissions` column, when given, becomes int32 submission counts
+    and a `privateScore` column float64 scores.
+
+    Args:
+        columns: Raw values per leaderboard column; missing columns get defaults
+        length: Number of rows
+        offset: Rows preceding these ones (for position-based ranks)
+
+    Returns:
+        Leaderboard dataframe in leaderboard order
+    """
+    def raw(name: str) -> pd.Series:
+        values = columns.get(name)
+        if values is None:
+            values = [DEFAULTS.get(name)] * length
+        if isinstance(values, pd.Series):
+            return values.reset_index(drop=True)
+        return pd.Series(values, dtype=object)
+
+    position = np.arange(offset + 1, offset + length + 1, dtype=np.int32)
+    rank = pd.to_numeric(raw('rank'), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    rank = np.where(np.isnan(rank), position, rank).astype(np.int32)
+
+    team_id = pd.to_numeric(raw('teamId'), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    team_id = np.nan_to_num(team_id, nan=0).astype(np.int64)
+
+    frame = pd.DataFrame({
+        'rank': rank,
+        'teamId': team_id,
+        'teamName': raw('teamName').fillna(DEFAULTS['teamName']).astype(str),
+        'score': pd.to_numeric(raw('score'), errors='coerce').astype(np.float64),
+        'submissionDate': pd.to_datetime(raw('submissionDate'), errors='coerce', utc=True, format='ISO8601'),
+    })
+    if 'submissions' in columns:
+        submissions = pd.to_numeric(raw('submissions'), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        frame['submissions'] = np.nan_to_num(submissions, nan=0).astype(np.int32)
+    if 'privateScore' in columns:
+        frame['privateScore'] = pd.to_numeric(raw('privateScore'), errors='coerce').astype(np.float64)
+    return frame
+
+
+def from_records(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a leaderboard from the API's raw submission dictionaries.
+
+    Args:
+        records: Submission dictionaries (teamId, teamName, score, submissionDate, ...)
+
+    Returns:
+        Typed leaderboard dataframe
+    """
+    columns = {
+        name: [record.get(name, DEFAULTS.get(name)) for record in records]
+        for name in COLUMNS
+    }
+    return build_frame(columns, len(records))
+
+
+def from_entries(entries: Sequence[Any]) -> pd.DataFrame:
+    """Build a leaderboard from API entry objects.
+
+    Args:
+        entries: Leaderboard entry objects with attributes named like the columns
+
+    Returns:
+        Typed leaderboard dataframe
+    """
+    columns = {
+        name: [getattr(entry, name, DEFAULTS.get(name)) for entry in entries]
+        for name in COLUMNS
+    }
+    return build_frame(columns, len(entries))
+
+
+def read_csv(handle: IO, chunksize: int = 50000) -> Optional[pd.DataFrame]:
+    """Parse a leaderboard CSV stream in chunks.
+
+    Only the leaderboard columns are parsed, and each chunk is converted to
+    typed columns before the next is read, so peak memory is one raw chunk
+    plus the compact typed result.
+
+    Args:
+        handle: Binary or text file object with the CSV
+        chunksize: Rows parsed per chunk
+
+    Returns:
+        Typed leaderboard dataframe, or None if the CSV has no rows
+    """
+    reader = pd.read_csv(
+        handle,
+        chunksize=chunksize,
+        usecols=lambda name: name.strip().lower() in CSV_COLUMNS,
+        dtype=str
+    )
+    frames = []
+    offset = 0
+    with reader:
+        for chunk in reader:
+            columns = {CSV_COLUMNS[name.strip().lower()]: chunk[name] for name in chunk.columns}
+            frames.append(build_frame(columns, len(chunk), offset=offset))
+            offset += len(chunk)
+
+    if not offset:
+        return None
+    return pd.concat(frames, ignore_index=True)
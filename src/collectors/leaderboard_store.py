@@ -0,0 +1,291 @@
+"""Daily leaderboard snapshots in Parquet, with rank and score deltas."""
+import os
+import re
+from datetime import date
+from pathlib import Path
+from typing import Any, List, Optional
+
+import pandas as pd
+
+from src.utils.logger import setup_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = ds = pq = None
+
+
+logger = setup_logger("leaderboard_store")
+
+COLUMNS = ['rank', 'teamId', 'teamName', 'score', 'submissionDate', 'submissions', 'privateScore']
+
+
+def _schema() -> "pa.Schema":
+    # submissions and privateScore are only in the full CSV download and
+    # stay null otherwise (also in snapshots written before they were kept)
+    return pa.schema([
+        ('rank', pa.int64()),
+        ('teamId', pa.int64()),
+        ('teamName', pa.string()),
+        ('score', pa.float64()),
+        ('submissionDate', pa.string()),
+        ('submissions', pa.int64()),
+        ('privateScore', pa.float64()),
+    ])
+
+
+class LeaderboardStore:
+    """Leaderboard snapshots partitioned by competition and day.
+
+    Snapshots are written as `competition=<id>/date=<YYYY-MM-DD>/part-0.parquet`
+    under the store root, one per competition per day (a re-run on the same
+    day replaces that day's snapshot). History queries only open the
+    partitions of the requested date range, and deltas between two
+    snapshots are computed with a single vectorized join on team ID (team
+    name where the ID is missing).
+    """
+
+    def __init__(self, root: str, snapshot_interval: float = 86400, today: Optional[date] = None):
+        """Initialize leaderboard store.
+
+        Args:
+            root: Directory holding the snapshots
+            snapshot_interval: Minimum seconds between snapshots of a competition
+            today: Date of this run (defaults to today)
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for leaderboard snapshots")
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.snapshot_interval = snapshot_interval
+        self.today = today or date.today()
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["LeaderboardStore"]:
+        """Create the store from the `data_collection.leaderboard` config section.
+
+        Args:
+            config: Configuration loader instance
+
+        Returns:
+            LeaderboardStore, or None if change tracking is off or pyarrow is missing
+        """
+        settings = config.get('data_collection.leaderboard', {})
+        if not isinstance(settings, dict) or not settings.get('track_changes', False):
+            return None
+        if pa is None:
+            logger.warning("Leaderboard change tracking needs pyarrow; snapshots disabled")
+            return None
+
+        cache_dir = config.get('cache.dir', '.cache')
+        try:
+            return cls(
+                Path(cache_dir) / "leaderboards",
+                snapshot_interval=settings.get('snapshot_interval', 86400)
+            )
+        except OSError as e:
+            logger.warning(f"Could not open leaderboard store in {cache_dir}: {e}")
+            return None
+
+    def _competition_dir(self, competition_id: str) -> Path:
+        safe_id = re.sub(r'[^A-Za-z0-9_.-]', '_', str(competition_id))
+        return self.root / f"competition={safe_id}"
+
+    def dates(self, competition_id: str) -> List[date]:
+        """Dates with a snapshot of a competition, oldest first.
+
+        Args:
+            competition_id: Competition ID
+
+        Returns:
+            List of snapshot dates
+        """
+        directory = self._competition_dir(competition_id)
+        if not directory.is_dir():
+            return []
+
+        found = []
+        for child in directory.iterdir():
+            if child.name.startswith('date=') and (child / "part-0.parquet").exists():
+                try:
+                    found.append(date.fromisoformat(child.name[5:]))
+                except ValueError:
+                    continue
+        return sorted(found)
+
+    def save(self, competition_id: str, leaderboard: pd.DataFrame, snapshot_date: Optional[date] = None) -> bool:
+        """Store a leaderboard snapshot unless a recent one exists.
+
+        Args:
+            competition_id: Competition ID
+            leaderboard: Leaderboard with rank, teamId, teamName, score and
+                submissionDate, optionally submissions and privateScore
+            snapshot_date: Date of the snapshot (defaults to the store's today)
+
+        Returns:
+            True if the snapshot was written
+        """
+        snapshot_date = snapshot_date or self.today
+        earlier = [d for d in self.dates(competition_id) if d < snapshot_date]
+        if earlier and (snapshot_date - earlier[-1]).days * 86400 < self.snapshot_interval:
+            logger.debug(f"Leaderboard snapshot of {competition_id} from {earlier[-1]} is recent enough")
+            return False
+
+        directory = self._competition_dir(competition_id) / f"date={snapshot_date.isoformat()}"
+        path = directory / "part-0.parquet"
+        tmp_path = directory / f".part-0.{os.getpid()}.tmp"
+        try:
+            table = pa.Table.from_pandas(self._normalize(leaderboard), schema=_schema(), preserve_index=False)
+            directory.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError, TypeError, pa.ArrowException) as e:
+            logger.warning(f"Could not store leaderboard snapshot of {competition_id}: {e}")
+            return False
+
+        logger.debug(f"Stored leaderboard snapshot of {competition_id} ({table.num_rows} teams)")
+        return True
+
+    @staticmethod
+    def _normalize(leaderboard: pd.DataFrame) -> pd.DataFrame:
+        """Coerce a collected leaderboard to the snapshot columns and types."""
+        missing = pd.Series([None] * len(leaderboard), index=leaderboard.index, dtype=object)
+
+        def column(name: str) -> pd.Series:
+            return leaderboard[name] if name in leaderboard.columns else missing
+
+        return pd.DataFrame({
+            'rank': pd.to_numeric(column('rank'), errors='coerce').astype('Int64'),
+            'teamId': pd.to_numeric(column('teamId'), errors='coerce').astype('Int64'),
+            'teamName': column('teamName').astype('string'),
+            'score': pd.to_numeric(column('score'), errors='coerce').astype('float64'),
+            'submissionDate': column('submissionDate').astype('string'),
+            'submissions': pd.to_numeric(column('submissions'), errors='coerce').astype('Int64'),
+            'privateScore': pd.to_numeric(column('privateScore'), errors='coerce').astype('float64'),
+        })
+
+    @staticmethod
+    def _team_keys(leaderboard: pd.DataFrame) -> pd.Series:
+        """Join key of every team: its ID, or its name where the ID is missing.
+
+        Collected leaderboards store a missing team ID as 0. Keys that are
+        missing or shared by several rows are null, so those rows match nothing.
+        """
+        team_id = leaderboard['teamId']
+        known = team_id.fillna(0) != 0
+        keys = ('id:' + team_id.astype('string')).where(known, 'name:' + leaderboard['teamName'].astype('string'))
+        return keys.mask(keys.duplicated(keep=False))
+
+    def load(self, competition_id: str, snapshot_date: Optional[date] = None) -> Optional[pd.DataFrame]:
+        """Load one snapshot.
+
+        Args:
+            competition_id: Competition ID
+            snapshot_date: Snapshot date (defaults to the latest)
+
+        Returns:
+            Leaderboard dataframe, or None if there is no such snapshot
+        """
+        if snapshot_date is None:
+            dates = self.dates(competition_id)
+            if not dates:
+                return None
+            snapshot_date = dates[-1]
+
+        path = self._competition_dir(competition_id) / f"date={snapshot_date.isoformat()}" / "part-0.parquet"
+        if not path.exists():
+            return None
+        return pq.read_table(path, schema=_schema()).to_pandas()
+
+    def history(
+        self,
+        competition_id: str,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Load all snapshots in a date range as one long table.
+
+        Only the partitions inside the range are read.
+
+        Args:
+            competition_id: Competition ID
+            since: First snapshot date (inclusive)
+            until: Last snapshot date (inclusive)
+            columns: Columns to read (defaults to all)
+
+        Returns:
+            Dataframe with a `date` column plus the requested columns, by date then rank
+        """
+        columns = columns or COLUMNS
+        directory = self._competition_dir(competition_id)
+        if not self.dates(competition_id):
+            return pd.DataFrame(columns=['date'] + columns)
+
+        dataset = ds.dataset(
+            str(directory),
+            format='parquet',
+            schema=_schema().append(pa.field('date', pa.string())),
+            partitioning=ds.partitioning(pa.schema([('date', pa.string())]), flavor='hive'),
+            exclude_invalid_files=True,
+            ignore_prefixes=['.']
+        )
+        condition = None
+        if since is not None:
+            condition = ds.field('date') >= since.isoformat()
+        if until is not None:
+            upper = ds.field('date') <= until.isoformat()
+            condition = upper if condition is None else condition & upper
+
+        frame = dataset.to_table(columns=['date'] + columns, filter=condition).to_pandas()
+        frame['date'] = pd.to_datetime(frame['date']).dt.date
+        sort_by = ['date'] + (['rank'] if 'rank' in columns else [])
+        return frame.sort_values(sort_by, kind='stable').reset_index(drop=True)
+
+    def deltas(
+        self,
+        competition_id: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None
+    ) -> Optional[pd.DataFrame]:
+        """Rank and score movement of every team between two snapshots.
+
+        Args:
+            competition_id: Competition ID
+            start: Earlier snapshot date (defaults to the one before `end`)
+            end: Later snapshot date (defaults to the latest)
+
+        Returns:
+            The `end` leaderboard with rank_prev, score_prev, rank_change
+            (positive when a team climbed), score_change and is_new columns,
+            ordered by rank; None if there are not two snapshots to compare
+        """
+        dates = self.dates(competition_id)
+        end = end or (dates[-1] if dates else None)
+        if start is None:
+            earlier = [d for d in dates if end is not None and d < end]
+            start = earlier[-1] if earlier else None
+        if start is None or end is None:
+            return None
+
+        before = self.load(competition_id, start)
+        after = self.load(competition_id, end)
+        if before is None or after is None:
+            return None
+
+        previous = pd.DataFrame({
+            '_team': self._team_keys(before),
+            'rank_prev': before['rank'],
+            'score_prev': before['score'],
+        }).dropna(subset=['_team'])
+        merged = after.assign(_team=self._team_keys(after)).merge(
+            previous, on='_team', how='left'
+        ).drop(columns='_team')
+        merged['rank_change'] = merged['rank_prev'] - merged['rank']
+        merged['score_change'] = merged['score'] - merged['score_prev']
+        merged['is_new'] = merged['rank_prev'].isna()
+        merged.attrs.update(start=start, end=end)
+        return merged.sort_values('rank', kind='stable').reset_index(drop=True)
@@ -0,0 +1,259 @@
+"""Near-duplicate paper detection with MinHash signatures and LSH."""
+import re
+import sqlite3
+import threading
+import zlib
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.logger import setup_logger
+from src.utils.config_loader import ConfigLoader
+
+
+logger = setup_logger("paper_dedup")
+
+_PRIME = (1 << 31) - 1
+
+
+class PaperDeduplicator:
+    """Drop papers that duplicate one already kept in this run or recently.
+
+    Each paper gets a MinHash signature over word 3-grams of its title and
+    summary. Signatures are split into bands and bucketed (locality
+    sensitive hashing), so a new paper is only compared with papers that
+    share a band; a candidate is a duplicate when the estimated Jaccard
+    similarity reaches `threshold`. Papers with the same arXiv ID (ignoring
+    the version) are always duplicates.
+
+    With a history file, papers already reported on one of the previous
+    `history_days` days are dropped too. Papers are only added to the
+    history by `record`, once the blog that reports them has been saved.
+    Papers recorded earlier on the same day are not dropped, so re-running
+    a day gives the same result.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.7,
+        history_path: Optional[str] = None,
+        history_days: int = 7,
+        today: Optional[date] = None,
+        overfetch: int = 3
+    ):
+        """Initialize paper deduplicator.
+
+        Args:
+            num_perm: Number of MinHash permutations (signature length)
+            bands: Number of LSH bands; must divide num_perm
+            threshold: Estimated Jaccard similarity at which papers are duplicates
+            history_path: SQLite file with signatures from earlier runs
+            history_days: Days of history to deduplicate against
+            today: Date of this run (defaults to today)
+            overfetch: Candidates to collect per paper wanted, so sections can
+                still be filled after duplicates are dropped
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.today = today or date.today()
+        self.overfetch = max(1, int(overfetch))
+
+        rng = np.random.RandomState(1)
+        self._a = rng.randint(1, _PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm).astype(np.uint64)
+
+        self._lock = threading.Lock()
+        self._keys: set = set()
+        self._signatures: List[np.ndarray] = []
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+
+        self._conn = None
+        if history_path:
+            self._open_history(Path(history_path), history_days)
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> "PaperDeduplicator":
+        """Create a deduplicator from the `research.dedup` and `cache` sections.
+
+        Args:
+            config: Configuration loader instance
+
+        Returns:
+            PaperDeduplicator
+        """
+        settings = config.get('research.dedup', {})
+        if not isinstance(settings, dict):
+            settings = {}
+
+        history_path = None
+        history_days = settings.get('history_days', 7)
+        if history_days:
+            history_path = Path(config.get('cache.dir', '.cache')) / "paper_dedup.sqlite"
+
+        return cls(
+            threshold=settings.get('threshold', 0.7),
+            history_path=history_path,
+            history_days=history_days,
+            overfetch=settings.get('overfetch', 3)
+        )
+
+    def _open_history(self, path: Path, history_days: int):
+        """Load signatures of papers reported on the previous days."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS seen ("
+                    "paper_key TEXT PRIMARY KEY, "
+                    "signature BLOB NOT NULL, "
+                    "seen_on TEXT NOT NULL)"
+                )
+                oldest = (self.today - timedelta(days=history_days)).isoformat()
+                self._conn.execute("DELETE FROM seen WHERE seen_on < ?", (oldest,))
+
+            rows = self._conn.execute(
+                "SELECT paper_key, signature FROM seen WHERE seen_on < ?",
+                (self.today.isoformat(),)
+            ).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not open paper history {path}: {e}")
+            self._conn = None
+            return
+
+        for key, blob in rows:
+            self._add(key, np.frombuffer(blob, dtype=np.uint32))
+        logger.debug(f"Loaded {len(rows)} paper signatures from history")
+
+    @staticmethod
+    def paper_key(paper: Dict[str, Any]) -> str:
+        """Identifier of a paper with the scheme and arXiv version removed.
+
+        Args:
+            paper: Paper dictionary
+
+        Returns:
+            Paper key
+        """
+        url = str(paper.get('url') or paper.get('paper_id') or paper.get('title', ''))
+        url = re.sub(r'^https?://', '', url.strip().lower())
+        return re.sub(r'v\d+$', '', url)
+
+    def signature(self, paper: Dict[str, Any]) -> np.ndarray:
+        """Compute the MinHash signature of a paper.
+
+        Args:
+            paper: Paper dictionary with title and summary (or abstract)
+
+        Returns:
+            uint32 array of length num_perm
+        """
+        text = f"{paper.get('title', '')} {paper.get('summary') or paper.get('abstract', '')}"
+        words = re.findall(r'[a-z0-9]+', text.lower())
+        if len(words) >= 3:
+            shingles = {' '.join(words[i:i + 3]) for i in range(len(words) - 2)}
+        else:
+            shingles = set(words) or {''}
+
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode('utf-8')) for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+        # a < 2^31 and hashes < 2^32, so the products fit in 64 bits
+        permuted = (np.outer(hashes, self._a) + self._b) % _PRIME
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def _add(self, key: str, signature: np.ndarray):
+        index = len(self._signatures)
+        self._keys.add(key)
+        self._signatures.append(signature)
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(index)
+
+    def _is_duplicate(self, key: str, signature: np.ndarray) -> bool:
+        if key in self._keys:
+            return True
+
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        return any(
+            np.mean(self._signatures[i] == signature) >= self.threshold
+            for i in candidates
+        )
+
+    def dedupe(self, papers: List[Dict[str, Any]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Drop duplicates and near-duplicates of papers already kept.
+
+        Papers kept by earlier calls on the same instance count as already
+        kept, so calling this once per blog section deduplicates across
+        sections. Pass an overfetched candidate list and `limit` so that
+        papers beyond the limit refill the slots of dropped duplicates.
+
+        Args:
+            papers: Paper dictionaries, best candidates first
+            limit: Maximum number of papers to keep
+
+        Returns:
+            Papers that are not duplicates, in their original order
+        """
+        kept = []
+        duplicates = 0
+        with self._lock:
+            for paper in papers:
+                if limit is not None and len(kept) >= limit:
+                    break
+
+                key = self.paper_key(paper)
+                signature = self.signature(paper)
+                if self._is_duplicate(key, signature):
+                    duplicates += 1
+                    continue
+
+                self._add(key, signature)
+                kept.append(paper)
+
+        if duplicates:
+            logger.info(f"Dropped {duplicates} duplicate papers")
+        return kept
+
+    def record(self, papers: List[Dict[str, Any]]):
+        """Add reported papers to the history, dated today.
+
+        Args:
+            papers: Paper dictionaries included in a saved blog
+        """
+        if self._conn is None or not papers:
+            return
+
+        rows = [
+            (self.paper_key(paper), self.signature(paper).tobytes(), self.today.isoformat())
+            for paper in papers
+        ]
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO seen (paper_key, signature, seen_on) "
+                        "VALUES (?, ?, ?)",
+                        rows
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not record paper history: {e}")
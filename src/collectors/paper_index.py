@@ -0,0 +1,278 @@
+"""Local full-text index over harvested research papers."""
+import math
+import pickle
+import re
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.logger import setup_logger
+from src.utils.config_loader import ConfigLoader
+from src.utils.harvest_state import to_utc
+
+
+logger = setup_logger("paper_index")
+
+STOPWORDS = {
+    'a', 'an', 'the', 'in', 'on', 'at', 'for', 'to', 'of', 'and', 'or', 'with',
+    'we', 'our', 'is', 'are', 'be', 'by', 'as', 'this', 'that', 'from', 'it',
+    'its', 'can', 'which', 'these', 'has', 'have', 'not', 'but', 'also', 'than'
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase index terms.
+
+    Plural forms are folded onto the singular ('images' -> 'image') so that
+    competition titles and abstracts meet halfway without a full stemmer.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms
+    """
+    terms = []
+    for word in re.findall(r'[a-z0-9]+', text.lower()):
+        if len(word) < 3 or word in STOPWORDS:
+            continue
+        if len(word) > 4 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+class PaperIndex:
+    """BM25 inverted index over papers, stored in a single SQLite file.
+
+    Papers are added incrementally as collectors harvest them; postings
+    live in a table clustered by term, so a lookup only reads the postings
+    of the query terms. Document lengths and dates are held in memory and
+    scores are computed with NumPy over the postings arrays, which are
+    cached per term until the next add.
+    """
+
+    def __init__(self, path: str, k1: float = 1.5, b: float = 0.75):
+        """Initialize paper index.
+
+        Args:
+            path: SQLite database file
+            k1: BM25 term frequency saturation
+            b: BM25 length normalization
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS papers ("
+                "doc_id INTEGER PRIMARY KEY, "
+                "paper_key TEXT NOT NULL UNIQUE, "
+                "published REAL NOT NULL, "
+                "length INTEGER NOT NULL, "
+                "data BLOB NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                "term TEXT NOT NULL, "
+                "doc_id INTEGER NOT NULL, "
+                "tf INTEGER NOT NULL, "
+                "PRIMARY KEY (term, doc_id)) WITHOUT ROWID"
+            )
+
+        # doc_id -> length / published, indexed directly by doc_id
+        self._lengths = np.zeros(1, dtype=np.float64)
+        self._published_at = np.zeros(1, dtype=np.float64)
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._doc_count = 0
+        self._total_length = 0.0
+        self._load_documents(self._conn.execute("SELECT doc_id, length, published FROM papers"))
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> Optional["PaperIndex"]:
+        """Create the index from the `cache.paper_index` config section.
+
+        Args:
+            config: Configuration loader instance
+
+        Returns:
+            PaperIndex, or None if the index is not enabled
+        """
+        settings = config.get('cache.paper_index', {})
+        if not isinstance(settings, dict) or not settings.get('enabled', False):
+            return None
+
+        cache_dir = config.get('cache.dir', '.cache')
+        try:
+            return cls(Path(cache_dir) / "paper_index.sqlite")
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not open paper index in {cache_dir}: {e}")
+            return None
+
+    def __len__(self) -> int:
+        return self._doc_count
+
+    def _load_documents(self, rows: Iterable[Tuple[int, int, float]]):
+        """Record document lengths and dates in the in-memory arrays."""
+        rows = list(rows)
+        if rows:
+            ids, lengths, published = (np.asarray(col) for col in zip(*rows))
+            size = int(ids.max()) + 1
+            if size > len(self._lengths):
+                grow = max(size, 2 * len(self._lengths)) - len(self._lengths)
+                self._lengths = np.concatenate([self._lengths, np.zeros(grow)])
+                self._published_at = np.concatenate([self._published_at, np.zeros(grow)])
+            self._lengths[ids] = lengths
+            self._published_at[ids] = published
+
+            self._doc_count += len(rows)
+            self._total_length += float(lengths.sum())
+
+    @staticmethod
+    def _published(paper: Dict[str, Any]) -> float:
+        """Publication time of a paper as a UTC timestamp (0 if unknown)."""
+        try:
+            return to_utc(datetime.fromisoformat(paper['published'])).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+
+    def add(self, papers: Iterable[Dict[str, Any]]) -> int:
+        """Index papers that are not in the index yet.
+
+        Args:
+            papers: Paper dictionaries with url, title, summary and published
+
+        Returns:
+            Number of papers added
+        """
+        papers = {p['url']: p for p in papers if p.get('url')}
+        if not papers:
+            return 0
+
+        with self._lock, self._conn:
+            keys = list(papers)
+            known = set()
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                known.update(
+                    key for (key,) in self._conn.execute(
+                        f"SELECT paper_key FROM papers WHERE paper_key IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    )
+                )
+
+            added = []
+            for key, paper in papers.items():
+                if key in known:
+                    continue
+
+                terms = Counter(tokenize(f"{paper.get('title', '')} {paper.get('summary', '')}"))
+                length = sum(terms.values())
+                published = self._published(paper)
+                cursor = self._conn.execute(
+                    "INSERT INTO papers (paper_key, published, length, data) VALUES (?, ?, ?, ?)",
+                    (key, published, length,
+                     sqlite3.Binary(pickle.dumps(paper, protocol=pickle.HIGHEST_PROTOCOL)))
+                )
+                self._conn.executemany(
+                    "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    [(term, cursor.lastrowid, tf) for term, tf in terms.items()]
+                )
+                added.append((cursor.lastrowid, length, published))
+
+            if added:
+                self._load_documents(added)
+                self._postings.clear()
+
+        if added:
+            logger.debug(f"Indexed {len(added)} new papers ({self._doc_count} total)")
+        return len(added)
+
+    def search(
+        self,
+        text: str,
+        limit: int = 3,
+        since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Find the papers that best match a text.
+
+        Ties are broken by newest publication first, so repeated lookups
+        return the same papers.
+
+        Args:
+            text: Query text (e.g. a competition title)
+            limit: Maximum number of papers
+            since: Only return papers published at or after this time
+
+        Returns:
+            List of paper dictionaries, best match first
+        """
+        terms = set(tokenize(text))
+        if not terms or not self._doc_count:
+            return []
+
+        avg_length = self._total_length / self._doc_count
+        hit_ids, hit_scores = [], []
+
+        with self._lock:
+            for term in sorted(terms):
+                doc_ids, tfs = self._term_postings(term)
+                if not len(doc_ids):
+                    continue
+
+                df = len(doc_ids)
+                idf = math.log(1 + (self._doc_count - df + 0.5) / (df + 0.5))
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_ids] / avg_length)
+                hit_ids.append(doc_ids)
+                hit_scores.append(idf * tfs * (self.k1 + 1) / (tfs + norm))
+
+            if not hit_ids:
+                return []
+
+            # Sum per-term scores for each document
+            doc_ids, inverse = np.unique(np.concatenate(hit_ids), return_inverse=True)
+            doc_scores = np.bincount(inverse, weights=np.concatenate(hit_scores))
+            published = self._published_at[doc_ids]
+            if since is not None:
+                recent = published >= to_utc(since).timestamp()
+                doc_ids, doc_scores, published = doc_ids[recent], doc_scores[recent], published[recent]
+
+            # Highest score first, then newest, then most recently indexed
+            order = np.lexsort((-doc_ids, -published, -doc_scores))[:limit]
+            best = doc_ids[order].tolist()
+            if not best:
+                return []
+
+            rows = dict(self._conn.execute(
+                f"SELECT doc_id, data FROM papers WHERE doc_id IN ({','.join('?' * len(best))})",
+                best
+            ).fetchall())
+
+        return [pickle.loads(rows[doc_id]) for doc_id in best]
+
+    def _term_postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (doc_ids, term frequencies) for a term, cached until the next add.
+
+        Args:
+            term: Index term
+
+        Returns:
+            Tuple of doc_id and tf arrays
+        """
+        if term not in self._postings:
+            rows = self._conn.execute(
+                "SELECT doc_id, tf FROM postings WHERE term = ?", (term,)
+            ).fetchall()
+            doc_ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+            tfs = np.fromiter((r[1] for r in rows), dtype=np.float64, count=len(rows))
+            self._postings[term] = (doc_ids, tfs)
+        return self._postings[term]
@@ -0,0 +1,194 @@
+"""Local store of GitHub repository metadata and star history."""
+import json
+import sqlite3
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.utils.logger import setup_logger
+from src.utils.config_loader import ConfigLoader
+
+
+logger = setup_logger("repo_store")
+
+
+class RepoStore:
+    """Repository metadata kept across runs, keyed by `full_name`.
+
+    Each repository is stored with its `pushed_at` watermark. Searches only
+    need to return names, star counts and push times: repositories whose
+    push time has not moved are served from the store, and only new or
+    pushed repositories need their metadata fetched again. Every
+    observation also records the star count for the day, so star growth
+    over a window is a local query.
+    """
+
+    def __init__(self, path: str, history_days: int = 90, today: Optional[date] = None):
+        """Initialize repository store.
+
+        Args:
+            path: SQLite database file
+            history_days: Days of star history to keep
+            today: Date of this run (defaults to today)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.today = today or date.today()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS repos ("
+                "full_name TEXT PRIMARY KEY, "
+                "pushed_at TEXT, "
+                "stars INTEGER NOT NULL, "
+                "refreshed_on TEXT NOT NULL, "
+                "data TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS star_history ("
+                "full_name TEXT NOT NULL, "
+                "observed_on TEXT NOT NULL, "
+                "stars INTEGER NOT NULL, "
+                "PRIMARY KEY (full_name, observed_on)) WITHOUT ROWID"
+            )
+            oldest = (self.today - timedelta(days=history_days)).isoformat()
+            self._conn.execute("DELETE FROM star_history WHERE observed_on < ?", (oldest,))
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader) -> Optional["RepoStore"]:
+        """Create the store from the `cache.repo_store` config section.
+
+        Args:
+            config: Configuration loader instance
+
+        Returns:
+            RepoStore, or None if the store is not enabled
+        """
+        settings = config.get('cache.repo_store', {})
+        if not isinstance(settings, dict) or not settings.get('enabled', False):
+            return None
+
+        cache_dir = config.get('cache.dir', '.cache')
+        try:
+            return cls(
+                Path(cache_dir) / "repo_store.sqlite",
+                history_days=settings.get('history_days', 90)
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not open repository store in {cache_dir}: {e}")
+            return None
+
+    def _select(self, sql: str, names: List[str], *params: Any) -> List[tuple]:
+        """Run a query with an `IN ({names})` placeholder, in chunks."""
+        rows = []
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            rows.extend(self._conn.execute(
+                sql.format(names=','.join('?' * len(chunk))), (*chunk, *params)
+            ).fetchall())
+        return rows
+
+    def get(self, full_names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up stored repositories.
+
+        Args:
+            full_names: Repository names ('owner/name')
+
+        Returns:
+            Dictionary mapping each known name to its repository dictionary
+        """
+        names = list(dict.fromkeys(full_names))
+        if not names:
+            return {}
+        with self._lock:
+            rows = self._select("SELECT full_name, data FROM repos WHERE full_name IN ({names})", names)
+        return {name: json.loads(data) for name, data in rows}
+
+    def stale(self, pushed: Dict[str, Optional[str]]) -> List[str]:
+        """Find repositories that are unknown or were pushed since they were stored.
+
+        Args:
+            pushed: Dictionary mapping repository name to its current push time
+
+        Returns:
+            Names whose metadata needs to be fetched
+        """
+        names = list(pushed)
+        if not names:
+            return []
+        with self._lock:
+            stored = dict(self._select(
+                "SELECT full_name, pushed_at FROM repos WHERE full_name IN ({names})", names
+            ))
+        return [name for name in names if name not in stored or stored[name] != pushed[name]]
+
+    def upsert(self, repos: Iterable[Dict[str, Any]]):
+        """Store repositories and record today's star counts.
+
+        Args:
+            repos: Repository dictionaries with full_name, stars and pushed_at
+        """
+        today = self.today.isoformat()
+        rows = {
+            repo['full_name']: repo for repo in repos
+            if repo.get('full_name') and repo['full_name'] != 'Unknown'
+        }
+        if not rows:
+            return
+
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO repos (full_name, pushed_at, stars, refreshed_on, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(name, repo.get('pushed_at'), int(repo.get('stars') or 0), today, json.dumps(repo))
+                     for name, repo in rows.items()]
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO star_history (full_name, observed_on, stars) VALUES (?, ?, ?)",
+                    [(name, today, int(repo.get('stars') or 0)) for name, repo in rows.items()]
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store repositories: {e}")
+
+    def star_deltas(self, full_names: Iterable[str], days: int = 7) -> Dict[str, int]:
+        """Stars gained over the last days, from the recorded history.
+
+        The gain is measured from the oldest observation inside the window
+        to the newest one; repositories observed on a single day only have
+        no delta yet.
+
+        Args:
+            full_names: Repository names
+            days: Window in days
+
+        Returns:
+            Dictionary mapping repository name to stars gained
+        """
+        names = list(dict.fromkeys(full_names))
+        if not names:
+            return {}
+
+        since = (self.today - timedelta(days=days)).isoformat()
+        with self._lock:
+            rows = self._select(
+                "SELECT full_name, observed_on, stars FROM star_history "
+                "WHERE full_name IN ({names}) AND observed_on >= ? "
+                "ORDER BY full_name, observed_on",
+                names, since
+            )
+
+        first: Dict[str, tuple] = {}
+        last: Dict[str, tuple] = {}
+        for name, observed_on, stars in rows:
+            first.setdefault(name, (observed_on, stars))
+            last[name] = (observed_on, stars)
+
+        return {
+            name: last[name][1] - first[name][1]
+            for name in first
+            if last[name][0] > first[name][0]
+        }
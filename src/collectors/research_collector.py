@@ -1,27 +1,54 @@
 """Research paper collector from arXiv and Papers with Code."""
+import re
+import threading
 import arxiv
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
-import requests
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 
 from src.utils.logger import setup_logger
 from src.utils.config_loader import ConfigLoader
+from src.utils.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from src.utils.harvest_state import HarvestState, harvest
+from src.utils.http_transport import HttpTransport
+from src.collectors.arxiv_query_planner import ArxivQueryPlanner, PaperRequest
+from src.collectors.paper_index import PaperIndex
 
 
 logger = setup_logger("research_collector")
 
+# Summaries are kept in full for routing and shortened when returned
+SUMMARY_CHARS = 500
+
 
 class ResearchCollector:
     """Collect research papers from various sources."""
 
-    def __init__(self, config: ConfigLoader):
+    STOPWORDS = {'a', 'an', 'the', 'in', 'on', 'at', 'for', 'to', 'of', 'and', 'or', 'with'}
+
+    def __init__(self, config: ConfigLoader, transport: Optional[HttpTransport] = None):
         """Initialize research collector.
 
         Args:
             config: Configuration loader instance
+            transport: Shared HTTP transport (created from config if omitted)
         """
         self.config = config
+        self.transport = transport or HttpTransport.from_config(config)
         self.arxiv_client = arxiv.Client()
+        # arxiv.Client has no session argument; its private session (arxiv
+        # 2.1, pinned in requirements.txt) is replaced by the pooled one
+        if hasattr(self.arxiv_client, '_session'):
+            self.arxiv_client._session = self.transport.session('arxiv')
+        else:
+            logger.warning("arxiv.Client has no _session attribute; arXiv requests use the client's own session")
+        self.harvest_state = HarvestState.from_config(config, 'arxiv_harvest')
+        self.breakers = CircuitBreakerRegistry.from_config(config)
+        self.planner = ArxivQueryPlanner.from_config(config)
+
+        # Every harvested paper is indexed locally for competition matching
+        self.paper_index = PaperIndex.from_config(config)
+        self._index_lock = threading.Lock()
+        self._index_refreshed = False
 
     def search_arxiv_papers(
         self,
@@ -36,6 +63,33 @@ class ResearchCollector:
             max_results: Maximum number of papers
             days_lookback: Number of days to look back (default 30 for better coverage)
 
+        Returns:
+            List of paper dictionaries
+        """
+        papers = self._search_arxiv(query, max_results, days_lookback, max_results * 3)
+        return [self._shorten_summary(paper) for paper in papers]
+
+    def _search_arxiv(
+        self,
+        query: str,
+        max_results: int,
+        days_lookback: int,
+        max_fetch: int,
+        clauses: Optional[Dict[str, Tuple[int, Callable[[Dict[str, Any]], bool]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Run one arXiv search, returning papers with full summaries.
+
+        While the arXiv circuit is open, papers stored by earlier harvests
+        of the query are returned instead.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of papers
+            days_lookback: Number of days to look back
+            max_fetch: Maximum number of results requested from arXiv
+            clauses: Clauses of a combined query (see ArxivQueryPlanner.clauses),
+                under which its papers are harvested
+
         Returns:
             List of paper dictionaries
         """
@@ -45,49 +99,33 @@ class ResearchCollector:
             # Build search query
             search = arxiv.Search(
                 query=query,
-                max_results=max_results * 3,  # Get more to allow for filtering
+                max_results=max_fetch,  # Get more to allow for filtering
                 sort_by=arxiv.SortCriterion.SubmittedDate,
                 sort_order=arxiv.SortOrder.Descending
             )
 
-            papers = []
-            cutoff_date = datetime.now() - timedelta(days=days_lookback)
-            processed_count = 0
-
-            for result in self.arxiv_client.results(search):
-                processed_count += 1
-
-                # Try to filter by date, but be flexible if date is missing
-                try:
-                    if hasattr(result, 'published') and result.published < cutoff_date:
-                        continue
-                except Exception as date_error:
-                    logger.debug(f"Error checking paper date: {date_error}")
-                    # Continue anyway if we can't check the date
-
-                try:
-                    paper_dict = {
-                        'title': result.title if hasattr(result, 'title') else 'Untitled',
-                        'authors': [author.name for author in result.authors] if hasattr(result, 'authors') else ['Unknown'],
-                        'summary': result.summary[:500] if hasattr(result, 'summary') else 'No summary available',
-                        'url': result.entry_id if hasattr(result, 'entry_id') else '',
-                        'pdf_url': result.pdf_url if hasattr(result, 'pdf_url') else '',
-                        'published': result.published.isoformat() if hasattr(result, 'published') else datetime.now().isoformat(),
-                        'categories': result.categories if hasattr(result, 'categories') else [],
-                        'primary_category': result.primary_category if hasattr(result, 'primary_category') else 'cs.LG'
-                    }
-                    papers.append(paper_dict)
-
-                    if len(papers) >= max_results:
-                        break
-                except Exception as paper_error:
-                    logger.debug(f"Error processing paper: {paper_error}")
-                    continue
-
-                # Prevent infinite loops
-                if processed_count >= max_results * 5:
-                    logger.warning(f"Processed {processed_count} papers, stopping search")
-                    break
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_lookback)
+
+            # Only results newer than the last run are fetched and converted
+            try:
+                papers = self.breakers.get('arxiv').call(
+                    harvest,
+                    self.arxiv_client.results(search),
+                    cutoff=cutoff_date,
+                    limit=max_results,
+                    identify=self._identify_paper,
+                    convert=self._to_paper_dict,
+                    state=self.harvest_state,
+                    query=query,
+                    clauses=clauses
+                )
+            except CircuitOpenError as e:
+                papers = self._stored_papers(query, cutoff_date, clauses)[:max_results]
+                logger.info(f"Skipping arXiv search ({e}); {len(papers)} stored papers served")
+                return papers
+
+            if self.paper_index is not None:
+                self.paper_index.add(papers)
 
             logger.info(f"Found {len(papers)} papers on arXiv from last {days_lookback} days")
             return papers
@@ -96,6 +134,124 @@ class ResearchCollector:
             logger.error(f"Error searching arXiv: {type(e).__name__}: {e}")
             return []
 
+    def _stored_papers(
+        self,
+        query: str,
+        cutoff: datetime,
+        clauses: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get papers stored by earlier harvests of a query or of its clauses.
+
+        Args:
+            query: Search query
+            cutoff: Oldest publication time of interest
+            clauses: Clauses of a combined query
+
+        Returns:
+            List of paper dictionaries, newest first
+        """
+        if self.harvest_state is None:
+            return []
+        if clauses and len(clauses) > 1:
+            return self.harvest_state.stored_any(list(clauses), cutoff)
+        return self.harvest_state.stored(query, cutoff)
+
+    @staticmethod
+    def _identify_paper(result: arxiv.Result) -> tuple:
+        """Get the identifier and submission time of an arXiv result.
+
+        Args:
+            result: arXiv search result
+
+        Returns:
+            Tuple of (entry id, published datetime)
+        """
+        published = getattr(result, 'published', None)
+        if not isinstance(published, datetime):
+            # Keep results without a usable date rather than dropping them
+            published = datetime.now(timezone.utc)
+        return getattr(result, 'entry_id', ''), published
+
+    @staticmethod
+    def _to_paper_dict(result: arxiv.Result) -> Optional[Dict[str, Any]]:
+        """Convert an arXiv result to a paper dictionary.
+
+        Args:
+            result: arXiv search result
+
+        Returns:
+            Paper dictionary, or None if the result cannot be processed
+        """
+        try:
+            return {
+                'title': result.title if hasattr(result, 'title') else 'Untitled',
+                'authors': [author.name for author in result.authors] if hasattr(result, 'authors') else ['Unknown'],
+                'summary': result.summary if hasattr(result, 'summary') else 'No summary available',
+                'url': result.entry_id if hasattr(result, 'entry_id') else '',
+                'pdf_url': result.pdf_url if hasattr(result, 'pdf_url') else '',
+                'published': result.published.isoformat() if hasattr(result, 'published') else datetime.now().isoformat(),
+                'categories': result.categories if hasattr(result, 'categories') else [],
+                'primary_category': result.primary_category if hasattr(result, 'primary_category') else 'cs.LG'
+            }
+        except Exception as paper_error:
+            logger.debug(f"Error processing paper: {paper_error}")
+            return None
+
+    @staticmethod
+    def _shorten_summary(paper: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of a paper with its summary cut to SUMMARY_CHARS.
+
+        Args:
+            paper: Paper dictionary
+
+        Returns:
+            Paper dictionary
+        """
+        return {**paper, 'summary': paper.get('summary', '')[:SUMMARY_CHARS]}
+
+    def search_planned(
+        self,
+        requests: List[PaperRequest],
+        days_lookback: int
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+        """Serve many paper requests with a few combined arXiv queries.
+
+        Requests are batched into OR queries by the planner and the results
+        are routed back on the client side. A request left short by a batch
+        that hit its fetch limit (so matching papers may have been cut off)
+        falls back to its own query.
+
+        Args:
+            requests: Paper requests
+            days_lookback: Number of days to look back
+
+        Returns:
+            Dictionary mapping request key to its papers
+        """
+        routed: Dict[Any, List[Dict[str, Any]]] = {request.key: [] for request in requests}
+
+        for batch in self.planner.plan(requests):
+            fetch_size = self.planner.fetch_size(batch)
+            papers = self._search_arxiv(
+                self.planner.combined_query(batch), fetch_size, days_lookback, fetch_size,
+                clauses=self.planner.clauses(batch)
+            )
+            routed.update(self.planner.route(papers, batch))
+
+            if len(papers) < fetch_size:
+                continue
+            for request in batch:
+                if len(routed[request.key]) < request.limit:
+                    logger.debug(f"Combined query saturated, querying {request.key!r} alone")
+                    routed[request.key] = self._search_arxiv(
+                        request.clause, request.limit, days_lookback, request.limit * 3
+                    )
+
+        return {
+            key: [self._shorten_summary(paper) for paper in papers]
+            for key, papers in routed.items()
+        }
+
     def get_ml_papers_by_topic(self, topic: str) -> List[Dict[str, Any]]:
         """Get ML papers by specific topic.
 
@@ -120,14 +276,68 @@ class ResearchCollector:
         Returns:
             List of paper dictionaries
         """
-        logger.info(f"Searching papers for competition: {competition_title}")
+        return self.get_papers_for_competitions([competition_title])[competition_title]
+
+    def get_papers_for_competitions(
+        self,
+        competition_titles: List[str],
+        max_results: int = 3
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get relevant papers for several competitions.
 
-        # Extract key terms from competition title
-        keywords = self._extract_keywords(competition_title)
-        query = " ".join(keywords[:3]) + " machine learning"
+        With the local paper index enabled, papers are ranked from the index
+        (refreshed once per run); otherwise combined arXiv queries are used.
+
+        Args:
+            competition_titles: Competition titles
+            max_results: Maximum papers per competition
 
+        Returns:
+            Dictionary mapping competition title to its papers
+        """
+        logger.info(f"Searching papers for {len(competition_titles)} competitions")
         days_lookback = self.config.get('research.days_lookback', 30)
-        return self.search_arxiv_papers(query, max_results=3, days_lookback=days_lookback)
+
+        if self.paper_index is not None:
+            self.refresh_paper_index()
+            since = datetime.now(timezone.utc) - timedelta(days=days_lookback)
+            return {
+                title: [
+                    self._shorten_summary(paper)
+                    for paper in self.paper_index.search(title, max_results, since)
+                ]
+                for title in competition_titles
+            }
+
+        # Key terms from each competition title; all must appear in a paper
+        requests = [
+            PaperRequest(
+                key=title,
+                terms=self._extract_keywords(title)[:3] or ['machine', 'learning'],
+                limit=max_results
+            )
+            for title in competition_titles
+        ]
+        return self.search_planned(requests, days_lookback)
+
+    def refresh_paper_index(self):
+        """Add papers submitted since the last refresh to the local index.
+
+        One incremental sweep over research.relevant_categories; runs at
+        most once per collector instance.
+        """
+        with self._index_lock:
+            if self.paper_index is None or self._index_refreshed:
+                return
+            self._index_refreshed = True
+
+            categories = self.config.get('research.relevant_categories', ['cs.LG', 'cs.AI', 'cs.CV'])
+            days_lookback = self.config.get('research.days_lookback', 30)
+            max_results = self.config.get('research.index_refresh_max_results', 1000)
+
+            query = " OR ".join(f"cat:{category}" for category in categories)
+            self._search_arxiv(query, max_results, days_lookback, max_results)
+            logger.info(f"Paper index holds {len(self.paper_index)} papers")
 
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract important keywords from text.
@@ -138,11 +348,10 @@ class ResearchCollector:
         Returns:
             List of keywords
         """
-        # Simple keyword extraction (could be improved with NLP)
-        stopwords = {'a', 'an', 'the', 'in', 'on', 'at', 'for', 'to', 'of', 'and', 'or', 'with'}
-
-        words = text.lower().split()
-        keywords = [w for w in words if w not in stopwords and len(w) > 3]
+        # Simple keyword extraction (could be improved with NLP); punctuation
+        # is dropped so the words can be used directly in arXiv queries
+        words = re.findall(r'[a-z0-9]+', text.lower())
+        keywords = list(dict.fromkeys(w for w in words if w not in self.STOPWORDS and len(w) > 3))
 
         return keywords
 
@@ -178,17 +387,15 @@ class ResearchCollector:
 
         logger.info(f"Fetching latest ML research from {len(categories)} categories")
 
-        # Search across multiple categories
-        all_papers = []
-
-        for category in categories[:3]:  # Limit to top 3 categories
-            query = f"cat:{category}"
-            papers = self.search_arxiv_papers(query, max_results=3, days_lookback=days_lookback)
-            all_papers.extend(papers)
-
-            # Early exit if we have enough papers
-            if len(all_papers) >= max_papers:
-                break
+        # One combined query across the categories, routed back per category
+        categories = categories[:3]  # Limit to top 3 categories
+        per_category = max(3, -(-max_papers // max(1, len(categories))))
+        requests = [
+            PaperRequest(key=category, categories=[category], limit=per_category)
+            for category in categories
+        ]
+        routed = self.search_planned(requests, days_lookback)
+        all_papers = [paper for papers in routed.values() for paper in papers]
 
         if not all_papers:
             # Fallback: try a broader search if category search fails
@@ -7,6 +7,8 @@ import google.generativeai as genai
 
 from src.utils.logger import setup_logger
 from src.utils.config_loader import ConfigLoader
+from src.utils.disk_cache import DiskCache
+from src.utils.retry import Retrier, RetryPolicy, is_auth_error
 
 logger = setup_logger("agi_report_generator")
 
@@ -21,6 +23,7 @@ class AGIResearchReportGenerator:
             config: Configuration loader instance
         """
         self.config = config
+        self.response_cache = DiskCache.from_config(config, 'gemini')
 
         # Configure Gemini API
         api_key = config.get_env('GEMINI_API_KEY')
@@ -34,6 +37,7 @@ class AGIResearchReportGenerator:
 
         try:
             self.model = genai.GenerativeModel(model_name)
+            self.model_name = model_name
             logger.info(f"AGI Report Generator initialized with model: {model_name}")
         except Exception as e:
             logger.error(f"Failed to initialize model: {e}")
@@ -325,42 +329,53 @@ Be specific and actionable. Format as markdown with clear sections.
         return '\n'.join(formatted)
 
     def _generate_with_retry(self, prompt: str) -> str:
-        """Generate content with retry logic."""
+        """Generate content with retry logic (jittered backoff, permanent errors not retried)."""
         max_retries = self.config.get('gemini.retry_attempts', 3)
         retry_delay = self.config.get('gemini.retry_delay', 2)
+        generation_config = {
+            'temperature': self.config.get('gemini.temperature', 0.7),
+            'max_output_tokens': self.config.get('gemini.max_tokens', 8000),
+        }
 
-        for attempt in range(max_retries):
-            try:
-                generation_config = {
-                    'temperature': self.config.get('gemini.temperature', 0.7),
-                    'max_output_tokens': self.config.get('gemini.max_tokens', 8000),
-                }
-
-                response = self.model.generate_content(
-                    prompt,
-                    generation_config=generation_config
-                )
-
-                if response and hasattr(response, 'text') and response.text:
-                    return response.text
-                else:
-                    raise ValueError("Empty response from Gemini API")
-
-            except Exception as e:
-                error_msg = str(e)
-                logger.warning(f"Generation attempt {attempt + 1}/{max_retries} failed: {error_msg}")
-
-                if "API key" in error_msg or "authentication" in error_msg.lower():
-                    logger.error("Authentication error - check GEMINI_API_KEY")
-                    return "[Content generation failed: Authentication error]"
-
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (attempt + 1))
-                else:
-                    logger.error(f"All {max_retries} generation attempts failed")
-                    return f"[Content generation failed: {error_msg}]"
-
-        return "[Content generation failed]"
+        # Identical prompts for the same model and settings are served from disk
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = DiskCache.make_key(self.model_name, generation_config, prompt)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Content served from response cache")
+                return cached
+
+        def attempt() -> str:
+            response = self.model.generate_content(
+                prompt,
+                generation_config=generation_config
+            )
+            if response and hasattr(response, 'text') and response.text:
+                return response.text
+            raise ValueError("Empty response from Gemini API")
+
+        retrier = Retrier(
+            RetryPolicy(
+                max_attempts=max_retries,
+                base_delay=retry_delay,
+                max_delay=self.config.get('gemini.max_retry_delay', 60),
+                deadline=self.config.get('gemini.retry_deadline', 180)
+            ),
+            name="AGI report generation",
+            sleep=time.sleep
+        )
+        try:
+            text = retrier.call(attempt)
+        except Exception as e:
+            if is_auth_error(e):
+                logger.error("Authentication error - check GEMINI_API_KEY")
+                return "[Content generation failed: Authentication error]"
+            return f"[Content generation failed: {e}]"
+
+        if cache_key is not None:
+            self.response_cache.set(cache_key, text)
+        return text
 
     def format_report_markdown(self, report: Dict[str, Any]) -> str:
         """Format report as markdown."""
@@ -8,13 +8,20 @@ from jinja2 import Environment, FileSystemLoader
 from src.collectors.kaggle_collector import KaggleCollector
 from src.collectors.github_collector import GitHubCollector
 from src.collectors.research_collector import ResearchCollector
+from src.collectors.paper_dedup import PaperDeduplicator
 from src.generators.gemini_generator import GeminiGenerator
+from src.utils.http_transport import HttpTransport
+from src.utils.run_checkpoint import RunCheckpoint
+from src.utils.task_pool import TaskPool
 from src.utils.logger import setup_logger
 from src.utils.config_loader import ConfigLoader
 
 
 logger = setup_logger("blog_generator")
 
+# Prefix of the placeholder text of a section whose generation failed
+FAILED_SECTION = "[Content generation failed"
+
 
 class BlogGenerator:
     """Orchestrate blog generation process."""
@@ -27,10 +34,11 @@ class BlogGenerator:
         """
         self.config = config
 
-        # Initialize collectors
-        self.kaggle_collector = KaggleCollector(config)
-        self.github_collector = GitHubCollector(config)
-        self.research_collector = ResearchCollector(config)
+        # Initialize collectors; they share one pool of keep-alive connections
+        self.transport = HttpTransport.from_config(config)
+        self.kaggle_collector = KaggleCollector(config, transport=self.transport)
+        self.github_collector = GitHubCollector(config, transport=self.transport)
+        self.research_collector = ResearchCollector(config, transport=self.transport)
 
         # Initialize AI generator
         self.gemini_generator = GeminiGenerator(config)
@@ -39,29 +47,51 @@ class BlogGenerator:
         template_dir = Path(__file__).parent.parent.parent / "templates"
         self.jinja_env = Environment(loader=FileSystemLoader(str(template_dir)))
 
+        # Completed stages of today's run, so a retry resumes where it failed
+        self.checkpoint = RunCheckpoint.from_config(config)
+        self._failed_sources = []
+
         logger.info("Blog generator initialized")
 
-    def generate_daily_blog(self) -> Dict[str, str]:
+    def generate_daily_blog(self, fresh: bool = False) -> Dict[str, str]:
         """Generate daily blog content.
 
+        Args:
+            fresh: Ignore stages checkpointed earlier today and start over
+
         Returns:
             Dictionary with 'markdown' and 'html' content
         """
         logger.info("Starting daily blog generation...")
 
-        # Collect data
-        data = self._collect_all_data()
+        if fresh and self.checkpoint is not None:
+            logger.info("Fresh run requested; discarding today's checkpoints")
+            self.checkpoint.clear()
+
+        # Collect data; a collection with failed sources is not checkpointed
+        # so a retry collects them again
+        data = self._run_stage('data', self._collect_all_data,
+                               keep=lambda _: not self._failed_sources)
 
-        # Generate content sections
+        # Generate content sections (checkpointed one by one)
         sections = self._generate_sections(data)
 
-        # Render blog
+        # Render blog (cheap, so it is not checkpointed)
         markdown_content = self._render_markdown(sections, data)
         html_content = self._render_html(sections, data)
 
         # Save blog
         file_paths = self._save_blog(markdown_content, html_content)
 
+        # Only papers of a saved blog count as reported on later days
+        PaperDeduplicator.from_config(self.config).record(
+            data['research_papers'] + data['latest_ml_papers']
+        )
+
+        # The day's blog is done; a later run today starts from scratch
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+
         logger.info(f"Blog generated successfully: {file_paths}")
 
         return {
@@ -70,6 +100,21 @@ class BlogGenerator:
             'paths': file_paths
         }
 
+    def _run_stage(self, stage: str, func, keep=None):
+        """Run a pipeline stage, or load its output if it completed earlier today.
+
+        Args:
+            stage: Stage name
+            func: Callable producing the stage output
+            keep: Decides whether the output is complete enough to checkpoint
+
+        Returns:
+            Stage output
+        """
+        if self.checkpoint is None:
+            return func()
+        return self.checkpoint.run(stage, func, keep=keep)
+
     def _collect_all_data(self) -> Dict[str, Any]:
         """Collect all required data.
 
@@ -83,45 +128,85 @@ class BlogGenerator:
             'competitions': [],
             'new_competitions': [],
             'leaderboards': {},
+            'leaderboard_changes': {},
             'kernels': {},
             'github_repos': [],
             'research_papers': [],
             'latest_ml_papers': []
         }
 
-        # Get competitions
+        # Get competitions (the listing is fetched once and shared for this run)
+        self.kaggle_collector.invalidate_competition_snapshot()
         all_comps = self.kaggle_collector.get_active_competitions()
         ranked_comps = self.kaggle_collector.rank_competitions(all_comps)
-        data['competitions'] = ranked_comps[:10]
-
-        # Get new competitions
-        data['new_competitions'] = self.kaggle_collector.get_new_competitions(days=1)
-
-        # Get leaderboards and kernels for top competitions
-        for comp in data['competitions'][:5]:  # Limit to top 5 to avoid rate limits
-            comp_id = comp['id']
-
-            # Leaderboard
-            leaderboard = self.kaggle_collector.get_competition_leaderboard(comp_id)
-            if leaderboard is not None:
-                data['leaderboards'][comp_id] = leaderboard
-
-            # Kernels
-            kernels = self.kaggle_collector.get_competition_kernels(comp_id, max_kernels=5)
-            data['kernels'][comp_id] = kernels
-
-        # Get GitHub repositories
-        for comp in data['competitions'][:3]:  # Top 3 competitions
-            repos = self.github_collector.search_repositories_by_algorithms(comp['title'])
-            data['github_repos'].extend(repos)
-
-        # Get research papers
-        for comp in data['competitions'][:3]:
-            papers = self.research_collector.get_papers_for_competition(comp['title'])
-            data['research_papers'].extend(papers)
-
-        # Get latest ML research
-        data['latest_ml_papers'] = self.research_collector.get_latest_ml_research(max_papers=5)
+        data['competitions'] = ranked_comps[:self.config.get('competition_selection.top_n', 10)]
+
+        # Duplicate papers are dropped before the paper lists are cut to
+        # size, so extra candidates are collected to refill their slots
+        dedup = PaperDeduplicator.from_config(self.config)
+        papers_per_competition = 3
+        max_ml_papers = 5
+        research_by_competition = {}
+
+        # The remaining calls only depend on the ranked list, so fan them out
+        # and merge the results back in submission order.
+        with TaskPool.from_config(self.config, 'data_collection.concurrency') as pool:
+            pool.submit('kaggle', ('new_competitions', None),
+                        self.kaggle_collector.get_new_competitions, days=1)
+
+            # Get leaderboards and kernels for top competitions
+            for comp in data['competitions'][:5]:  # Limit to top 5 to avoid rate limits
+                comp_id = comp['id']
+                pool.submit('kaggle', ('leaderboard', comp_id),
+                            self.kaggle_collector.get_competition_leaderboard, comp_id)
+                pool.submit('kaggle', ('kernels', comp_id),
+                            self.kaggle_collector.get_competition_kernels, comp_id, max_kernels=5)
+
+            # Get GitHub repositories and research papers for top 3 competitions
+            # Repositories for all three competitions come from one batched search
+            pool.submit('github', ('github_repos', None),
+                        self.github_collector.search_repositories_for_competitions,
+                        [comp['title'] for comp in data['competitions'][:3]])
+            # Papers for all three competitions come from one combined arXiv query
+            pool.submit('arxiv', ('research_papers', None),
+                        self.research_collector.get_papers_for_competitions,
+                        [comp['title'] for comp in data['competitions'][:3]],
+                        papers_per_competition * dedup.overfetch)
+
+            # Get latest ML research
+            pool.submit('arxiv', ('latest_ml_papers', None),
+                        self.research_collector.get_latest_ml_research,
+                        max_papers=max_ml_papers * dedup.overfetch)
+
+            results = pool.results()
+
+        # Tasks that raised (or found nothing) come back as None
+        self._failed_sources = [key for key, result in results if result is None]
+        if self._failed_sources:
+            logger.warning(f"Data collection incomplete; failed: {self._failed_sources}")
+
+        for (kind, comp_id), result in results:
+            if kind == 'leaderboard':
+                if result is not None:
+                    data['leaderboards'][comp_id] = result
+                    changes = self.kaggle_collector.get_leaderboard_changes(comp_id)
+                    if changes is not None:
+                        data['leaderboard_changes'][comp_id] = changes
+            elif kind == 'kernels':
+                data['kernels'][comp_id] = result or []
+            elif kind == 'research_papers':
+                research_by_competition = result or {}
+            elif kind == 'github_repos':
+                for items in (result or {}).values():
+                    data[kind].extend(items)
+            else:
+                data[kind] = result or []
+
+        # Collapse duplicate papers across sections and recent days before
+        # they reach the prompts; competition papers take precedence
+        for papers in research_by_competition.values():
+            data['research_papers'].extend(dedup.dedupe(papers, limit=papers_per_competition))
+        data['latest_ml_papers'] = dedup.dedupe(data['latest_ml_papers'], limit=max_ml_papers)
 
         logger.info("Data collection completed")
         return data
@@ -138,48 +223,88 @@ class BlogGenerator:
         logger.info("Generating content sections...")
 
         sections = {}
+        gemini = self.gemini_generator
+        top_comps = data['competitions'][:3]
+
+        # Sections completed by an earlier attempt today are loaded instead
+        # of being generated again
+        order = []
+        saved = {}
+
+        def submit(pool, key, func, *args):
+            order.append(key)
+            text = self.checkpoint.get(self._section_stage(key)) if self.checkpoint else None
+            if text is not None:
+                saved[key] = text
+            else:
+                pool.submit('gemini', key, func, *args)
+
+        # Every Gemini call is independent; the generator's shared rate limiter
+        # keeps the concurrent calls within quota.
+        max_concurrent = self.config.get('gemini.max_concurrent_requests', 4)
+        with TaskPool(max_workers=max_concurrent) as pool:
+            # Competition Overview
+            submit(pool, ('overview', None),
+                   gemini.generate_competition_overview, data['competitions'])
+
+            # Leaderboard Highlights
+            for comp in top_comps:
+                if comp['id'] in data['leaderboards']:
+                    submit(pool, ('leaderboard', comp['title']),
+                           gemini.generate_leaderboard_analysis,
+                           comp, data['leaderboards'][comp['id']],
+                           data.get('leaderboard_changes', {}).get(comp['id']))
+
+            # Algorithm Summaries
+            for comp in top_comps:
+                if comp['id'] in data['kernels'] and data['kernels'][comp['id']]:
+                    submit(pool, ('algorithms', comp['title']),
+                           gemini.generate_algorithm_summary,
+                           comp, data['kernels'][comp['id']])
+
+            # Research Papers
+            submit(pool, ('research', None),
+                   gemini.generate_research_summary, data['research_papers'])
+
+            # GitHub Repositories
+            submit(pool, ('github', None),
+                   gemini.generate_github_repos_summary, data['github_repos'])
+
+            # Predicted Trends
+            submit(pool, ('trends', None),
+                   gemini.predict_trends, data['competitions'])
+
+            # Latest ML Research
+            submit(pool, ('ml_research', None),
+                   gemini.generate_research_summary, data['latest_ml_papers'])
+
+            generated = dict(pool.results())
+
+        if saved:
+            logger.info(f"Resumed {len(saved)} of {len(order)} sections from today's checkpoint")
 
-        # Competition Overview
-        sections['overview'] = self.gemini_generator.generate_competition_overview(
-            data['competitions']
-        )
-
-        # Leaderboard Highlights
         leaderboard_analyses = []
-        for comp in data['competitions'][:3]:
-            comp_id = comp['id']
-            if comp_id in data['leaderboards']:
-                analysis = self.gemini_generator.generate_leaderboard_analysis(
-                    comp,
-                    data['leaderboards'][comp_id]
-                )
-                leaderboard_analyses.append(f"**{comp['title']}:**\n{analysis}")
-
-        sections['leaderboard'] = "\n\n".join(leaderboard_analyses) if leaderboard_analyses else "No leaderboard data available."
-
-        # Algorithm Summaries
         algorithm_summaries = []
-        for comp in data['competitions'][:3]:
-            comp_id = comp['id']
-            if comp_id in data['kernels'] and data['kernels'][comp_id]:
-                summary = self.gemini_generator.generate_algorithm_summary(
-                    comp,
-                    data['kernels'][comp_id]
-                )
-                algorithm_summaries.append(f"**{comp['title']}:**\n{summary}")
+        for key in order:
+            name, comp_title = key
+            text = saved.get(key)
+            if text is None:
+                text = generated.get(key)
+                if text is None:
+                    text = f"{FAILED_SECTION} for {name}]"
+                elif self.checkpoint and not text.startswith(FAILED_SECTION):
+                    self.checkpoint.save(self._section_stage(key), text)
+
+            if name == 'leaderboard':
+                leaderboard_analyses.append(f"**{comp_title}:**\n{text}")
+            elif name == 'algorithms':
+                algorithm_summaries.append(f"**{comp_title}:**\n{text}")
+            else:
+                sections[name] = text
 
+        sections['leaderboard'] = "\n\n".join(leaderboard_analyses) if leaderboard_analyses else "No leaderboard data available."
         sections['algorithms'] = "\n\n".join(algorithm_summaries) if algorithm_summaries else "No algorithm data available."
 
-        # Research Papers
-        sections['research'] = self.gemini_generator.generate_research_summary(
-            data['research_papers']
-        )
-
-        # GitHub Repositories
-        sections['github'] = self.gemini_generator.generate_github_repos_summary(
-            data['github_repos']
-        )
-
         # New Competitions
         if data['new_competitions']:
             new_comp_list = "\n".join([
@@ -190,19 +315,19 @@ class BlogGenerator:
         else:
             sections['new_competitions'] = "No new competitions launched in the last 24 hours."
 
-        # Predicted Trends
-        sections['trends'] = self.gemini_generator.predict_trends(
-            data['competitions']
-        )
-
-        # Latest ML Research
-        sections['ml_research'] = self.gemini_generator.generate_research_summary(
-            data['latest_ml_papers']
-        )
+        cache_stats = self.gemini_generator.cache_stats()
+        if cache_stats:
+            logger.info(f"Gemini response cache: {cache_stats}")
 
         logger.info("Content generation completed")
         return sections
 
+    @staticmethod
+    def _section_stage(key) -> str:
+        """Checkpoint stage name of a generated section."""
+        name, comp_title = key
+        return f"section:{name}:{comp_title or ''}"
+
     def _render_markdown(self, sections: Dict[str, str], data: Dict[str, Any]) -> str:
         """Render markdown blog.
 
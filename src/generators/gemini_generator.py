@@ -1,15 +1,26 @@
 """Google Gemini AI content generator."""
+import math
 import time
 from typing import Dict, Any, List
 import google.generativeai as genai
 
 from src.utils.logger import setup_logger
 from src.utils.config_loader import ConfigLoader
+from src.utils.rate_limiter import RateLimiter
+from src.utils.disk_cache import DiskCache
+from src.utils.retry import Retrier, RetryPolicy, is_auth_error, is_rate_limit
+from src.collectors import leaderboard_analytics
 
 
 logger = setup_logger("gemini_generator")
 
 
+def _config_number(config: ConfigLoader, key: str, default: Any) -> Any:
+    """Read a numeric config value, falling back to the default otherwise."""
+    value = config.get(key, default)
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
+
 class GeminiGenerator:
     """Generate content using Google Gemini AI."""
 
@@ -20,13 +31,15 @@ class GeminiGenerator:
             config: Configuration loader instance
         """
         self.config = config
-        self.last_request_time = 0  # Track last API call time for rate limiting
 
         # Configure Gemini API
         api_key = config.get_env('GEMINI_API_KEY')
         if not api_key:
             raise ValueError("GEMINI_API_KEY environment variable not set")
 
+        self.rate_limiter = self._create_rate_limiter(config)
+        self.response_cache = DiskCache.from_config(config, 'gemini')
+
         genai.configure(api_key=api_key)
 
         # Use stable Gemini model names
@@ -69,6 +82,8 @@ class GeminiGenerator:
                 # If all fallbacks fail, raise the original error
                 raise ValueError(f"Failed to initialize any Gemini model. Last error: {e}")
 
+        self.model_name = model_name
+
     def generate_competition_overview(
         self,
         competitions: List[Dict[str, Any]]
@@ -112,13 +127,15 @@ Requirements:
     def generate_leaderboard_analysis(
         self,
         competition: Dict[str, Any],
-        leaderboard_df: Any
+        leaderboard_df: Any,
+        changes: Any = None
     ) -> str:
         """Generate leaderboard analysis.
 
         Args:
             competition: Competition dictionary
             leaderboard_df: Leaderboard dataframe
+            changes: Movement since the previous snapshot (see LeaderboardStore.deltas)
 
         Returns:
             Generated analysis text
@@ -130,6 +147,12 @@ Requirements:
 
         # Get top teams
         top_teams = leaderboard_df.head(5).to_dict('records') if hasattr(leaderboard_df, 'head') else []
+        # Without a full download the leaderboard is only its top slice
+        try:
+            total_teams = int(competition.get('teamCount')) or None
+        except (TypeError, ValueError):
+            total_teams = None
+        summary = leaderboard_analytics.summarize(leaderboard_df, changes, total_teams)
 
         prompt = f"""
 Analyze the current leaderboard for the Kaggle competition: {competition['title']}
@@ -137,10 +160,12 @@ Analyze the current leaderboard for the Kaggle competition: {competition['title'
 Top 5 Teams:
 {self._format_leaderboard(top_teams)}
 
+{summary.to_prompt() if summary else ""}
+{self._format_leaderboard_changes(changes)}
 Generate a brief analysis covering:
 - Current leader and their score
-- Competition intensity (score gaps between teams)
-- Notable patterns or trends
+- Competition intensity (use the score gaps and cut-offs above)
+- Notable patterns or trends (use the movement and shake-up data if given; do not invent movement otherwise)
 - Keep it concise (1-2 paragraphs)
 """
 
@@ -298,6 +323,78 @@ Generate predictions covering:
 
         return self._generate_with_retry(prompt)
 
+    def _create_rate_limiter(self, config: ConfigLoader) -> RateLimiter:
+        """Create the shared rate limiter from the Gemini quota settings.
+
+        Args:
+            config: Configuration loader instance
+
+        Returns:
+            RateLimiter instance
+        """
+        requests_per_minute = _config_number(config, 'gemini.requests_per_minute', None)
+        if not requests_per_minute:
+            # Fall back to the legacy minimum spacing between calls
+            rate_limit_delay = _config_number(config, 'gemini.rate_limit_delay', 15)
+            requests_per_minute = 60 / rate_limit_delay if rate_limit_delay else 60
+
+        tokens_per_minute = _config_number(config, 'gemini.tokens_per_minute', None)
+        logger.info(f"Gemini rate limit: {requests_per_minute} requests/min, "
+                    f"{tokens_per_minute or 'unlimited'} tokens/min")
+        return RateLimiter(
+            requests_per_minute,
+            tokens_per_minute,
+            sleep=time.sleep,
+            burst=_config_number(config, 'gemini.burst', 1)
+        )
+
+    def _estimate_tokens(self, prompt: str) -> int:
+        """Estimate prompt tokens (roughly 4 characters per token).
+
+        Args:
+            prompt: Generation prompt
+
+        Returns:
+            Estimated token count
+        """
+        return len(prompt) // 4 + 1
+
+    def _cache_key(self, prompt: str):
+        """Build the response cache key for a prompt.
+
+        Args:
+            prompt: Generation prompt
+
+        Returns:
+            Cache key, or None when caching is disabled
+        """
+        if self.response_cache is None:
+            return None
+
+        generation_config = {
+            'temperature': self.config.get('gemini.temperature', 0.7),
+            'max_output_tokens': self.config.get('gemini.max_tokens', 8000),
+        }
+        return DiskCache.make_key(self.model_name, generation_config, prompt)
+
+    def _cache_response(self, cache_key, text: str):
+        """Store a successful response in the response cache.
+
+        Args:
+            cache_key: Key from _cache_key (None when caching is disabled)
+            text: Generated text
+        """
+        if cache_key is not None:
+            self.response_cache.set(cache_key, text)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get response cache statistics.
+
+        Returns:
+            Hit/miss statistics, or an empty dict when caching is disabled
+        """
+        return self.response_cache.stats() if self.response_cache is not None else {}
+
     def _format_leaderboard(self, teams: List[Dict[str, Any]]) -> str:
         """Format leaderboard data for prompt.
 
@@ -315,87 +412,130 @@ Generate predictions covering:
             for i, team in enumerate(teams)
         ])
 
+    def _format_leaderboard_changes(self, changes: Any, limit: int = 5) -> str:
+        """Format leaderboard movement for prompt.
+
+        Args:
+            changes: Dataframe from LeaderboardStore.deltas, or None
+            limit: Maximum teams listed per group
+
+        Returns:
+            Formatted section, or an empty string without movement data
+        """
+        if changes is None or getattr(changes, 'empty', True):
+            return ""
+
+        since = changes.attrs.get('start')
+        lines = [f"\nMovement since {since}:" if since else "\nMovement since the previous snapshot:"]
+
+        climbers = changes[changes['rank_change'] > 0].nlargest(limit, 'rank_change')
+        for team in climbers.to_dict('records'):
+            lines.append(
+                f"- {team['teamName']} climbed {int(team['rank_change'])} places to #{team['rank']}"
+            )
+
+        new_top = changes[changes['is_new'] & (changes['rank'] <= 50)].head(limit)
+        for team in new_top.to_dict('records'):
+            lines.append(f"- {team['teamName']} entered at #{team['rank']}")
+
+        leader_change = changes['score_change'].iloc[0]
+        if leader_change and not math.isnan(leader_change):
+            lines.append(f"- The leader's own score changed by {leader_change:+.5g}")
+
+        return "\n".join(lines) + "\n" if len(lines) > 1 else ""
+
     def _generate_with_retry(self, prompt: str) -> str:
         """Generate content with retry logic and rate limit handling.
 
+        Transient failures are retried with jittered exponential backoff,
+        honouring the delay the API asks for on quota errors, until
+        `gemini.retry_attempts` or `gemini.retry_deadline` runs out.
+        Authentication and other permanent errors are not retried.
+
         Args:
             prompt: Generation prompt
 
         Returns:
             Generated text
         """
-        max_retries = self.config.get('gemini.retry_attempts', 3)
-        retry_delay = self.config.get('gemini.retry_delay', 15)  # Default 15s for rate limits
-
-        # Rate limit tracking
-        rate_limit_delay = self.config.get('gemini.rate_limit_delay', 15)  # 15s between calls = 4 calls/minute (under 5/min limit)
-
-        last_error = None
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"Attempt {attempt + 1}/{max_retries} for content generation")
-
-                # Enforce rate limiting: ensure minimum delay between API calls
-                # Free tier: 5 requests per minute, so wait at least 15 seconds between calls
-                current_time = time.time()
-                time_since_last_request = current_time - self.last_request_time
-                if self.last_request_time > 0 and time_since_last_request < rate_limit_delay:
-                    wait_time = rate_limit_delay - time_since_last_request
-                    logger.info(f"Rate limiting: waiting {wait_time:.1f}s before next API call")
-                    time.sleep(wait_time)
-
-                # Make the API call
-                self.last_request_time = time.time()
-                response = self.model.generate_content(prompt)
-
-                # Check if response has text
-                if hasattr(response, 'text') and response.text:
-                    logger.debug(f"Content generated successfully on attempt {attempt + 1}")
-                    return response.text
-                elif hasattr(response, 'parts'):
-                    # Handle response with parts
-                    text = ''.join(part.text for part in response.parts if hasattr(part, 'text'))
-                    if text:
-                        logger.debug(f"Content generated from parts on attempt {attempt + 1}")
-                        return text
-                else:
-                    logger.warning(f"Response has no text content on attempt {attempt + 1}")
-                    last_error = "Response has no text content"
-
-            except AttributeError as e:
-                # Handle blocked content or missing text attribute
-                logger.warning(f"Generation attempt {attempt + 1} - AttributeError (possibly blocked content): {e}")
-                last_error = f"AttributeError: {str(e)}"
-
-            except Exception as e:
-                error_str = str(e)
-                logger.warning(f"Generation attempt {attempt + 1} failed: {type(e).__name__}: {e}")
-                last_error = f"{type(e).__name__}: {error_str}"
-
-                # Check if it's a rate limit error (ResourceExhausted or 429)
-                if 'ResourceExhausted' in str(type(e).__name__) or '429' in error_str or 'quota' in error_str.lower():
-                    # Extract retry delay from error message if available
-                    import re
-                    retry_match = re.search(r'retry in (\d+\.?\d*)s', error_str)
-                    if retry_match:
-                        suggested_delay = float(retry_match.group(1))
-                        logger.warning(f"Rate limit exceeded. API suggests waiting {suggested_delay}s")
-                        # Wait the suggested time plus a buffer
-                        sleep_time = suggested_delay + 5
-                    else:
-                        # Default: wait 60 seconds for rate limit reset
-                        sleep_time = 60
-
-                    logger.info(f"Rate limit hit. Waiting {sleep_time}s before retry...")
-                    if attempt < max_retries - 1:
-                        time.sleep(sleep_time)
-                    continue
+        # Identical prompts for the same model and settings are served from disk
+        cache_key = self._cache_key(prompt)
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Content served from response cache")
+                return cached
+
+        attempts = 0
+
+        def attempt() -> str:
+            nonlocal attempts
+            attempts += 1
+            logger.debug(f"Attempt {attempts} for content generation")
+
+            response = self.model.generate_content(prompt)
+            text = self._response_text(response)
+            if not text:
+                raise ValueError("Response has no text content")
+            return text
+
+        try:
+            # Every attempt waits for request and token quota, shared by all
+            # worker threads; that wait does not use up the retry deadline
+            tokens = self._estimate_tokens(prompt)
+            retrier = Retrier(
+                self._retry_policy(),
+                name="Gemini generation",
+                sleep=time.sleep,
+                acquire=lambda: self.rate_limiter.acquire(tokens)
+            )
+            text = retrier.call(attempt)
+        except Exception as e:
+            if is_auth_error(e):
+                reason = f"Authentication error ({e})"
+            elif is_rate_limit(e):
+                reason = f"Rate limit exceeded ({e})"
+            else:
+                reason = f"{type(e).__name__}: {e}"
+            logger.error(f"Content generation failed after {attempts} attempts: {reason}")
+            return f"[Content generation failed after {attempts} attempts. Error: {reason}]"
+
+        logger.debug(f"Content generated successfully on attempt {attempts}")
+        self._cache_response(cache_key, text)
+        return text
 
-            if attempt < max_retries - 1:
-                sleep_time = retry_delay * (attempt + 1)
-                logger.info(f"Retrying in {sleep_time} seconds...")
-                time.sleep(sleep_time)
+    def _retry_policy(self) -> RetryPolicy:
+        """Build the retry policy from the `gemini` config section.
 
-        # All attempts failed
-        logger.error(f"All {max_retries} generation attempts failed. Last error: {last_error}")
-        return f"[Content generation failed after {max_retries} attempts. Error: {last_error}]"
+        Returns:
+            RetryPolicy
+        """
+        def number(key, default):
+            value = self.config.get(key, default)
+            return value if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
+        base_delay = number('gemini.retry_delay', 5)
+        return RetryPolicy(
+            max_attempts=int(number('gemini.retry_attempts', 3)),
+            base_delay=base_delay,
+            max_delay=number('gemini.max_retry_delay', 60),
+            deadline=number('gemini.retry_deadline', 180),
+            rate_limit_delay=max(base_delay, number('gemini.rate_limit_retry_delay', base_delay))
+        )
+
+    @staticmethod
+    def _response_text(response: Any) -> str:
+        """Get the text of a response, joining its parts if needed.
+
+        Args:
+            response: Gemini response
+
+        Returns:
+            Generated text (empty if there is none)
+        """
+        if hasattr(response, 'text') and response.text:
+            return response.text
+        if hasattr(response, 'parts'):
+            # Handle response with parts
+            return ''.join(part.text for part in response.parts if hasattr(part, 'text'))
+        return ''
@@ -1,4 +1,5 @@
 """Main entry point for Kaggle daily blog generation."""
+import argparse
 import sys
 import traceback
 from pathlib import Path
@@ -15,8 +16,28 @@ from src.utils.error_handler import ErrorHandler
 logger = setup_logger("main")
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Args:
+        argv: Arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Generate the daily Kaggle blog")
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help="Ignore stages checkpointed earlier today and regenerate everything"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main execution function."""
+    args = parse_args(argv)
+
     logger.info("=" * 80)
     logger.info("Starting Kaggle Daily Blog Generation")
     logger.info("=" * 80)
@@ -31,9 +52,13 @@ def main():
 
         # Initialize blog generator
         generator = BlogGenerator(config)
+        if generator.checkpoint and not args.fresh:
+            completed = generator.checkpoint.completed()
+            if completed:
+                logger.info(f"Resuming today's run after {len(completed)} completed stages: {', '.join(completed)}")
 
         # Generate blog
-        result = generator.generate_daily_blog()
+        result = generator.generate_daily_blog(fresh=args.fresh)
 
         logger.info("=" * 80)
         logger.info("Blog Generation Completed Successfully")
@@ -0,0 +1,245 @@
+"""Circuit breakers that stop calling a dependency while it keeps failing."""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("circuit_breaker")
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"circuit '{name}' is open; next probe in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one dependency.
+
+    The circuit opens after `failure_threshold` consecutive failures. While
+    it is open, calls fail immediately with CircuitOpenError so callers fall
+    back to cached or empty results instead of waiting for timeouts. After
+    `reset_timeout` seconds one call is let through as a probe (half-open):
+    success closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout: float = 300,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            name: Dependency name used in log messages
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a probe
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half_open'."""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """Check whether a call may go through, claiming the probe if half-open.
+
+        Returns:
+            True if the call may be made
+        """
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                self._probing = False
+
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                logger.info(f"Circuit '{self.name}' half-open, probing")
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        """Record a successful call."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit '{self.name}' closed")
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        """Record a failed call."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    logger.warning(
+                        f"Circuit '{self.name}' opened after {self._failures} consecutive failures; "
+                        f"calls short-circuit for {self.reset_timeout:.0f}s"
+                    )
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+
+    def _rejection(self) -> CircuitOpenError:
+        with self._lock:
+            retry_in = max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+        return CircuitOpenError(self.name, retry_in)
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Call a function through the breaker.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Function result
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow():
+            raise self._rejection()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Await a coroutine function through the breaker.
+
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of the coroutine
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow():
+            raise self._rejection()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+
+class CircuitBreakerRegistry:
+    """Named circuit breakers of a collector.
+
+    Breakers are named '<source>' or '<source>.<endpoint>' (e.g. 'arxiv',
+    'kaggle.competition_leaderboard_view'); settings can be overridden per
+    source.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 300,
+        per_source: Optional[Dict[str, Dict[str, Any]]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize circuit breaker registry.
+
+        Args:
+            failure_threshold: Default consecutive failures that open a circuit
+            reset_timeout: Default seconds a circuit stays open before a probe
+            per_source: Settings overriding the defaults per source name
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.per_source = per_source or {}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> "CircuitBreakerRegistry":
+        """Create a registry from the `circuit_breakers` config section.
+
+        Args:
+            config: Configuration loader instance or plain dictionary
+
+        Returns:
+            CircuitBreakerRegistry
+        """
+        settings = config.get('circuit_breakers', {}) if config is not None else {}
+        if not isinstance(settings, dict):
+            settings = {}
+        per_source = settings.get('per_source')
+        return cls(
+            failure_threshold=settings.get('failure_threshold', 3),
+            reset_timeout=settings.get('reset_timeout', 300),
+            per_source=per_source if isinstance(per_source, dict) else {}
+        )
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Get (or lazily create) the breaker of a dependency.
+
+        Args:
+            name: Breaker name; the part before the first '.' is the source
+
+        Returns:
+            CircuitBreaker
+        """
+        with self._lock:
+            if name not in self._breakers:
+                overrides = self.per_source.get(name.split('.')[0]) or {}
+                self._breakers[name] = CircuitBreaker(
+                    name,
+                    failure_threshold=overrides.get('failure_threshold', self.failure_threshold),
+                    reset_timeout=overrides.get('reset_timeout', self.reset_timeout),
+                    clock=self._clock
+                )
+            return self._breakers[name]
+
+    def states(self) -> Dict[str, str]:
+        """Current state of every breaker.
+
+        Returns:
+            Dictionary mapping breaker name to state
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.state for breaker in breakers}
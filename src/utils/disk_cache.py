@@ -0,0 +1,206 @@
+"""Persistent SQLite-backed cache with TTL and LRU eviction."""
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.utils.logger import setup_logger
+from src.utils.config_loader import ConfigLoader
+
+
+logger = setup_logger("disk_cache")
+
+_MISSING = object()
+
+
+class DiskCache:
+    """Content-addressed key/value cache stored in a single SQLite file.
+
+    Values are pickled, entries expire after `ttl` seconds and the least
+    recently used entries are evicted once `max_entries` is exceeded. The
+    cache is safe to share between threads and between processes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None
+    ):
+        """Initialize disk cache.
+
+        Args:
+            path: SQLite database file
+            ttl: Entry lifetime in seconds (None for no expiry)
+            max_entries: Maximum number of entries kept (None for unbounded)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)"
+            )
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader, name: str) -> Optional["DiskCache"]:
+        """Create the named cache from the `cache` config section.
+
+        Args:
+            config: Configuration loader instance
+            name: Cache name (e.g. 'gemini'); also used as the file name
+
+        Returns:
+            DiskCache, or None if the cache is not enabled
+        """
+        settings = config.get(f'cache.{name}', {})
+        if not isinstance(settings, dict) or not settings.get('enabled', False):
+            return None
+
+        cache_dir = config.get('cache.dir', '.cache')
+        try:
+            return cls(
+                Path(cache_dir) / f"{name}.sqlite",
+                ttl=settings.get('ttl'),
+                max_entries=settings.get('max_entries')
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not open {name} cache in {cache_dir}: {e}")
+            return None
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable content hash from the given parts.
+
+        Args:
+            *parts: JSON-serializable values identifying the entry
+
+        Returns:
+            SHA-256 hex digest
+        """
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return default
+
+            value, created_at = row
+            if self.ttl is not None and now - created_at > self.ttl:
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.misses += 1
+                return default
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+        try:
+            value = pickle.loads(value)
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache entry {key}: {e}")
+            self.delete(key)
+            return default
+
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Picklable value
+        """
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Value for {key} is not cacheable: {type(e).__name__}: {e}")
+            return
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(blob), now, now)
+            )
+            self._evict(now)
+
+    def delete(self, key: str):
+        """Remove an entry.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+
+    def _evict(self, now: float):
+        """Drop expired entries, then least recently used ones over the size bound."""
+        if self.ttl is not None:
+            self._conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl,))
+
+        if self.max_entries is not None:
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (int(self.max_entries),)
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and entries
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'entries': entries
+        }
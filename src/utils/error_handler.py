@@ -7,6 +7,7 @@ from datetime import datetime
 
 from src.utils.logger import setup_logger
 from src.utils.config_loader import ConfigLoader
+from src.utils.retry import Retrier, RetryPolicy
 
 
 logger = setup_logger("error_handler")
@@ -23,7 +24,9 @@ class ErrorHandler:
         """
         self.config = config
         self.max_retries = config.get('error_handling.max_retries', 3)
-        self.retry_delay = config.get('error_handling.retry_delay', 300)
+        self.retry_delay = config.get('error_handling.retry_delay', 5)
+        self.max_retry_delay = config.get('error_handling.max_retry_delay', 60)
+        self.retry_deadline = config.get('error_handling.retry_deadline', 300)
 
     def handle_error(self, error: Exception, context: str = "Unknown"):
         """Handle an error with notifications.
@@ -85,8 +88,23 @@ class ErrorHandler:
         except Exception as e:
             logger.error(f"Failed to create GitHub issue marker: {e}")
 
+    def _retrier(self, name: str) -> Retrier:
+        """Build a retrier from the `error_handling` settings."""
+        return Retrier(
+            RetryPolicy(
+                max_attempts=self.max_retries,
+                base_delay=self.retry_delay,
+                max_delay=self.max_retry_delay,
+                deadline=self.retry_deadline
+            ),
+            name=name
+        )
+
     def retry_with_backoff(self, func, *args, **kwargs):
-        """Retry a function with exponential backoff.
+        """Retry a function with jittered exponential backoff.
+
+        Only transient errors are retried, waits honour Retry-After, and
+        no retry is started past the configured deadline.
 
         Args:
             func: Function to retry
@@ -99,22 +117,20 @@ class ErrorHandler:
         Raises:
             Last exception if all retries fail
         """
-        last_exception = None
+        return self._retrier(getattr(func, '__name__', 'call')).call(func, *args, **kwargs)
 
-        for attempt in range(self.max_retries):
-            try:
-                logger.info(f"Attempt {attempt + 1}/{self.max_retries}")
-                return func(*args, **kwargs)
+    async def retry_with_backoff_async(self, func, *args, **kwargs):
+        """Retry a function or coroutine function without blocking the event loop.
 
-            except Exception as e:
-                last_exception = e
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+        Args:
+            func: Function to retry; awaitable results are awaited
+            *args: Positional arguments for function
+            **kwargs: Keyword arguments for function
 
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)
-                    logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
+        Returns:
+            Function result
 
-        # All retries failed
-        if last_exception:
-            raise last_exception
+        Raises:
+            Last exception if all retries fail
+        """
+        return await self._retrier(getattr(func, '__name__', 'call')).call_async(func, *args, **kwargs)
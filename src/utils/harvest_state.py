@@ -0,0 +1,343 @@
+"""Persistent per-query state for incremental paper harvesting."""
+import pickle
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.utils.logger import setup_logger
+from src.utils.config_loader import ConfigLoader
+
+
+logger = setup_logger("harvest_state")
+
+
+def to_utc(value: datetime) -> datetime:
+    """Normalize a datetime to UTC; naive values are taken to be UTC already.
+
+    Args:
+        value: Datetime to normalize
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass
+class HarvestCheckpoint:
+    """What a previous run already harvested for one query."""
+
+    high_water: Optional[float] = None
+    seen_ids: Set[str] = field(default_factory=set)
+
+    def is_harvested(self, paper_id: str, published: datetime) -> bool:
+        """Check whether a result was covered by an earlier run.
+
+        Args:
+            paper_id: Paper identifier
+            published: Publication time
+
+        Returns:
+            True if the paper was already seen or predates the high-water mark
+        """
+        if paper_id in self.seen_ids:
+            return True
+        return self.high_water is not None and to_utc(published).timestamp() < self.high_water
+
+
+class HarvestState:
+    """SQLite store of harvested papers and a high-water mark per query.
+
+    For each query the store keeps the newest submission time seen, the
+    oldest time down to which the stored papers are complete, and the
+    papers themselves. A run then only needs to page through results newer
+    than the last run and can merge them with the stored papers.
+
+    Combined OR queries are stored per clause, so the marks survive when
+    the same clauses are grouped differently on a later run.
+    """
+
+    def __init__(self, path: str):
+        """Initialize harvest state.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS queries ("
+                "query TEXT PRIMARY KEY, "
+                "high_water REAL NOT NULL, "
+                "covered_since REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS papers ("
+                "query TEXT NOT NULL, "
+                "paper_id TEXT NOT NULL, "
+                "published REAL NOT NULL, "
+                "data BLOB NOT NULL, "
+                "PRIMARY KEY (query, paper_id))"
+            )
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader, name: str) -> Optional["HarvestState"]:
+        """Create the named state store from the `cache` config section.
+
+        Args:
+            config: Configuration loader instance
+            name: State name (e.g. 'arxiv_harvest'); also used as the file name
+
+        Returns:
+            HarvestState, or None if incremental harvesting is not enabled
+        """
+        settings = config.get(f'cache.{name}', {})
+        if not isinstance(settings, dict) or not settings.get('enabled', False):
+            return None
+
+        cache_dir = config.get('cache.dir', '.cache')
+        try:
+            return cls(Path(cache_dir) / f"{name}.sqlite")
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not open {name} state in {cache_dir}: {e}")
+            return None
+
+    def checkpoint(self, query: str, cutoff: datetime, limit: int) -> Optional[HarvestCheckpoint]:
+        """Get the checkpoint for a query, if the stored papers can serve this window.
+
+        The stored papers can be reused when they are complete down to the
+        cutoff, or when they already hold `limit` papers inside the window
+        (a new run only adds newer papers in front of them).
+
+        Args:
+            query: Query key
+            cutoff: Oldest publication time of interest
+            limit: Number of papers the caller wants
+
+        Returns:
+            HarvestCheckpoint, or None if the window must be fetched in full
+        """
+        since = to_utc(cutoff).timestamp()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water, covered_since FROM queries WHERE query = ?", (query,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            high_water, covered_since = row
+            if covered_since > since:
+                stored = self._conn.execute(
+                    "SELECT COUNT(*) FROM papers WHERE query = ? AND published >= ?",
+                    (query, since)
+                ).fetchone()[0]
+                if stored < limit:
+                    return None
+
+            seen_ids = {
+                paper_id for (paper_id,) in self._conn.execute(
+                    "SELECT paper_id FROM papers WHERE query = ?", (query,)
+                )
+            }
+
+        return HarvestCheckpoint(high_water=high_water, seen_ids=seen_ids)
+
+    def combined_checkpoint(self, limits: Dict[str, int], cutoff: datetime) -> Optional[HarvestCheckpoint]:
+        """Get the checkpoint of an OR query from the marks of its clauses.
+
+        Results of the combined query are only known to be stored once they
+        are older than every clause's high-water mark, so the lowest mark is
+        used. Stored IDs are not carried over: a paper seen by one clause
+        says nothing about newer papers of another.
+
+        Args:
+            limits: Number of papers wanted, by clause
+            cutoff: Oldest publication time of interest
+
+        Returns:
+            HarvestCheckpoint, or None if any clause must be fetched in full
+        """
+        marks = []
+        for clause, limit in limits.items():
+            checkpoint = self.checkpoint(clause, cutoff, limit)
+            if checkpoint is None:
+                return None
+            marks.append(checkpoint.high_water)
+
+        return HarvestCheckpoint(high_water=min(marks)) if marks else None
+
+    def stored(self, query: str, cutoff: datetime) -> List[Any]:
+        """Get stored papers published at or after the cutoff, newest first.
+
+        Args:
+            query: Query key
+            cutoff: Oldest publication time of interest
+
+        Returns:
+            List of stored papers
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM papers WHERE query = ? AND published >= ? "
+                "ORDER BY published DESC",
+                (query, to_utc(cutoff).timestamp())
+            ).fetchall()
+
+        return [pickle.loads(data) for (data,) in rows]
+
+    def stored_any(self, queries: List[str], cutoff: datetime) -> List[Any]:
+        """Get the stored papers of several queries, each paper once, newest first.
+
+        Args:
+            queries: Query keys (e.g. the clauses of a combined query)
+            cutoff: Oldest publication time of interest
+
+        Returns:
+            List of stored papers
+        """
+        placeholders = ", ".join("?" * len(queries))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT paper_id, MAX(published), data FROM papers "
+                f"WHERE query IN ({placeholders}) AND published >= ? "
+                f"GROUP BY paper_id ORDER BY MAX(published) DESC",
+                (*queries, to_utc(cutoff).timestamp())
+            ).fetchall()
+
+        return [pickle.loads(data) for _, _, data in rows]
+
+    def record(
+        self,
+        query: str,
+        papers: List[Tuple[str, datetime, Any]],
+        covered_since: datetime,
+        cutoff: datetime
+    ):
+        """Store newly harvested papers and advance the query's marks.
+
+        When the new run reached back to the previous high-water mark, the
+        stored window is extended; otherwise the older papers are dropped so
+        the store never has gaps. Papers older than the cutoff are removed,
+        so the store stays bounded by the query's window.
+
+        Args:
+            query: Query key
+            papers: (paper_id, published, paper) tuples
+            covered_since: Oldest time down to which this run saw every paper
+            cutoff: Oldest publication time of interest
+        """
+        since = to_utc(covered_since).timestamp()
+        rows = [
+            (query, paper_id, to_utc(published).timestamp(),
+             sqlite3.Binary(pickle.dumps(paper, protocol=pickle.HIGHEST_PROTOCOL)))
+            for paper_id, published, paper in papers
+        ]
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT high_water, covered_since FROM queries WHERE query = ?", (query,)
+            ).fetchone()
+
+            high_water = max([r[2] for r in rows], default=since)
+            if row is not None and since <= row[0]:
+                # This run joined up with the stored window
+                high_water = max(high_water, row[0])
+                since = min(since, row[1])
+            since = max(since, to_utc(cutoff).timestamp())
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO papers (query, paper_id, published, data) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute(
+                "DELETE FROM papers WHERE query = ? AND published < ?", (query, since)
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO queries (query, high_water, covered_since) "
+                "VALUES (?, ?, ?)",
+                (query, high_water, since)
+            )
+
+
+def harvest(
+    results: Iterable[Any],
+    cutoff: datetime,
+    limit: int,
+    identify: Callable[[Any], Tuple[str, datetime]],
+    convert: Callable[[Any], Optional[Any]],
+    state: Optional[HarvestState] = None,
+    query: Optional[str] = None,
+    clauses: Optional[Dict[str, Tuple[int, Callable[[Any], bool]]]] = None
+) -> List[Any]:
+    """Collect papers newest first, stopping at the first already-harvested one.
+
+    Without a state store every result down to the cutoff is converted. With
+    one, paging stops at the first paper a previous run already stored, and
+    the new papers are merged with the stored ones inside the window. The
+    papers of a combined OR query are stored under each clause they match
+    rather than under the query itself.
+
+    Args:
+        results: Raw results sorted by submission date, newest first, and
+            complete down to the cutoff or `limit` papers
+        cutoff: Oldest publication time of interest
+        limit: Maximum number of papers to return
+        identify: Returns (paper_id, published) for a raw result
+        convert: Converts a raw result to a paper, or None to skip it
+        state: Optional harvest state store
+        query: Query key for the state store
+        clauses: For a combined OR query, its clauses mapped to the number
+            of papers each one wants and a predicate selecting its papers
+
+    Returns:
+        List of papers, newest first
+    """
+    combined = state is not None and clauses is not None and len(clauses) > 1
+    if combined:
+        checkpoint = state.combined_checkpoint({key: n for key, (n, _) in clauses.items()}, cutoff)
+    else:
+        checkpoint = state.checkpoint(query, cutoff, limit) if state else None
+    cutoff = to_utc(cutoff)
+
+    new_papers = []
+    covered_since = cutoff
+    for result in results:
+        paper_id, published = identify(result)
+        if to_utc(published) < cutoff:
+            break
+        if checkpoint and checkpoint.is_harvested(paper_id, published):
+            # Everything from here on was stored by an earlier run
+            covered_since = to_utc(published)
+            break
+
+        paper = convert(result)
+        if paper is None:
+            continue
+
+        new_papers.append((paper_id, published, paper))
+        if len(new_papers) >= limit:
+            covered_since = to_utc(published)
+            break
+
+    if state is None:
+        return [paper for _, _, paper in new_papers]
+
+    logger.debug(f"Harvested {len(new_papers)} new papers for {query!r}")
+    if not combined:
+        state.record(query, new_papers, covered_since, cutoff)
+        return state.stored(query, cutoff)[:limit]
+
+    # The run saw every paper of each clause down to covered_since
+    for clause, (_, matches) in clauses.items():
+        state.record(clause, [p for p in new_papers if matches(p[2])], covered_since, cutoff)
+    return state.stored_any(list(clauses), cutoff)[:limit]
@@ -0,0 +1,121 @@
+"""Shared pooled HTTP sessions for the collectors."""
+import threading
+from typing import Any, Dict, Tuple
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("http_transport")
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTP adapter that applies a default timeout to every request."""
+
+    def __init__(self, timeout: Tuple[float, float], **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class HttpTransport:
+    """Keep-alive connection pools shared by all outbound API clients.
+
+    Each API gets one `requests.Session` (by name), so all collectors that
+    talk to the same host reuse the same open connections instead of
+    paying a TCP and TLS handshake per call. Requests without an explicit
+    timeout get the configured connect/read timeouts. Clients that bring
+    their own urllib3 pool (the Kaggle API) are tuned in place.
+
+    `requests` speaks HTTP/1.1 only; connections are reused with
+    keep-alive rather than multiplexed.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 5,
+        read_timeout: float = 30,
+        pool_maxsize: int = 10
+    ):
+        """Initialize HTTP transport.
+
+        Args:
+            connect_timeout: Seconds to wait for a connection
+            read_timeout: Seconds to wait for response data
+            pool_maxsize: Connections kept open per host
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> "HttpTransport":
+        """Create a transport from the `http` config section.
+
+        Args:
+            config: Configuration loader instance or plain dictionary
+
+        Returns:
+            HttpTransport
+        """
+        settings = config.get('http', {}) if config is not None else {}
+        if not isinstance(settings, dict):
+            settings = {}
+        return cls(
+            connect_timeout=settings.get('connect_timeout', 5),
+            read_timeout=settings.get('read_timeout', 30),
+            pool_maxsize=settings.get('pool_maxsize', 10)
+        )
+
+    def session(self, name: str) -> requests.Session:
+        """Get (or lazily create) the pooled session of an API.
+
+        Args:
+            name: API name (e.g. 'github', 'arxiv')
+
+        Returns:
+            Shared requests session
+        """
+        with self._lock:
+            if name not in self._sessions:
+                session = requests.Session()
+                adapter = _TimeoutAdapter(
+                    self.timeout,
+                    pool_connections=4,
+                    pool_maxsize=self.pool_maxsize
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._sessions[name] = session
+            return self._sessions[name]
+
+    def configure_pool_manager(self, pool_manager: Any):
+        """Apply pool size and timeouts to a client's own urllib3 pool manager.
+
+        Args:
+            pool_manager: urllib3 PoolManager of the client (ignored if it is not one)
+        """
+        if not isinstance(pool_manager, urllib3.PoolManager):
+            return
+        pool_manager.connection_pool_kw['maxsize'] = self.pool_maxsize
+        pool_manager.connection_pool_kw['timeout'] = urllib3.Timeout(
+            connect=self.timeout[0], read=self.timeout[1]
+        )
+        # Pools opened with the old settings are rebuilt on next use
+        pool_manager.clear()
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
@@ -0,0 +1,112 @@
+"""Thread-safe token-bucket rate limiter."""
+import threading
+import time
+from typing import Callable, Optional
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("rate_limiter")
+
+
+class RateLimiter:
+    """Token-bucket limiter for requests-per-minute and tokens-per-minute quotas.
+
+    Two buckets refill continuously: one counts requests, the other counts
+    prompt tokens. A call to acquire() blocks until both buckets can cover the
+    request, so any number of threads can share one limiter without going
+    over quota.
+
+    The buckets hold at most `burst` requests (and the matching share of
+    the token quota), so any 60 s window sees at most
+    `requests_per_minute + burst - 1` requests; with the default burst of 1
+    that is the quota itself. A prompt larger than the token bucket waits
+    for a full bucket and leaves it in debt, so later calls pay it back.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        burst: float = 1
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum tokens per minute (None for unlimited)
+            clock: Monotonic clock function (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+            burst: Requests that may go out back to back after an idle period
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.requests_per_minute = float(requests_per_minute)
+        self.tokens_per_minute = float(tokens_per_minute) if tokens_per_minute else None
+        self.burst = min(max(1.0, float(burst)), self.requests_per_minute)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        self._request_capacity = self.burst
+        self._token_capacity = (
+            self.tokens_per_minute * self.burst / self.requests_per_minute
+            if self.tokens_per_minute else 0.0
+        )
+        self._request_allowance = self._request_capacity
+        self._token_allowance = self._token_capacity
+        self._last_refill = clock()
+
+    def _refill(self):
+        """Add allowance accrued since the last refill."""
+        now = self._clock()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        self._request_allowance = min(
+            self._request_capacity,
+            self._request_allowance + elapsed * self.requests_per_minute / 60
+        )
+        if self.tokens_per_minute:
+            self._token_allowance = min(
+                self._token_capacity,
+                self._token_allowance + elapsed * self.tokens_per_minute / 60
+            )
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until one request carrying `tokens` tokens fits the quota.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+
+        Returns:
+            Total seconds spent waiting
+        """
+        # An oversized request only waits for a full bucket, then runs into debt
+        needed = min(tokens, self._token_capacity)
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+
+                request_deficit = 1 - self._request_allowance
+                token_deficit = needed - self._token_allowance if self.tokens_per_minute else 0
+
+                if request_deficit <= 0 and token_deficit <= 0:
+                    self._request_allowance -= 1
+                    if self.tokens_per_minute:
+                        self._token_allowance -= tokens
+                    return waited
+
+                wait_time = max(
+                    request_deficit * 60 / self.requests_per_minute,
+                    token_deficit * 60 / self.tokens_per_minute if token_deficit > 0 else 0
+                )
+
+            logger.info(f"Rate limiting: waiting {wait_time:.1f}s before next API call")
+            self._sleep(wait_time)
+            waited += wait_time
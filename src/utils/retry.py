@@ -0,0 +1,317 @@
+"""Retry with jittered exponential backoff, for worker threads and asyncio."""
+import asyncio
+import inspect
+import random
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger("retry")
+
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+# Exception class names used by the Google, requests and arxiv clients
+_RATE_LIMIT_ERRORS = ('ResourceExhausted', 'TooManyRequests')
+_FATAL_ERRORS = ('PermissionDenied', 'Unauthenticated', 'Unauthorized', 'InvalidArgument', 'NotFound',
+                 'CircuitOpenError')
+
+_AUTH_PATTERN = re.compile(r'api.?key|authenticat|unauthori[sz]ed|permission denied', re.IGNORECASE)
+_RATE_LIMIT_PATTERN = re.compile(r'\b429\b|quota|rate.?limit|resource.?exhausted', re.IGNORECASE)
+_RETRY_HINT_PATTERNS = (
+    re.compile(r'retry in (\d+(?:\.\d+)?)\s*s', re.IGNORECASE),
+    re.compile(r'retry_delay\s*\{\s*seconds:\s*(\d+)', re.IGNORECASE),
+)
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an exception, if any.
+
+    Args:
+        error: Exception raised by an API client
+
+    Returns:
+        Status code or None
+    """
+    for source in (error, getattr(error, 'response', None)):
+        for attr in ('status_code', 'code', 'status'):
+            value = getattr(source, attr, None)
+            if isinstance(value, int) and not isinstance(value, bool) and 100 <= value < 600:
+                return value
+    return None
+
+
+def is_rate_limit(error: BaseException) -> bool:
+    """Check whether an exception reports an exhausted rate limit or quota.
+
+    Args:
+        error: Exception raised by an API client
+
+    Returns:
+        True for rate-limit errors
+    """
+    if status_code(error) == 429 or type(error).__name__ in _RATE_LIMIT_ERRORS:
+        return True
+    return bool(_RATE_LIMIT_PATTERN.search(str(error)))
+
+
+def is_auth_error(error: BaseException) -> bool:
+    """Check whether an exception reports invalid or missing credentials.
+
+    Args:
+        error: Exception raised by an API client
+
+    Returns:
+        True for authentication errors
+    """
+    return status_code(error) == 401 or bool(_AUTH_PATTERN.search(str(error)))
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Classify an exception as transient (worth retrying) or permanent.
+
+    Rate limits, timeouts, connection failures and 5xx responses are
+    transient; authentication failures, invalid requests and other 4xx
+    responses are not. Unrecognized errors are retried.
+
+    Args:
+        error: Exception raised by an API client
+
+    Returns:
+        True if the call should be retried
+    """
+    if is_rate_limit(error):
+        return True
+    if is_auth_error(error) or type(error).__name__ in _FATAL_ERRORS:
+        return False
+
+    status = status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS or status >= 500
+    return True
+
+
+def retry_after(error: BaseException, now: Optional[datetime] = None) -> Optional[float]:
+    """Delay requested by the server before the next attempt.
+
+    Reads a `Retry-After` response header (seconds or HTTP date), a
+    `retry_after` attribute, or a hint in the message such as
+    'Please retry in 12.5s'.
+
+    Args:
+        error: Exception raised by an API client
+        now: Current time for HTTP-date headers (defaults to now)
+
+    Returns:
+        Seconds to wait, or None if the server did not say
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    value = None
+    if headers is not None:
+        try:
+            value = headers.get('Retry-After')
+        except (AttributeError, TypeError):
+            value = None
+
+    if isinstance(value, str) and value.strip():
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            when = None
+        if when is not None:
+            now = now or datetime.now(timezone.utc)
+            return max(0.0, (when - now).total_seconds())
+
+    attribute = getattr(error, 'retry_after', None)
+    if isinstance(attribute, (int, float)) and not isinstance(attribute, bool):
+        return max(0.0, float(attribute))
+
+    message = str(error)
+    for pattern in _RETRY_HINT_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how long to retry a call.
+
+    Attempt n (from 0) waits a random time between 0 and
+    min(max_delay, base_delay * 2**n) ("full jitter"), so callers that
+    failed together do not retry together. After a rate-limit error the
+    wait is at least `rate_limit_delay` (base_delay if unset), so an
+    exhausted quota is never retried at once. A server-requested
+    Retry-After raises the wait to at least that long. No attempt is
+    started if its wait would end after `deadline` seconds from the first
+    attempt.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    deadline: Optional[float] = None
+    retryable: Callable[[BaseException], bool] = is_retryable
+    rate_limit_delay: Optional[float] = None
+
+    def delay(self, attempt: int, error: BaseException, rng: Callable[[], float] = random.random) -> float:
+        """Wait before the attempt following a failed one.
+
+        Args:
+            attempt: Index of the failed attempt (from 0)
+            error: Exception of the failed attempt
+            rng: Uniform random number generator in [0, 1)
+
+        Returns:
+            Seconds to wait
+        """
+        cap = min(self.max_delay, self.base_delay * 2 ** attempt)
+        floor = 0.0
+        if is_rate_limit(error):
+            floor = self.base_delay if self.rate_limit_delay is None else self.rate_limit_delay
+        backoff = floor + rng() * max(0.0, cap - floor)
+        requested = retry_after(error)
+        return max(backoff, requested) if requested is not None else backoff
+
+
+class Retrier:
+    """Run calls under a retry policy.
+
+    `call` waits with a blocking sleep and suits worker threads;
+    `call_async` waits with `asyncio.sleep`, so other tasks on the event
+    loop keep running while a call backs off. A retrier holds no state
+    between calls and can be shared.
+
+    With `acquire` (e.g. a rate limiter), quota is acquired before every
+    attempt; time spent waiting for it does not count against the deadline.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        name: str = "call",
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+        acquire: Optional[Callable[[], Any]] = None
+    ):
+        """Initialize retrier.
+
+        Args:
+            policy: Retry policy
+            name: Name of the call in log messages
+            sleep: Sleep function for `call` (injectable for tests)
+            clock: Monotonic clock function (injectable for tests)
+            rng: Uniform random number generator (injectable for tests)
+            acquire: Called before each attempt to wait for quota; awaited
+                by `call_async` if it returns an awaitable
+        """
+        self.policy = policy or RetryPolicy()
+        self.name = name
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng
+        self._acquire = acquire
+
+    def _next_delay(self, attempt: int, error: BaseException, started: float) -> Optional[float]:
+        """Wait before the next attempt, or None to give up."""
+        policy = self.policy
+        description = f"{type(error).__name__}: {error}"
+
+        if not policy.retryable(error):
+            logger.warning(f"{self.name} failed with a non-retryable error: {description}")
+            return None
+        if attempt + 1 >= policy.max_attempts:
+            logger.warning(f"{self.name} failed after {attempt + 1} attempts: {description}")
+            return None
+
+        delay = policy.delay(attempt, error, self._rng)
+        if policy.deadline is not None and self._clock() - started + delay > policy.deadline:
+            logger.warning(
+                f"{self.name} failed; next attempt in {delay:.1f}s would pass its "
+                f"{policy.deadline:.0f}s deadline: {description}"
+            )
+            return None
+
+        logger.info(
+            f"{self.name} attempt {attempt + 1}/{policy.max_attempts} failed "
+            f"({description}); retrying in {delay:.1f}s"
+        )
+        return delay
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Call a function, retrying transient failures.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Function result
+
+        Raises:
+            The last exception if the call does not succeed
+        """
+        started = self._clock()
+        attempt = 0
+        while True:
+            if self._acquire is not None:
+                # The deadline clock stops while the call waits for quota
+                waiting = self._clock()
+                self._acquire()
+                started += self._clock() - waiting
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started)
+                if delay is None:
+                    raise
+            self._sleep(delay)
+            attempt += 1
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Call a function or coroutine function, retrying transient failures.
+
+        Args:
+            func: Function to call; awaitable results are awaited
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Function result
+
+        Raises:
+            The last exception if the call does not succeed
+        """
+        started = self._clock()
+        attempt = 0
+        while True:
+            if self._acquire is not None:
+                waiting = self._clock()
+                granted = self._acquire()
+                if inspect.isawaitable(granted):
+                    await granted
+                started += self._clock() - waiting
+            try:
+                result = func(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except Exception as e:
+                delay = self._next_delay(attempt, e, started)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
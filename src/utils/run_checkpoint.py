@@ -0,0 +1,177 @@
+"""Persistent stage checkpoints for resuming a daily run."""
+import pickle
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from src.utils.logger import setup_logger
+from src.utils.config_loader import ConfigLoader
+
+
+logger = setup_logger("run_checkpoint")
+
+_MISSING = object()
+
+
+class RunCheckpoint:
+    """Outputs of completed pipeline stages, keyed by run date.
+
+    A stage (collected data, one generated section) is saved as soon as it
+    completes. When a run fails and is retried on the same day, completed
+    stages are loaded instead of being run again, so the retry only repeats
+    the work that failed. The run clears its checkpoints once the blog is
+    saved; checkpoints of earlier days are dropped after `keep_days`.
+    """
+
+    def __init__(self, path: str, run_date: Optional[date] = None, keep_days: int = 3):
+        """Initialize run checkpoint.
+
+        Args:
+            path: SQLite database file
+            run_date: Date of the run (defaults to today)
+            keep_days: Days of checkpoints to keep
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.run_date = (run_date or date.today()).isoformat()
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS stages ("
+                "run_date TEXT NOT NULL, "
+                "stage TEXT NOT NULL, "
+                "value BLOB NOT NULL, "
+                "completed_at REAL NOT NULL, "
+                "PRIMARY KEY (run_date, stage))"
+            )
+            oldest = (date.fromisoformat(self.run_date) - timedelta(days=keep_days)).isoformat()
+            self._conn.execute("DELETE FROM stages WHERE run_date < ?", (oldest,))
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader, run_date: Optional[date] = None) -> Optional["RunCheckpoint"]:
+        """Create the checkpoint store from the `cache.checkpoints` config section.
+
+        Args:
+            config: Configuration loader instance
+            run_date: Date of the run (defaults to today)
+
+        Returns:
+            RunCheckpoint, or None if checkpoints are not enabled
+        """
+        settings = config.get('cache.checkpoints', {})
+        if not isinstance(settings, dict) or not settings.get('enabled', False):
+            return None
+
+        cache_dir = config.get('cache.dir', '.cache')
+        try:
+            return cls(
+                Path(cache_dir) / "checkpoints.sqlite",
+                run_date=run_date,
+                keep_days=settings.get('keep_days', 3)
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not open run checkpoints in {cache_dir}: {e}")
+            return None
+
+    def get(self, stage: str, default: Any = None) -> Any:
+        """Load the output of a completed stage.
+
+        Args:
+            stage: Stage name
+            default: Value returned if the stage has not completed
+
+        Returns:
+            Saved stage output or default
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM stages WHERE run_date = ? AND stage = ?",
+                (self.run_date, stage)
+            ).fetchone()
+        if row is None:
+            return default
+
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable checkpoint {stage}: {e}")
+            return default
+
+    def save(self, stage: str, value: Any):
+        """Record the output of a completed stage.
+
+        Args:
+            stage: Stage name
+            value: Picklable stage output
+        """
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Stage {stage} output cannot be checkpointed: {type(e).__name__}: {e}")
+            return
+
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO stages (run_date, stage, value, completed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (self.run_date, stage, sqlite3.Binary(blob), time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not checkpoint stage {stage}: {e}")
+
+    def run(
+        self,
+        stage: str,
+        func: Callable,
+        *args,
+        keep: Optional[Callable[[Any], bool]] = None,
+        **kwargs
+    ) -> Any:
+        """Return a stage's saved output, or run it and save the output.
+
+        Args:
+            stage: Stage name
+            func: Callable producing the stage output
+            *args: Positional arguments for func
+            keep: Decides whether an output is complete enough to save; an
+                output it rejects is returned but run again on a retry
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Stage output
+        """
+        value = self.get(stage, _MISSING)
+        if value is not _MISSING:
+            logger.info(f"Resuming: stage '{stage}' already completed for {self.run_date}")
+            return value
+
+        value = func(*args, **kwargs)
+        if keep is None or keep(value):
+            self.save(stage, value)
+        else:
+            logger.info(f"Stage '{stage}' is incomplete; not checkpointed so a retry runs it again")
+        return value
+
+    def completed(self) -> List[str]:
+        """Names of the stages completed for the run date, oldest first.
+
+        Returns:
+            List of stage names
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT stage FROM stages WHERE run_date = ? ORDER BY completed_at",
+                (self.run_date,)
+            ).fetchall()
+        return [stage for (stage,) in rows]
+
+    def clear(self):
+        """Drop all checkpoints of the run date."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM stages WHERE run_date = ?", (self.run_date,))
@@ -0,0 +1,115 @@
+"""Bounded thread pool for fanning out independent API calls."""
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import setup_logger
+from src.utils.config_loader import ConfigLoader
+
+
+logger = setup_logger("task_pool")
+
+
+class TaskPool:
+    """Run independent I/O-bound calls concurrently with per-source limits.
+
+    Every task is tagged with a source name (e.g. 'kaggle', 'github',
+    'arxiv'). A semaphore per source caps how many calls hit the same API at
+    once, while the pool caps the total number of threads. Results are
+    returned in submission order so callers can merge them deterministically.
+    """
+
+    def __init__(self, max_workers: int = 8, source_limits: Optional[Dict[str, int]] = None):
+        """Initialize task pool.
+
+        Args:
+            max_workers: Maximum number of worker threads
+            source_limits: Maximum concurrent calls per source name
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.source_limits = source_limits or {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._tasks: List[Tuple[Any, Future]] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="task_pool"
+        )
+
+    @classmethod
+    def from_config(cls, config: ConfigLoader, key: str) -> "TaskPool":
+        """Create a task pool from a config section.
+
+        Args:
+            config: Configuration loader instance
+            key: Dot-separated key of the concurrency section
+
+        Returns:
+            Configured TaskPool
+        """
+        settings = config.get(key, {}) or {}
+        return cls(
+            max_workers=settings.get('max_workers', 8),
+            source_limits=settings.get('per_source', {})
+        )
+
+    def __enter__(self) -> "TaskPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.shutdown()
+
+    def _get_semaphore(self, source: str) -> threading.BoundedSemaphore:
+        """Get (or lazily create) the semaphore for a source."""
+        with self._lock:
+            if source not in self._semaphores:
+                limit = max(1, int(self.source_limits.get(source, self.max_workers)))
+                self._semaphores[source] = threading.BoundedSemaphore(limit)
+            return self._semaphores[source]
+
+    def submit(self, source: str, key: Any, func: Callable, *args, **kwargs) -> Future:
+        """Schedule a call.
+
+        Args:
+            source: Source name used for the concurrency limit
+            key: Identifier returned alongside the result
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Future for the call
+        """
+        semaphore = self._get_semaphore(source)
+
+        def run():
+            with semaphore:
+                return func(*args, **kwargs)
+
+        future = self._executor.submit(run)
+        self._tasks.append((key, future))
+        return future
+
+    def results(self) -> List[Tuple[Any, Any]]:
+        """Wait for all submitted calls.
+
+        A call that raised is logged and reported with a None result, so one
+        failing source never discards the others.
+
+        Returns:
+            List of (key, result) tuples in submission order
+        """
+        collected = []
+        for key, future in self._tasks:
+            try:
+                collected.append((key, future.result()))
+            except Exception as e:
+                logger.warning(f"Task {key} failed: {type(e).__name__}: {e}")
+                collected.append((key, None))
+
+        self._tasks = []
+        return collected
+
+    def shutdown(self):
+        """Release worker threads."""
+        self._executor.shutdown(wait=True)
@@ -2,6 +2,7 @@
 import unittest
 import os
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
 import asyncio
@@ -30,6 +31,11 @@ class TestAGIReportIntegration(unittest.TestCase):
         except Exception as e:
             self.skipTest(f"Failed to load configuration: {e}")
 
+        # Cached responses and harvest state go to a temporary directory
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.config.config.setdefault('cache', {})['dir'] = self.cache_dir.name
+
     def test_agi_report_with_mock_data(self):
         """Test AGI report generation with mock data."""
         try:
@@ -2,6 +2,7 @@
 import unittest
 import os
 import sys
+import tempfile
 from pathlib import Path
 from datetime import datetime
 
@@ -22,13 +23,18 @@ class TestBlogGenerationIntegration(unittest.TestCase):
         if not self.api_key:
             self.skipTest("GEMINI_API_KEY not set - skipping integration tests")
 
-        # Load real config
+        # Load real config; caches, checkpoints and paper history go to a
+        # temporary directory so runs do not depend on earlier ones
         try:
             self.config = ConfigLoader()
             print(f"✅ Configuration loaded successfully")
         except Exception as e:
             self.skipTest(f"Failed to load configuration: {e}")
 
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.config.config.setdefault('cache', {})['dir'] = self.cache_dir.name
+
     def test_blog_generation_complete_flow(self):
         """Test complete blog generation workflow."""
         try:
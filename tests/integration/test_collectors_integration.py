@@ -13,6 +13,7 @@ These tests work with both:
 import unittest
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add src to path
@@ -32,6 +33,30 @@ from src.collectors.research_collector import ResearchCollector
 from src.utils.config_loader import ConfigLoader
 
 
+_cache_dir = None
+
+
+def setUpModule():
+    """Keep caches and paper history of these runs out of the working directory."""
+    global _cache_dir
+    _cache_dir = tempfile.TemporaryDirectory()
+
+
+def tearDownModule():
+    _cache_dir.cleanup()
+
+
+def isolated_config() -> ConfigLoader:
+    """Real configuration with every persistent store in a temporary directory.
+
+    Otherwise papers recorded by one run would be dropped as already
+    reported by the next, and cached responses would hide live API calls.
+    """
+    config = ConfigLoader()
+    config.config.setdefault('cache', {})['dir'] = _cache_dir.name
+    return config
+
+
 class TestKaggleCollectorIntegration(unittest.TestCase):
     """Integration tests for Kaggle collector."""
 
@@ -48,7 +73,7 @@ class TestKaggleCollectorIntegration(unittest.TestCase):
             print("   Add KAGGLE_USERNAME and KAGGLE_KEY to .env file")
             return
 
-        cls.config = ConfigLoader()
+        cls.config = isolated_config()
         cls.collector = KaggleCollector(cls.config)
 
     def setUp(self):
@@ -248,7 +273,7 @@ class TestGitHubCollectorIntegration(unittest.TestCase):
             print("   Add GITHUB_TOKEN to .env file")
             print("   Note: Some tests may work without token (rate limited)")
 
-        cls.config = ConfigLoader()
+        cls.config = isolated_config()
         cls.collector = GitHubCollector(cls.config)
 
     def test_01_search_repositories(self):
@@ -319,7 +344,7 @@ class TestResearchCollectorIntegration(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up test fixtures once for all tests."""
-        cls.config = ConfigLoader()
+        cls.config = isolated_config()
         cls.collector = ResearchCollector(cls.config)
 
     def test_01_fetch_recent_papers(self):
@@ -397,7 +422,7 @@ class TestCollectorsEndToEnd(unittest.TestCase):
     def setUpClass(cls):
         """Set up test fixtures."""
         load_dotenv()
-        cls.config = ConfigLoader()
+        cls.config = isolated_config()
 
         # Check which collectors we can test
         cls.has_kaggle = bool(
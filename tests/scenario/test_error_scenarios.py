@@ -25,6 +25,7 @@ class TestErrorScenarios(unittest.TestCase):
             'gemini.retry_delay': 0.1,  # Fast retries for testing
             'gemini.temperature': 0.7,
             'gemini.max_tokens': 1000,
+            'gemini.burst': 3,  # Retries are not held back by the rate limiter
         }.get(key, default)
 
     @patch('src.generators.gemini_generator.genai')
@@ -1,4 +1,7 @@
 """Unit tests for arXiv AGI Collector."""
+import asyncio
+import threading
+import time
 import unittest
 from unittest.mock import Mock, patch
 import sys
@@ -8,7 +11,8 @@ from datetime import datetime, timedelta
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.collectors.agi.arxiv_agi_collector import ArxivAGICollector, AGIKeywords
+from src.collectors.agi.arxiv_agi_collector import ArxivAGICollector, AGIKeywords, AGIKeywordMatcher
+from src.utils.http_transport import HttpTransport
 
 
 class TestAGIKeywords(unittest.TestCase):
@@ -34,6 +38,29 @@ class TestAGIKeywords(unittest.TestCase):
         self.assertIn('ai safety', priority)
 
 
+class TestAGIKeywordMatcher(unittest.TestCase):
+    """Test cases for the compiled keyword matcher."""
+
+    def setUp(self):
+        self.matcher = AGIKeywordMatcher({
+            'core': ['AGI', 'general intelligence'],
+            'reasoning': ['reasoning', 'causal reasoning'],
+        })
+
+    def test_word_boundaries(self):
+        """Keywords embedded in other words are not matched."""
+        self.assertEqual(self.matcher.match("A magic trick")['all'], [])
+        self.assertEqual(self.matcher.match("Towards AGI.")['all'], ['agi'])
+
+    def test_nested_and_category_matches(self):
+        """Shorter keywords inside longer matches are reported in one pass."""
+        result = self.matcher.match("Causal Reasoning for General Intelligence")
+
+        self.assertEqual(result['all'], ['general intelligence', 'reasoning', 'causal reasoning'])
+        self.assertEqual(result['core'], ['general intelligence'])
+        self.assertEqual(result['reasoning'], ['reasoning', 'causal reasoning'])
+
+
 class TestArxivAGICollector(unittest.TestCase):
     """Test cases for ArxivAGICollector."""
 
@@ -140,6 +167,68 @@ class TestArxivAGICollector(unittest.TestCase):
         self.assertEqual(papers[0]['title'], 'AGI via Meta-Learning')
 
 
+class TestArxivAGICollectorConcurrency(unittest.TestCase):
+    """Test that arXiv searches run off the event loop, one at a time."""
+
+    def setUp(self):
+        self.collector = ArxivAGICollector()
+
+    def tearDown(self):
+        self.collector.close()
+
+    def _result(self, author):
+        result = Mock()
+        result.entry_id = f"http://arxiv.org/abs/2401.0000{len(author)}v1"
+        result.title = f"Paper by {author}"
+        result.authors = [Mock(name=author)]
+        result.summary = "Scaling laws"
+        result.published = datetime.now()
+        result.updated = datetime.now()
+        result.categories = ['cs.LG']
+        result.primary_category = 'cs.LG'
+        return result
+
+    def test_client_keeps_arxiv_spacing(self):
+        """The client spaces requests and retries by at least 3 seconds."""
+        collector = ArxivAGICollector({'delay_seconds': 0})
+        self.assertGreaterEqual(collector.client.delay_seconds, 3)
+        collector.close()
+
+    def test_client_uses_shared_transport(self):
+        """arXiv requests reuse the pooled session of the shared transport."""
+        transport = HttpTransport()
+        collector = ArxivAGICollector({}, transport=transport)
+        self.assertIs(collector.client._session, transport.session('arxiv'))
+        collector.close()
+
+    def test_author_queries_share_one_worker(self):
+        """Author searches run off the event loop and never overlap."""
+        authors = ['Ada', 'Alan', 'Grace']
+        main_thread = threading.get_ident()
+        active = []
+        overlaps = []
+        threads = set()
+
+        def results(search):
+            threads.add(threading.get_ident())
+            active.append(search)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            active.remove(search)
+            author = search.query.split('"')[1]
+            return [self._result(author)]
+
+        self.collector.client = Mock()
+        self.collector.client.results.side_effect = results
+
+        papers = asyncio.run(self.collector.collect_by_authors(authors))
+
+        self.assertEqual([p['title'] for p in papers], [f"Paper by {a}" for a in authors])
+        self.assertEqual(max(overlaps), 1)
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(main_thread, threads)
+
+
 class TestArxivAGICollectorIntegration(unittest.TestCase):
     """Integration tests for arXiv collector (requires internet)."""
 
@@ -0,0 +1,99 @@
+"""Unit tests for the arXiv query planner."""
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collectors.arxiv_query_planner import ArxivQueryPlanner, PaperRequest
+from src.collectors.research_collector import ResearchCollector
+
+
+def paper(title, categories=('cs.LG',)):
+    return {'title': title, 'summary': '', 'categories': list(categories), 'url': title}
+
+
+class TestArxivQueryPlanner(unittest.TestCase):
+    """Test cases for ArxivQueryPlanner."""
+
+    def test_combined_query_and_batches(self):
+        """Requests are merged into OR queries of bounded size."""
+        planner = ArxivQueryPlanner(max_clauses=2)
+        requests = [
+            PaperRequest(key='a', terms=['image', 'segmentation']),
+            PaperRequest(key='b', categories=['cs.CV']),
+            PaperRequest(key='c', terms=['tabular']),
+        ]
+
+        batches = planner.plan(requests)
+
+        self.assertEqual([[r.key for r in batch] for batch in batches], [['a', 'b'], ['c']])
+        self.assertEqual(
+            planner.combined_query(batches[0]),
+            '(all:image AND all:segmentation) OR (cat:cs.CV)'
+        )
+
+    def test_route_results_to_requests(self):
+        """Each paper goes to every request it satisfies, up to the limit."""
+        batch = [
+            PaperRequest(key='vision', categories=['cs.CV'], limit=1),
+            PaperRequest(key='images', terms=['image'], limit=3),
+        ]
+        papers = [
+            paper('Image models', ['cs.CV']),
+            paper('Image data', ['cs.LG']),
+            paper('Detection', ['cs.CV']),
+        ]
+
+        routed = ArxivQueryPlanner.route(papers, batch)
+
+        self.assertEqual([p['title'] for p in routed['vision']], ['Image models'])
+        self.assertEqual([p['title'] for p in routed['images']], ['Image models', 'Image data'])
+
+
+class TestResearchCollectorPlanning(unittest.TestCase):
+    """Test cases for combined competition searches."""
+
+    def setUp(self):
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: default
+        with patch('src.collectors.research_collector.arxiv.Client'):
+            self.collector = ResearchCollector(config)
+
+    def test_client_without_private_session_is_left_alone(self):
+        """Other arxiv versions keep their own session instead of failing."""
+        config = Mock()
+        config.get.side_effect = lambda key, default=None: default
+        client = Mock(spec=['results'])
+        with patch('src.collectors.research_collector.arxiv.Client', return_value=client):
+            collector = ResearchCollector(config)
+
+        self.assertIs(collector.arxiv_client, client)
+        self.assertFalse(hasattr(client, '_session'))
+
+    def test_competitions_share_one_query(self):
+        """Several competitions are served by a single arXiv search."""
+        self.collector._search_arxiv = Mock(return_value=[
+            paper('Protein folding with transformers'),
+            paper('Stock price forecasting'),
+        ])
+
+        results = self.collector.get_papers_for_competitions(
+            ['Protein Folding', 'Stock Price Forecasting']
+        )
+
+        self.assertEqual(self.collector._search_arxiv.call_count, 1)
+        self.assertEqual(
+            [p['title'] for p in results['Protein Folding']],
+            ['Protein folding with transformers']
+        )
+        self.assertEqual(
+            [p['title'] for p in results['Stock Price Forecasting']],
+            ['Stock price forecasting']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Unit tests for circuit breakers."""
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import requests
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collectors.github_search import GitHubSearchClient
+from src.utils.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test cases for CircuitBreaker."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.breaker = CircuitBreaker('kaggle', failure_threshold=2, reset_timeout=60,
+                                      clock=lambda: self.now)
+
+    def test_opens_after_consecutive_failures(self):
+        """Calls short-circuit once the threshold is reached."""
+        failing = Mock(side_effect=TimeoutError("timed out"))
+        for _ in range(2):
+            with self.assertRaises(TimeoutError):
+                self.breaker.call(failing)
+
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call(failing)
+        self.assertEqual(failing.call_count, 2)
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_half_open_probe(self):
+        """After the reset timeout one probe decides whether the circuit closes."""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        self.now = 61
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())  # only one probe at a time
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+
+        self.now = 122
+        self.assertEqual(self.breaker.call(lambda: "ok"), "ok")
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_github_search_falls_back_to_cache(self):
+        """With REST search down, later searches cost no requests."""
+        session = Mock()
+        session.get.side_effect = [Mock(status_code=200, headers={}, json=Mock(return_value={}))] + \
+            [requests.ConnectionError("connect timeout")] * 3
+        breakers = CircuitBreakerRegistry(failure_threshold=2)
+        client = GitHubSearchClient(session=session, breakers=breakers)
+
+        results = client.search(['a', 'b', 'c', 'd'])
+
+        self.assertEqual(results, [[], [], [], []])
+        self.assertEqual(session.get.call_count, 3)  # rate limits + two failed searches
+        self.assertEqual(breakers.states(), {'github.graphql': CLOSED, 'github.search': OPEN})
+
+
+if __name__ == '__main__':
+    unittest.main()
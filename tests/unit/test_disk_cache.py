@@ -0,0 +1,77 @@
+"""Unit tests for DiskCache."""
+import unittest
+import tempfile
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.disk_cache import DiskCache
+
+
+class TestDiskCache(unittest.TestCase):
+    """Test cases for DiskCache."""
+
+    def setUp(self):
+        """Set up a cache in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "test.sqlite"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_roundtrip_and_stats(self):
+        """Stored values are returned and counted as hits."""
+        cache = DiskCache(self.path)
+        cache.set('k', {'text': 'hello'})
+
+        self.assertEqual(cache.get('k'), {'text': 'hello'})
+        self.assertIsNone(cache.get('missing'))
+
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['entries'], 1)
+
+    def test_persists_across_instances(self):
+        """A second cache on the same file sees earlier entries."""
+        DiskCache(self.path).set('k', 'v')
+
+        self.assertEqual(DiskCache(self.path).get('k'), 'v')
+
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are misses."""
+        cache = DiskCache(self.path, ttl=60)
+
+        with patch('src.utils.disk_cache.time.time', return_value=1000.0):
+            cache.set('k', 'v')
+        with patch('src.utils.disk_cache.time.time', return_value=1061.0):
+            self.assertIsNone(cache.get('k'))
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted over max_entries."""
+        cache = DiskCache(self.path, max_entries=2)
+
+        with patch('src.utils.disk_cache.time.time', side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set('a', 1)
+            cache.set('b', 2)
+            cache.get('a')  # 'b' is now least recently used
+            cache.set('c', 3)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_make_key_is_stable(self):
+        """Keys depend only on content, not on dict ordering."""
+        key1 = DiskCache.make_key('model', {'a': 1, 'b': 2}, 'prompt')
+        key2 = DiskCache.make_key('model', {'b': 2, 'a': 1}, 'prompt')
+
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, DiskCache.make_key('model', {'a': 1, 'b': 2}, 'other'))
+
+
+if __name__ == '__main__':
+    unittest.main()
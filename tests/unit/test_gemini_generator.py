@@ -24,6 +24,7 @@ class TestGeminiGenerator(unittest.TestCase):
             'gemini.retry_delay': 1,
             'gemini.temperature': 0.7,
             'gemini.max_tokens': 8000,
+            'gemini.burst': 3,
         }.get(key, default)
 
     @patch('src.generators.gemini_generator.genai')
@@ -141,6 +142,36 @@ class TestGeminiGenerator(unittest.TestCase):
             f"Expected failure message in result: {result}"
         )
 
+    @patch('src.generators.gemini_generator.genai')
+    def test_response_cache_skips_api_call(self, mock_genai):
+        """Test identical prompts are served from the response cache."""
+        import tempfile
+
+        mock_response = Mock()
+        mock_response.text = "Cached text"
+
+        mock_model = Mock()
+        mock_model.generate_content.return_value = mock_response
+        mock_genai.GenerativeModel.return_value = mock_model
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            settings = {
+                'gemini.model': 'gemini-2.5-flash',
+                'gemini.retry_attempts': 3,
+                'cache.dir': cache_dir,
+                'cache.gemini': {'enabled': True, 'ttl': 3600, 'max_entries': 10},
+            }
+            self.config.get.side_effect = lambda key, default=None: settings.get(key, default)
+
+            generator = GeminiGenerator(self.config)
+            first = generator._generate_with_retry("Same prompt")
+            second = generator._generate_with_retry("Same prompt")
+
+            self.assertEqual(first, "Cached text")
+            self.assertEqual(second, "Cached text")
+            mock_model.generate_content.assert_called_once()
+            self.assertEqual(generator.cache_stats()['hits'], 1)
+
 
 class TestGeminiGeneratorIntegration(unittest.TestCase):
     """Integration tests for Gemini Generator (requires real API key)."""
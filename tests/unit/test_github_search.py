@@ -0,0 +1,144 @@
+"""Unit tests for the batched GitHub search client."""
+import unittest
+import tempfile
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collectors.github_search import GitHubSearchClient, RateLimitBudget, REST_SEARCH_URL
+from src.utils.disk_cache import DiskCache
+
+
+def response(status_code=200, payload=None, headers=None):
+    resp = Mock()
+    resp.status_code = status_code
+    resp.json.return_value = payload or {}
+    resp.headers = headers or {}
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+class TestGitHubSearchClient(unittest.TestCase):
+    """Test cases for GitHubSearchClient."""
+
+    def setUp(self):
+        """Set up an ETag cache in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskCache(Path(self.tmp_dir.name) / "github.sqlite")
+        self.session = Mock()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_graphql_batches_all_queries(self):
+        """All searches go out as aliases of a single GraphQL request."""
+        node = {
+            'name': 'repo', 'nameWithOwner': 'me/repo', 'url': 'https://github.com/me/repo',
+            'description': None, 'stargazerCount': 42,
+            'primaryLanguage': {'name': 'Python'}, 'updatedAt': '2024-01-02T03:04:05Z'
+        }
+        self.session.post.return_value = response(payload={
+            'data': {'q0': {'nodes': [node]}, 'q1': {'nodes': []}, 'q2': {'nodes': [node]}}
+        })
+        client = GitHubSearchClient(token='t', session=self.session)
+
+        results = client.search(['a xgboost', 'a lightgbm', 'b xgboost'])
+
+        self.assertEqual(self.session.post.call_count, 1)
+        self.assertNotIn(REST_SEARCH_URL, [c.args[0] for c in self.session.get.call_args_list])
+        document = self.session.post.call_args.kwargs['json']['query']
+        self.assertIn('q2: search(query: "b xgboost sort:stars-desc"', document)
+        self.assertEqual([len(r) for r in results], [1, 0, 1])
+        self.assertEqual(results[0][0]['full_name'], 'me/repo')
+        self.assertEqual(results[0][0]['description'], 'No description')
+        self.assertEqual(results[0][0]['updated_at'], '2024-01-02T03:04:05+00:00')
+
+    def test_rest_fallback_revalidates_with_etag(self):
+        """Without a token, REST is used and a 304 serves the cached results."""
+        item = {'name': 'repo', 'full_name': 'me/repo', 'html_url': 'u',
+                'stargazers_count': 7, 'language': None}
+        self.session.get.side_effect = [
+            response(payload={'resources': {}}),
+            response(payload={'items': [item]}, headers={'ETag': '"abc"'}),
+            response(status_code=304),
+        ]
+        client = GitHubSearchClient(session=self.session, etag_cache=self.cache)
+
+        first = client.search(['q'])
+        second = client.search(['q'])
+
+        self.session.post.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(second[0][0]['stars'], 7)
+        self.assertEqual(
+            self.session.get.call_args.kwargs['headers']['If-None-Match'], '"abc"'
+        )
+
+
+class TestRateLimitBudget(unittest.TestCase):
+    """Test cases for RateLimitBudget."""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        self.budget = RateLimitBudget(max_wait=120, clock=lambda: self.now, sleep=sleep)
+
+    def test_waits_until_reset(self):
+        """An exhausted budget waits exactly until the reset time."""
+        self.budget.update({'X-RateLimit-Remaining': '1', 'X-RateLimit-Reset': '1030'}, 'search')
+
+        self.assertTrue(self.budget.acquire('search'))
+        self.assertTrue(self.budget.acquire('search'))
+        self.assertEqual(self.sleeps, [31.0])
+
+    def test_refuses_long_waits(self):
+        """Requests are refused when the reset is further away than max_wait."""
+        self.budget.set('graphql', 0, self.now + 3600)
+
+        self.assertFalse(self.budget.acquire('graphql'))
+        self.assertEqual(self.sleeps, [])
+
+    def test_skips_lowest_priority_searches(self):
+        """Trailing queries are skipped once the search budget is gone."""
+        session = Mock()
+        session.get.side_effect = [
+            response(payload={'resources': {'search': {'remaining': 1, 'reset': self.now + 3600}}}),
+            response(payload={'items': []}),
+        ]
+        client = GitHubSearchClient(session=session, budget=self.budget)
+
+        self.assertEqual(client.search(['first', 'second']), [[], []])
+        self.assertEqual(session.get.call_count, 2)
+
+    def test_graphql_budget_trims_lowest_priority_aliases(self):
+        """Aliases the GraphQL budget cannot cover fall back to REST search."""
+        session = Mock()
+        session.get.side_effect = [
+            response(payload={'resources': {'graphql': {'remaining': 1, 'reset': self.now + 3600}}}),
+            response(payload={'items': []}),
+        ]
+        session.post.return_value = response(payload={
+            'data': {'q0': {'nodes': []}, 'q1': {'nodes': []}}
+        })
+        client = GitHubSearchClient(token='t', session=session, budget=self.budget)
+
+        # 50 results per alias: two aliases cost one point, three cost two
+        client.search(['first', 'second', 'third'], per_query=50)
+
+        document = session.post.call_args.kwargs['json']['query']
+        self.assertIn('q1: search(query: "second', document)
+        self.assertNotIn('third', document)
+        self.assertEqual(session.get.call_args.kwargs['params']['q'], 'third')
+        self.assertEqual(self.budget.remaining('graphql'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Unit tests for incremental harvesting."""
+import unittest
+import tempfile
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.harvest_state import HarvestState, harvest
+
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def make_results(days):
+    """Fake results published the given number of days before NOW, newest first."""
+    return [{'id': f"p{d}", 'published': NOW - timedelta(days=d)} for d in sorted(days)]
+
+
+class TestHarvest(unittest.TestCase):
+    """Test cases for harvest and HarvestState."""
+
+    def setUp(self):
+        """Set up a state store in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.state = HarvestState(Path(self.tmp_dir.name) / "harvest.sqlite")
+        self.consumed = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _run(self, results, days_back=30, limit=10, state=True):
+        def iterate():
+            for result in results:
+                self.consumed.append(result['id'])
+                yield result
+
+        return harvest(
+            iterate(),
+            cutoff=NOW - timedelta(days=days_back),
+            limit=limit,
+            identify=lambda r: (r['id'], r['published']),
+            convert=lambda r: r['id'],
+            state=self.state if state else None,
+            query='q'
+        )
+
+    def test_without_state_filters_window(self):
+        """Without a state store every result inside the window is returned."""
+        papers = self._run(make_results([1, 5, 40, 50]), state=False)
+
+        self.assertEqual(papers, ['p1', 'p5'])
+        self.assertEqual(self.consumed, ['p1', 'p5', 'p40'])
+
+    def test_second_run_fetches_only_delta(self):
+        """A later run stops paging at the first already-seen paper."""
+        self._run(make_results([3, 5, 20, 40]))
+        self.consumed.clear()
+
+        papers = self._run(make_results([0, 1, 3, 5, 20, 40]))
+
+        self.assertEqual(self.consumed, ['p0', 'p1', 'p3'])
+        self.assertEqual(papers, ['p0', 'p1', 'p3', 'p5', 'p20'])
+
+    def test_longer_window_triggers_full_fetch(self):
+        """Stored papers are not reused for a window they do not cover."""
+        self._run(make_results([1, 5, 20]), days_back=7)
+        self.consumed.clear()
+
+        papers = self._run(make_results([1, 5, 20]), days_back=30)
+
+        self.assertEqual(self.consumed, ['p1', 'p5', 'p20'])
+        self.assertEqual(papers, ['p1', 'p5', 'p20'])
+
+    def test_limit_is_respected_after_merge(self):
+        """Merged results are capped at the limit, newest first."""
+        self._run(make_results([2, 3, 4]), limit=3)
+        self.consumed.clear()
+
+        papers = self._run(make_results([0, 1, 2, 3, 4]), limit=3)
+
+        self.assertEqual(self.consumed, ['p0', 'p1', 'p2'])
+        self.assertEqual(papers, ['p0', 'p1', 'p2'])
+
+    def _run_combined(self, results, clauses):
+        def iterate():
+            for result in results:
+                self.consumed.append(result['id'])
+                yield result
+
+        return harvest(
+            iterate(),
+            cutoff=NOW - timedelta(days=30),
+            limit=10,
+            identify=lambda r: (r['id'], r['published']),
+            convert=lambda r: r,
+            state=self.state,
+            query=' OR '.join(clauses),
+            clauses={clause: (10, lambda r, c=clause: r['clause'] == c) for clause in clauses}
+        )
+
+    def test_changed_combination_reuses_clause_marks(self):
+        """A new grouping of already-harvested clauses only fetches the delta."""
+        def results(pairs):
+            return [
+                {'id': f"{clause}{d}", 'clause': clause, 'published': NOW - timedelta(days=d)}
+                for d, clause in sorted(pairs)
+            ]
+
+        self._run_combined(results([(2, 'a'), (4, 'b'), (8, 'a')]), ['a', 'b'])
+        self._run_combined(results([(3, 'c'), (4, 'b'), (9, 'c')]), ['b', 'c'])
+        self.consumed.clear()
+
+        papers = self._run_combined(
+            results([(0, 'a'), (1, 'c'), (2, 'a'), (3, 'c'), (8, 'a'), (9, 'c')]), ['a', 'c']
+        )
+
+        # Paging stops below the older of the two clause marks (c3)
+        self.assertEqual(self.consumed, ['a0', 'c1', 'a2', 'c3', 'a8'])
+        self.assertEqual([p['id'] for p in papers], ['a0', 'c1', 'a2', 'c3', 'a8', 'c9'])
+
+
+if __name__ == '__main__':
+    unittest.main()
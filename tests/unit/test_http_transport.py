@@ -0,0 +1,51 @@
+"""Unit tests for the shared HTTP transport."""
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+import urllib3
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.http_transport import HttpTransport
+
+
+class TestHttpTransport(unittest.TestCase):
+    """Test cases for HttpTransport."""
+
+    def test_sessions_are_shared_per_api(self):
+        """Collectors asking for the same API get the same pooled session."""
+        transport = HttpTransport.from_config({'http': {'pool_maxsize': 16}})
+
+        github = transport.session('github')
+        self.assertIs(transport.session('github'), github)
+        self.assertIsNot(transport.session('arxiv'), github)
+        self.assertEqual(github.get_adapter('https://api.github.com')._pool_maxsize, 16)
+
+    def test_default_timeout(self):
+        """Requests without a timeout get the configured one; explicit ones win."""
+        transport = HttpTransport(connect_timeout=2, read_timeout=7)
+        url = 'https://export.arxiv.org/api/query'
+        adapter = transport.session('arxiv').get_adapter(url)
+        request = requests.Request('GET', url).prepare()
+
+        with patch('requests.adapters.HTTPAdapter.send') as send:
+            adapter.send(request)
+            adapter.send(request, timeout=60)
+
+        self.assertEqual([c.kwargs['timeout'] for c in send.call_args_list], [(2, 7), 60])
+
+    def test_configures_client_pool_manager(self):
+        """A client's own urllib3 pool gets the pool size and timeouts."""
+        pool_manager = urllib3.PoolManager(maxsize=1)
+        HttpTransport(connect_timeout=3, read_timeout=9, pool_maxsize=8).configure_pool_manager(pool_manager)
+
+        self.assertEqual(pool_manager.connection_pool_kw['maxsize'], 8)
+        self.assertEqual(pool_manager.connection_pool_kw['timeout'].read_timeout, 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 """Unit tests for Kaggle Collector."""
+import os
 import unittest
+import zipfile
 from unittest.mock import Mock, patch, MagicMock
 import sys
 from pathlib import Path
@@ -14,6 +16,7 @@ sys.modules['kaggle.api'] = MagicMock()
 sys.modules['kaggle.api.kaggle_api_extended'] = MagicMock()
 
 from src.collectors.kaggle_collector import KaggleCollector
+from src.collectors.competition_ranker import CompetitionRanker
 from src.utils.config_loader import ConfigLoader
 
 
@@ -89,6 +92,119 @@ class TestKaggleCollector(unittest.TestCase):
 
         self.assertEqual(competitions, [])
 
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_competition_snapshot_fetched_once(self, mock_kaggle_api):
+        """Test active and new competition lookups share one listing."""
+        mock_api = Mock()
+        mock_kaggle_api.return_value = mock_api
+
+        mock_comp = Mock()
+        mock_comp.id = 'comp-1'
+        mock_comp.title = 'Featured Competition'
+        mock_comp.category = 'Featured'
+        mock_comp.teamCount = 50
+        mock_api.competitions_list.return_value = [mock_comp]
+
+        collector = KaggleCollector(self.config)
+        active = collector.get_active_competitions()
+        new = collector.get_new_competitions(days=1)
+
+        self.assertEqual(len(active), 1)
+        self.assertEqual(len(new), 1)
+        mock_api.competitions_list.assert_called_once()
+
+        # Callers get copies, so annotating them leaves the snapshot intact
+        active[0]['ranking_score'] = 1.0
+        self.assertNotIn('ranking_score', collector.get_active_competitions()[0])
+
+        collector.invalidate_competition_snapshot()
+        collector.get_active_competitions()
+        self.assertEqual(mock_api.competitions_list.call_count, 2)
+
+    def _mock_competition(self, comp_id, category='Featured', reward='$0', team_count=0):
+        """Build a mock Kaggle competition object."""
+        comp = Mock()
+        comp.id = comp_id
+        comp.title = comp_id
+        comp.category = category
+        comp.reward = reward
+        comp.teamCount = team_count
+        comp.description = ''
+        comp.tags = []
+        return comp
+
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_iter_competitions_walks_pages_lazily(self, mock_kaggle_api):
+        """Test listing pages are fetched on demand and filtered while streaming."""
+        mock_api = Mock()
+        mock_kaggle_api.return_value = mock_api
+
+        page1 = [self._mock_competition(f'f{i}') for i in range(19)]
+        page1.append(self._mock_competition('community', category='Community'))
+        page1[-1].isKernelsSubmissionsOnly = True
+        page2 = [self._mock_competition('last')]
+        mock_api.competitions_list.side_effect = lambda page=1, **kwargs: {1: page1, 2: page2}[page]
+
+        collector = KaggleCollector(self.config)
+        stream = collector.iter_competitions()
+
+        first = next(stream)
+        self.assertEqual(first['id'], 'f0')
+        self.assertEqual(mock_api.competitions_list.call_count, 1)
+
+        remaining = [comp['id'] for comp in stream]
+        self.assertNotIn('community', remaining)
+        self.assertEqual(remaining[-1], 'last')
+        # Second page was shorter than the page size, so no third request
+        self.assertEqual(mock_api.competitions_list.call_count, 2)
+
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_listing_keeps_every_competition(self, mock_kaggle_api):
+        """Test the prize-ordered listing is walked to the end and kept whole."""
+        mock_api = Mock()
+        mock_kaggle_api.return_value = mock_api
+
+        settings = {
+            'competition_selection.top_n': 2,
+            'data_collection.kaggle.listing_sort_by': 'prize',
+        }
+        self.config.get.side_effect = lambda key, default=None: settings.get(key, default)
+
+        pages = {
+            1: [self._mock_competition(f'big{i}', reward='$100,000', team_count=6000) for i in range(20)],
+            2: [self._mock_competition(f'small{i}', reward='$100') for i in range(20)],
+            3: [self._mock_competition(f'tiny{i}', reward='$10') for i in range(5)],
+        }
+        mock_api.competitions_list.side_effect = lambda page=1, **kwargs: pages[page]
+
+        collector = KaggleCollector(self.config)
+        competitions = collector.get_active_competitions()
+
+        self.assertEqual(mock_api.competitions_list.call_count, 3)
+        mock_api.competitions_list.assert_called_with(page=3, sort_by='prize')
+        self.assertEqual(len(competitions), 45)
+        self.assertEqual(len(collector.get_competition_snapshot().competitions), 45)
+
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_scalar_scores_match_batch(self, mock_kaggle_api):
+        """Test single-competition scoring agrees with the vectorized ranker."""
+        competitions = [
+            {'title': 'Healthcare NLP', 'description': None, 'reward': '$25,000 USD',
+             'teamCount': 1200, 'tags': ['time-series']},
+            {'title': 'Retail Forecasting', 'description': 'Multi-modal retail data',
+             'reward': 'Kudos', 'teamCount': None, 'tags': None},
+            {'title': 'Tiny', 'reward': '', 'teamCount': '7000'},
+        ]
+
+        collector = KaggleCollector(self.config)
+        batch = collector.ranker.score_frame(pd.DataFrame.from_records(competitions))
+
+        for i, comp in enumerate(competitions):
+            scalar = collector._score_one(comp)
+            for name in ('prize_value', 'complexity_score', 'industry_score', 'ranking_score'):
+                self.assertAlmostEqual(scalar[name], batch[name].iloc[i])
+            self.assertEqual(scalar['complexity_level'], batch['complexity_level'].iloc[i])
+
     @patch('src.collectors.kaggle_collector.KaggleApi')
     def test_rank_competitions(self, mock_kaggle_api):
         """Test competition ranking."""
@@ -138,6 +254,38 @@ class TestKaggleCollector(unittest.TestCase):
         self.assertEqual(collector._extract_prize_value(''), 0)
         self.assertEqual(collector._extract_prize_value('Invalid'), 0)
 
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_response_cache_reused_across_instances(self, mock_kaggle_api):
+        """Test cached API responses are reused by a later collector."""
+        import tempfile
+
+        mock_api = Mock()
+        mock_kaggle_api.return_value = mock_api
+        mock_api.kernels_list.return_value = [{'title': 'Notebook'}]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            settings = {
+                'data_collection.kaggle.cache_duration': 3600,
+                'cache.dir': cache_dir,
+            }
+            self.config.get.side_effect = lambda key, default=None: settings.get(key, default)
+
+            first = KaggleCollector(self.config)._call_api('kernels_list', competition='c1')
+            second = KaggleCollector(self.config)._call_api('kernels_list', competition='c1')
+            KaggleCollector(self.config)._call_api('kernels_list', competition='c2')
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_api.kernels_list.call_count, 2)
+
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_response_cache_disabled_without_duration(self, mock_kaggle_api):
+        """Test no cache is created when cache_duration is not configured."""
+        mock_kaggle_api.return_value = Mock()
+
+        collector = KaggleCollector(self.config)
+
+        self.assertIsNone(collector.response_cache)
+
 
 class TestKaggleLeaderboard(unittest.TestCase):
     """Test cases specifically for leaderboard functionality."""
@@ -304,6 +452,79 @@ class TestKaggleLeaderboard(unittest.TestCase):
             self.assertEqual(leaderboard.iloc[0]['teamId'], 0)  # Default
             self.assertEqual(leaderboard.iloc[0]['score'], 0.0)  # Default
 
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_get_leaderboard_from_raw_records(self, mock_kaggle_api):
+        """Raw submission records are built into typed columns."""
+        mock_api = Mock()
+        mock_kaggle_api.return_value = mock_api
+        mock_api.competition_view_leaderboard.return_value = {'submissions': [
+            {'teamId': 12345, 'teamName': 'Team Alpha', 'score': '0.95100',
+             'submissionDate': '2025-11-30T10:00:00Z'},
+            {'teamId': 67890, 'teamName': 'Team Beta', 'score': 'n/a',
+             'submissionDate': None},
+        ]}
+
+        collector = KaggleCollector(self.config)
+        leaderboard = collector.get_competition_leaderboard('test-competition')
+
+        self.assertEqual(leaderboard['rank'].tolist(), [1, 2])
+        self.assertEqual(str(leaderboard['rank'].dtype), 'int32')
+        self.assertEqual(str(leaderboard['teamId'].dtype), 'int64')
+        self.assertEqual(leaderboard['score'].iloc[0], 0.951)
+        self.assertTrue(pd.isna(leaderboard['score'].iloc[1]))
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(leaderboard['submissionDate']))
+        mock_api.competition_leaderboard_view.assert_not_called()
+
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_get_leaderboard_full_download(self, mock_kaggle_api):
+        """The full download is parsed from the zip in chunks."""
+        mock_api = Mock()
+        mock_kaggle_api.return_value = mock_api
+
+        rows = "".join(f"{i},{1000 + i},Team {i},2025-11-30 10:00:00,0.{99 - i},{i % 7 + 1}\n"
+                       for i in range(1, 26))
+        csv_text = "Rank,TeamId,TeamName,LastSubmissionDate,Score,SubmissionCount\n" + rows
+
+        def download(competition, path, quiet=True):
+            with zipfile.ZipFile(os.path.join(path, f"{competition}.zip"), 'w') as zf:
+                zf.writestr(f"{competition}-publicleaderboard.csv", csv_text)
+
+        mock_api.competition_leaderboard_download.side_effect = download
+        self.config.get.side_effect = lambda key, default=None: (
+            {'full_download': True, 'download_chunksize': 10}
+            if key == 'data_collection.leaderboard' else {}
+        )
+
+        collector = KaggleCollector(self.config)
+        leaderboard = collector.get_competition_leaderboard('test-competition')
+        stats = collector.get_daily_submission_stats('test-competition')
+
+        self.assertEqual(len(leaderboard), 25)
+        self.assertEqual(leaderboard['rank'].tolist(), list(range(1, 26)))
+        self.assertEqual(leaderboard['teamName'].iloc[-1], 'Team 25')
+        self.assertEqual(stats['unique_submitters'], 25)
+        self.assertEqual(stats['total_submissions'], sum(i % 7 + 1 for i in range(1, 26)))
+        mock_api.competition_leaderboard_view.assert_not_called()
+
+    @patch('src.collectors.kaggle_collector.KaggleApi')
+    def test_submission_stats_from_fetched_leaderboards(self, mock_kaggle_api):
+        """Stats over already-fetched leaderboards make no API calls."""
+        mock_api = Mock()
+        mock_kaggle_api.return_value = mock_api
+        leaderboards = {'c1': pd.DataFrame({'rank': [1, 2], 'score': [0.9, 0.8], 'submissions': [3, 5]})}
+        competitions = [{'id': 'c1', 'maxDailySubmissions': 5}, {'id': 'c2', 'maxDailySubmissions': 2}]
+
+        collector = KaggleCollector(self.config)
+        stats = collector.get_submission_stats(competitions, leaderboards)
+
+        self.assertEqual(stats['c1']['unique_submitters'], 2)
+        self.assertEqual(stats['c1']['total_submissions'], 8)
+        self.assertEqual(stats['c1']['avg_submissions_per_team'], 4.0)
+        self.assertEqual(stats['c1']['max_daily_submissions'], 5)
+        self.assertEqual(stats['c2']['unique_submitters'], 0)
+        mock_api.competition_view_leaderboard.assert_not_called()
+        mock_api.competition_list_cli.assert_not_called()
+
 
 class TestKaggleKernels(unittest.TestCase):
     """Test cases for kernel fetching."""
@@ -461,5 +682,40 @@ class TestKaggleCompetitionFiltering(unittest.TestCase):
         self.assertLessEqual(score2, score1)
 
 
+class TestCompetitionRanker(unittest.TestCase):
+    """Test cases for the vectorized ranking engine."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.ranker = CompetitionRanker(
+            weights={'prize_money': 0.3, 'participants': 0.25, 'complexity': 0.25, 'industry_relevance': 0.2},
+            complexity_indicators=['nlp', 'time-series'],
+            industries=['healthcare', 'finance']
+        )
+
+    def test_score_frame_matches_formula(self):
+        """Test scores for a catalog frame follow the ranking formula."""
+        frame = pd.DataFrame([
+            {'title': 'Healthcare NLP', 'description': '', 'reward': '$50,000', 'teamCount': 2500, 'tags': []},
+            {'title': 'Other', 'description': 'finance', 'reward': 'Kudos', 'teamCount': None, 'tags': ['Time-Series']},
+        ])
+
+        scored = self.ranker.score_frame(frame)
+
+        self.assertAlmostEqual(scored['ranking_score'].iloc[0], 0.15 + 0.125 + 0.125 + 0.1)
+        self.assertAlmostEqual(scored['ranking_score'].iloc[1], 0.125 + 0.1)
+        self.assertEqual(scored['prize_value'].iloc[1], 0)
+        self.assertEqual(list(scored['complexity_level']), ['Complex', 'Complex'])
+
+    def test_rank_is_stable_for_ties(self):
+        """Test equal scores keep their input order."""
+        competitions = [{'id': i, 'title': 'Same', 'reward': '$1,000', 'teamCount': 10} for i in range(5)]
+
+        ranked = self.ranker.rank(competitions)
+
+        self.assertEqual([comp['id'] for comp in ranked], [0, 1, 2, 3, 4])
+        self.assertIn('ranking_score', ranked[0])
+
+
 if __name__ == '__main__':
     unittest.main()
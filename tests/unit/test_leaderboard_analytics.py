@@ -0,0 +1,98 @@
+"""Unit tests for leaderboard analytics."""
+import unittest
+import sys
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collectors.leaderboard_analytics import rank_velocity, shake_up, summarize
+
+
+class TestLeaderboardAnalytics(unittest.TestCase):
+    """Test cases for leaderboard summaries."""
+
+    def test_score_distribution(self):
+        """Gaps, cut-offs and closeness are computed in rank order."""
+        leaderboard = pd.DataFrame({
+            'rank': [3, 1, 2, 4],
+            'score': [0.90, 0.95, 0.95, 0.50],
+        })
+
+        summary = summarize(leaderboard, total_teams=4)
+
+        self.assertTrue(summary.higher_is_better)
+        self.assertTrue(summary.complete)
+        self.assertEqual(summary.teams, 4)
+        self.assertEqual(summary.lead, 0.0)
+        self.assertEqual(summary.ties, 1)
+        self.assertEqual(summary.largest_gap, (0.4, 3))
+        self.assertEqual(summary.bands[0.5], 0.95)
+        self.assertEqual(summary.near_leader, (1, 1))
+        self.assertIn("4 teams, higher is better", summary.to_prompt())
+
+    def test_partial_leaderboard_is_labelled(self):
+        """A top slice is not presented as the whole field."""
+        leaderboard = pd.DataFrame({'rank': [1, 2, 3], 'score': [0.9, 0.8, 0.7]})
+        changes = pd.DataFrame({
+            'rank': [1, 2, 3],
+            'rank_change': [0.0, 1.0, np.nan],
+            'is_new': [False, False, True],
+        })
+
+        prompt = summarize(leaderboard, changes, total_teams=1200).to_prompt()
+
+        self.assertIn("top 3 of 1200 teams", prompt)
+        self.assertIn("among the top 3 shown", prompt)
+        self.assertNotIn("Cut-offs", prompt)
+        self.assertNotIn("new teams", prompt)
+        self.assertIn("Cut-offs", summarize(leaderboard, total_teams=3).to_prompt())
+
+    def test_lower_is_better_and_shake_up(self):
+        """Error metrics rank ascending; private scores give shake-up."""
+        leaderboard = pd.DataFrame({
+            'rank': [1, 2, 3],
+            'score': [0.1, 0.2, 0.3],
+            'privateScore': [0.3, 0.2, 0.1],
+        })
+
+        summary = summarize(leaderboard)
+
+        self.assertFalse(summary.higher_is_better)
+        self.assertAlmostEqual(summary.shake_up['rank_correlation'], -1.0)
+        self.assertAlmostEqual(summary.shake_up['mean_shift'], 4 / 3)
+
+    def test_shake_up_top_turnover(self):
+        """Public top teams that fall out of the private top are counted."""
+        result = shake_up(np.arange(1, 21), np.r_[11:21, 1:11], top=10)
+        self.assertEqual(result['top_dropped'], 10)
+
+    def test_rank_velocity(self):
+        """Rank changes are normalized by the days between snapshots."""
+        changes = pd.DataFrame({
+            'rank': [1, 2, 3, 4],
+            'rank_change': [4.0, 0.0, -2.0, np.nan],
+            'is_new': [False, False, False, True],
+        })
+        changes.attrs.update(start=date(2024, 3, 1), end=date(2024, 3, 3))
+
+        velocity = rank_velocity(changes)
+
+        self.assertEqual(velocity['days'], 2)
+        self.assertEqual(velocity['max_climb'], 2)
+        self.assertEqual(velocity['median_moves'], 1)
+        self.assertAlmostEqual(velocity['top_moved'], 2 / 3)
+        self.assertEqual(velocity['new_teams'], 1)
+
+    def test_empty_leaderboard(self):
+        """Leaderboards without scores give no summary."""
+        self.assertIsNone(summarize(pd.DataFrame({'rank': [1], 'score': [np.nan]})))
+        self.assertIsNone(summarize(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Unit tests for the leaderboard snapshot store."""
+import unittest
+import tempfile
+import sys
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collectors import leaderboard_store
+from src.collectors.leaderboard_store import LeaderboardStore
+
+
+def leaderboard(*teams):
+    return pd.DataFrame([
+        {'rank': rank, 'teamId': team_id, 'teamName': f"team{team_id}",
+         'score': score, 'submissionDate': '2024-01-01'}
+        for rank, team_id, score in teams
+    ])
+
+
+@unittest.skipIf(leaderboard_store.pa is None, "pyarrow is not installed")
+class TestLeaderboardStore(unittest.TestCase):
+    """Test cases for LeaderboardStore."""
+
+    def setUp(self):
+        """Set up a store in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = LeaderboardStore(self.tmp_dir.name, today=date(2024, 3, 3))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_deltas_between_snapshots(self):
+        """Rank and score movement is computed per team."""
+        self.store.save('comp', leaderboard((1, 10, 0.90), (2, 20, '0.85'), (3, 30, 0.80)),
+                        snapshot_date=date(2024, 3, 1))
+        self.store.save('comp', leaderboard((1, 30, 0.93), (2, 10, 0.91), (3, 40, 0.88)),
+                        snapshot_date=date(2024, 3, 2))
+
+        changes = self.store.deltas('comp')
+
+        self.assertEqual(changes['teamId'].tolist(), [30, 10, 40])
+        self.assertEqual(changes['rank_change'].tolist()[:2], [2, -1])
+        self.assertAlmostEqual(changes['score_change'].iloc[0], 0.13)
+        self.assertEqual(changes['is_new'].tolist(), [False, False, True])
+        self.assertEqual(changes.attrs['start'], date(2024, 3, 1))
+
+    def test_deltas_match_teams_without_id_by_name(self):
+        """Teams whose ID is missing (stored as 0) are matched by name, not with each other."""
+        before = leaderboard((1, 0, 0.90), (2, 0, 0.85))
+        before['teamName'] = ['alpha', 'beta']
+        after = leaderboard((1, 0, 0.92), (2, 0, 0.91), (3, 0, 0.80))
+        after['teamName'] = ['beta', 'alpha', 'gamma']
+        self.store.save('comp', before, snapshot_date=date(2024, 3, 1))
+        self.store.save('comp', after, snapshot_date=date(2024, 3, 2))
+
+        changes = self.store.deltas('comp')
+
+        self.assertEqual(len(changes), 3)
+        self.assertEqual(changes['teamName'].tolist(), ['beta', 'alpha', 'gamma'])
+        self.assertEqual(changes['rank_change'].tolist()[:2], [1, -1])
+        self.assertEqual(changes['is_new'].tolist(), [False, False, True])
+
+    def test_optional_columns_are_kept(self):
+        """Submission counts and private scores are stored, and null where not collected."""
+        full = leaderboard((1, 10, 0.9), (2, 20, 0.8))
+        full['submissions'] = [12, 3]
+        full['privateScore'] = [0.88, None]
+        self.store.save('comp', full, snapshot_date=date(2024, 3, 1))
+        self.store.save('comp', leaderboard((1, 10, 0.9)), snapshot_date=date(2024, 3, 2))
+
+        stored = self.store.load('comp', date(2024, 3, 1))
+        self.assertEqual(stored['submissions'].tolist(), [12, 3])
+        self.assertAlmostEqual(stored['privateScore'].iloc[0], 0.88)
+        self.assertTrue(pd.isna(stored['privateScore'].iloc[1]))
+        self.assertTrue(self.store.load('comp')[['submissions', 'privateScore']].isna().all().all())
+
+    def test_snapshot_interval(self):
+        """A second snapshot inside the interval is skipped; same-day re-runs replace."""
+        store = LeaderboardStore(self.tmp_dir.name, snapshot_interval=7 * 86400)
+        self.assertTrue(store.save('comp', leaderboard((1, 10, 0.9)), snapshot_date=date(2024, 3, 1)))
+        self.assertTrue(store.save('comp', leaderboard((1, 20, 0.9)), snapshot_date=date(2024, 3, 1)))
+        self.assertFalse(store.save('comp', leaderboard((1, 30, 0.9)), snapshot_date=date(2024, 3, 5)))
+
+        self.assertEqual(store.dates('comp'), [date(2024, 3, 1)])
+        self.assertEqual(store.load('comp')['teamId'].tolist(), [20])
+        self.assertIsNone(store.deltas('comp'))
+
+    def test_history_reads_date_range(self):
+        """History returns the snapshots inside the range, oldest first."""
+        for day in (1, 2, 3):
+            self.store.save('comp', leaderboard((1, 10, 0.8 + day / 100), (2, 20, 0.8)),
+                            snapshot_date=date(2024, 3, day))
+
+        history = self.store.history('comp', since=date(2024, 3, 2), columns=['teamId', 'score'])
+
+        self.assertEqual(list(history.columns), ['date', 'teamId', 'score'])
+        self.assertEqual(sorted(set(history['date'])), [date(2024, 3, 2), date(2024, 3, 3)])
+        self.assertTrue(self.store.history('other').empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Unit tests for PaperDeduplicator."""
+import unittest
+import tempfile
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collectors.paper_dedup import PaperDeduplicator
+
+
+SUMMARY = (
+    "We introduce a gradient boosting method for tabular data that combines "
+    "target encoding with ordered boosting and evaluate it on twenty public "
+    "benchmarks where it outperforms strong baselines by a wide margin."
+)
+
+
+def paper(url, title, summary=SUMMARY):
+    return {'url': url, 'title': title, 'summary': summary}
+
+
+class TestPaperDeduplicator(unittest.TestCase):
+    """Test cases for PaperDeduplicator."""
+
+    def setUp(self):
+        """Set up a history file in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history = Path(self.tmp_dir.name) / "history.sqlite"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_collapses_duplicates_across_sections(self):
+        """Same ID, other versions and near-identical texts are dropped."""
+        dedup = PaperDeduplicator()
+        first = dedup.dedupe([
+            paper("http://arxiv.org/abs/2401.00001v1", "Boosting for Tabular Data"),
+            paper("http://arxiv.org/abs/2401.00002v1", "Vision Transformers at Scale",
+                  "Scaling image models to billions of parameters improves transfer."),
+        ])
+        second = dedup.dedupe([
+            paper("https://arxiv.org/abs/2401.00001v2", "Boosting for Tabular Data (v2)"),
+            paper("http://example.org/mirror", "Boosting for tabular data.",
+                  SUMMARY.replace("twenty", "20")),
+            paper("http://arxiv.org/abs/2401.00003v1", "Graph Neural Networks for Molecules",
+                  "Message passing networks predict molecular properties accurately."),
+        ])
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual([p['url'] for p in second], ["http://arxiv.org/abs/2401.00003v1"])
+
+    def test_history_across_days(self):
+        """Papers reported on an earlier day are dropped; same-day reruns are not."""
+        papers = [paper("http://arxiv.org/abs/2401.00001v1", "Boosting for Tabular Data")]
+
+        day_one = PaperDeduplicator(history_path=self.history, today=date(2024, 6, 1))
+        self.assertEqual(len(day_one.dedupe(papers)), 1)
+        day_one.record(papers)
+
+        rerun = PaperDeduplicator(history_path=self.history, today=date(2024, 6, 1))
+        self.assertEqual(len(rerun.dedupe(papers)), 1)
+
+        day_two = PaperDeduplicator(history_path=self.history, today=date(2024, 6, 2))
+        self.assertEqual(day_two.dedupe(papers), [])
+
+        much_later = PaperDeduplicator(history_path=self.history, history_days=7,
+                                       today=date(2024, 6, 20))
+        self.assertEqual(len(much_later.dedupe(papers)), 1)
+
+    def test_consecutive_days_refill_from_candidates(self):
+        """Papers reported yesterday are replaced by the next candidates."""
+        candidates = [
+            paper(f"http://arxiv.org/abs/2401.0000{i}v1", title, summary)
+            for i, (title, summary) in enumerate([
+                ("Boosting for Tabular Data", SUMMARY),
+                ("Vision Transformers at Scale", "Scaling image models to billions of parameters."),
+                ("Graph Neural Networks for Molecules", "Message passing predicts molecular properties."),
+                ("Diffusion Models for Audio", "Denoising diffusion generates speech and music."),
+            ])
+        ]
+
+        day_one = PaperDeduplicator(history_path=self.history, today=date(2024, 6, 1))
+        shown = day_one.dedupe(candidates, limit=2)
+        self.assertEqual(len(shown), 2)
+
+        # Nothing is recorded until the blog is saved
+        unsaved = PaperDeduplicator(history_path=self.history, today=date(2024, 6, 2))
+        self.assertEqual(unsaved.dedupe(candidates, limit=2), shown)
+
+        day_one.record(shown)
+        day_two = PaperDeduplicator(history_path=self.history, today=date(2024, 6, 2))
+        self.assertEqual(day_two.dedupe(candidates, limit=2), candidates[2:])
+
+
+if __name__ == '__main__':
+    unittest.main()
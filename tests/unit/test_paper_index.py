@@ -0,0 +1,66 @@
+"""Unit tests for the local paper index."""
+import unittest
+import tempfile
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collectors.paper_index import PaperIndex, tokenize
+
+
+def paper(n, title, summary='', published='2024-05-01T00:00:00+00:00'):
+    return {'url': f"http://arxiv.org/abs/{n}", 'title': title, 'summary': summary,
+            'published': published}
+
+
+class TestPaperIndex(unittest.TestCase):
+    """Test cases for PaperIndex."""
+
+    def setUp(self):
+        """Set up an index in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "index.sqlite"
+        self.index = PaperIndex(self.path)
+        self.index.add([
+            paper(1, "Medical image segmentation with transformers", "Segmenting CT images."),
+            paper(2, "Time series forecasting for retail sales", "Forecasting demand."),
+            paper(3, "Image classification benchmarks", "A survey of images.",
+                  published='2023-01-01T00:00:00+00:00'),
+        ])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_tokenize(self):
+        """Stopwords and short words are dropped and plurals folded."""
+        self.assertEqual(tokenize("The Images of CT scans"), ['image', 'scan'])
+
+    def test_search_ranks_best_match_first(self):
+        """The most relevant paper is returned first."""
+        results = self.index.search("Image Segmentation Challenge", limit=2)
+
+        self.assertEqual([p['url'][-1] for p in results], ['1', '3'])
+        self.assertEqual(self.index.search("quantum chemistry"), [])
+
+    def test_incremental_and_persistent(self):
+        """Known papers are skipped and the index survives reopening."""
+        self.assertEqual(self.index.add([paper(1, "Medical image segmentation")]), 0)
+
+        reopened = PaperIndex(self.path)
+        self.assertEqual(len(reopened), 3)
+        self.assertEqual(
+            [p['url'][-1] for p in reopened.search("retail sales forecasting")], ['2']
+        )
+
+    def test_since_filter(self):
+        """Papers published before `since` are not returned."""
+        results = self.index.search("image", since=datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        self.assertEqual([p['url'][-1] for p in results], ['1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
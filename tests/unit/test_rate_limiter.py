@@ -0,0 +1,113 @@
+"""Unit tests for RateLimiter."""
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep moves time forward.
+
+    Remembers the last time each thread read, which for a limiter is the
+    time its last acquisition was granted.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __call__(self):
+        with self._lock:
+            self._local.last = self.now
+            return self.now
+
+    @property
+    def last_read(self):
+        return self._local.last
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test cases for RateLimiter."""
+
+    def test_burst(self):
+        """Only `burst` requests go out without waiting."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=60, clock=clock, sleep=clock.sleep, burst=3)
+
+        for _ in range(3):
+            self.assertEqual(limiter.acquire(), 0)
+        self.assertAlmostEqual(limiter.acquire(), 1.0)
+
+    def test_waits_for_request_refill(self):
+        """Without a burst, requests are spaced by one refill interval."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=60, clock=clock, sleep=clock.sleep)
+
+        self.assertEqual(limiter.acquire(), 0)
+        waited = limiter.acquire()
+
+        self.assertAlmostEqual(waited, 1.0)
+
+    def test_quota_holds_in_every_window_across_threads(self):
+        """Four threads never get more than the quota in any 60s window."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=6, clock=clock, sleep=clock.sleep)
+        granted = []
+        granted_lock = threading.Lock()
+
+        def worker():
+            for _ in range(10):
+                limiter.acquire()
+                with granted_lock:
+                    granted.append(clock.last_read)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        granted.sort()
+        self.assertEqual(len(granted), 40)
+        for i, start in enumerate(granted):
+            in_window = sum(1 for t in granted[i:] if t < start + 60 - 1e-9)
+            self.assertLessEqual(in_window, 6)
+
+    def test_waits_for_token_refill(self):
+        """Token quota is enforced independently of the request quota."""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            requests_per_minute=100,
+            tokens_per_minute=600,
+            clock=clock,
+            sleep=clock.sleep
+        )
+
+        limiter.acquire(6)
+        waited = limiter.acquire(100)
+
+        # The bucket holds one request's share (6 tokens) at 10 tokens/second
+        self.assertAlmostEqual(waited, 0.6)
+        # The oversized request left 94 tokens of debt to pay back
+        self.assertAlmostEqual(limiter.acquire(6), 10.0)
+
+    def test_invalid_quota(self):
+        """A non-positive request quota is rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(requests_per_minute=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Unit tests for the repository store."""
+import unittest
+import tempfile
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.collectors.github_search import GitHubSearchClient
+from src.collectors.repo_store import RepoStore
+
+
+def response(payload):
+    resp = Mock()
+    resp.status_code = 200
+    resp.json.return_value = payload
+    resp.headers = {}
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+def node(full_name, pushed_at, stars=100):
+    return {'nameWithOwner': full_name, 'url': f"https://github.com/{full_name}",
+            'stargazerCount': stars, 'pushedAt': pushed_at, 'updatedAt': pushed_at}
+
+
+class TestRepoStore(unittest.TestCase):
+    """Test cases for RepoStore."""
+
+    def setUp(self):
+        """Set up a store file in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "repos.sqlite"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_only_pushed_repositories_are_refreshed(self):
+        """Unchanged repositories are served from the store across runs."""
+        session = Mock()
+        session.get.return_value = response({'resources': {}})
+        details = {'nameWithOwner': 'me/a', 'description': 'A repo',
+                   'primaryLanguage': {'name': 'Python'}}
+        session.post.side_effect = [
+            response({'data': {'q0': {'nodes': [node('me/a', '2024-01-01T00:00:00Z'),
+                                                  node('me/b', '2024-01-01T00:00:00Z')]}}}),
+            response({'data': {'r0': details, 'r1': {**details, 'nameWithOwner': 'me/b'}}}),
+            response({'data': {'q0': {'nodes': [node('me/a', '2024-01-01T00:00:00Z', 120),
+                                                  node('me/b', '2024-02-01T00:00:00Z')]}}}),
+            response({'data': {'r0': {**details, 'nameWithOwner': 'me/b', 'description': 'New'}}}),
+        ]
+
+        first = GitHubSearchClient(token='t', session=session,
+                                   repo_store=RepoStore(self.path)).search(['q'])
+        second = GitHubSearchClient(token='t', session=session,
+                                    repo_store=RepoStore(self.path)).search(['q'])
+
+        self.assertEqual(first[0][0]['description'], 'A repo')
+        self.assertNotIn('description', session.post.call_args_list[0].kwargs['json']['query'])
+        detail_query = session.post.call_args.kwargs['json']['query']
+        self.assertIn('r0: repository(owner: "me", name: "b")', detail_query)
+        self.assertNotIn('"a"', detail_query)
+        self.assertEqual([(r['description'], r['stars']) for r in second[0]],
+                         [('A repo', 120), ('New', 100)])
+
+    def test_star_deltas(self):
+        """Star gains come from the oldest and newest observation in the window."""
+        for day, stars in [(1, 10), (5, 40), (9, 55)]:
+            RepoStore(self.path, today=date(2024, 6, day)).upsert(
+                [{'full_name': 'me/a', 'stars': stars, 'pushed_at': None}]
+            )
+        store = RepoStore(self.path, today=date(2024, 6, 9))
+
+        self.assertEqual(store.star_deltas(['me/a'], days=7), {'me/a': 15})
+        self.assertEqual(store.star_deltas(['me/a'], days=30), {'me/a': 45})
+        self.assertEqual(store.star_deltas(['me/a'], days=1), {})
+        self.assertEqual(store.get(['me/a', 'me/b'])['me/a']['stars'], 55)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Unit tests for the retry engine."""
+import asyncio
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.retry import Retrier, RetryPolicy, is_retryable, retry_after
+
+
+def http_error(status, headers=None):
+    error = Exception(f"HTTP {status}")
+    error.response = Mock(status_code=status, headers=headers or {})
+    return error
+
+
+class TestRetry(unittest.TestCase):
+    """Test cases for the retry engine."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.sleeps = []
+
+        def sleep(seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        self.sleep = sleep
+
+    def retrier(self, **policy):
+        return Retrier(RetryPolicy(**policy), sleep=self.sleep,
+                       clock=lambda: self.now, rng=lambda: 0.5)
+
+    def test_classifies_errors(self):
+        """Transient errors are retried, permanent ones are not."""
+        self.assertTrue(is_retryable(http_error(503)))
+        self.assertTrue(is_retryable(Exception("429 Resource has been exhausted (e.g. check quota)")))
+        self.assertTrue(is_retryable(ConnectionError("reset by peer")))
+        self.assertFalse(is_retryable(http_error(404)))
+        self.assertFalse(is_retryable(Exception("API key not valid. Please pass a valid API key.")))
+
+    def test_retry_after(self):
+        """Server-requested delays come from headers or the error message."""
+        self.assertEqual(retry_after(http_error(429, {'Retry-After': '7'})), 7.0)
+        self.assertEqual(retry_after(Exception("Quota exceeded. Please retry in 12.5s.")), 12.5)
+        self.assertIsNone(retry_after(http_error(503)))
+
+    def test_jittered_backoff_honours_retry_after(self):
+        """Waits double per attempt (with jitter) and never undercut Retry-After."""
+        func = Mock(side_effect=[http_error(503), http_error(429, {'Retry-After': '9'}), "ok"])
+
+        self.assertEqual(self.retrier(base_delay=2, max_attempts=3).call(func), "ok")
+        self.assertEqual(self.sleeps, [1.0, 9.0])
+
+    def test_permanent_errors_and_deadline(self):
+        """Permanent errors fail at once; retries stop at the deadline."""
+        auth = Mock(side_effect=http_error(401))
+        with self.assertRaises(Exception):
+            self.retrier().call(auth)
+        self.assertEqual(auth.call_count, 1)
+
+        flaky = Mock(side_effect=http_error(503))
+        with self.assertRaises(Exception):
+            self.retrier(base_delay=10, max_attempts=10, deadline=30).call(flaky)
+        self.assertEqual(self.sleeps, [5.0, 10.0])
+        self.assertEqual(flaky.call_count, 3)
+
+    def test_rate_limit_errors_wait_at_least_the_floor(self):
+        """A quota error is never retried almost at once, even with low jitter."""
+        func = Mock(side_effect=[http_error(429), "ok"])
+        retrier = Retrier(RetryPolicy(base_delay=5, rate_limit_delay=30), sleep=self.sleep,
+                          clock=lambda: self.now, rng=lambda: 0.0)
+
+        self.assertEqual(retrier.call(func), "ok")
+        self.assertEqual(self.sleeps, [30.0])
+
+    def test_deadline_starts_once_quota_is_granted(self):
+        """Time blocked in acquire does not use up the retry deadline."""
+        def acquire():
+            self.now += 100  # Queued behind other callers
+
+        flaky = Mock(side_effect=[http_error(503), "ok"])
+        retrier = Retrier(RetryPolicy(base_delay=10, deadline=30), sleep=self.sleep,
+                          clock=lambda: self.now, rng=lambda: 0.5, acquire=acquire)
+
+        self.assertEqual(retrier.call(flaky), "ok")
+        self.assertEqual(flaky.call_count, 2)
+
+    def test_async_backoff_does_not_block_other_tasks(self):
+        """Other tasks on the loop run while a call backs off."""
+        events = []
+        flaky = Mock(side_effect=[http_error(503), "done"])
+        retrier = Retrier(RetryPolicy(base_delay=0.1), rng=lambda: 1.0)
+
+        async def other():
+            await asyncio.sleep(0.01)
+            events.append("other")
+
+        async def main():
+            result, _ = await asyncio.gather(retrier.call_async(flaky), other())
+            events.append(result)
+
+        asyncio.run(main())
+        self.assertEqual(events, ["other", "done"])
+
+
+if __name__ == '__main__':
+    unittest.main()
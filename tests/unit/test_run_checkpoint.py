@@ -0,0 +1,135 @@
+"""Unit tests for run checkpoints."""
+import unittest
+import tempfile
+import sys
+from datetime import date
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.generators.blog_generator import BlogGenerator
+from src.utils.run_checkpoint import RunCheckpoint
+
+
+class TestRunCheckpoint(unittest.TestCase):
+    """Test cases for RunCheckpoint."""
+
+    def setUp(self):
+        """Set up a checkpoint file in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "checkpoints.sqlite"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_completed_stages_are_not_rerun(self):
+        """A stage runs once per run date."""
+        calls = []
+
+        def collect():
+            calls.append(1)
+            return {'competitions': [1, 2]}
+
+        first = RunCheckpoint(self.path, run_date=date(2024, 6, 1))
+        self.assertEqual(first.run('data', collect), {'competitions': [1, 2]})
+
+        retry = RunCheckpoint(self.path, run_date=date(2024, 6, 1))
+        self.assertEqual(retry.run('data', collect), {'competitions': [1, 2]})
+        self.assertEqual(retry.completed(), ['data'])
+
+        next_day = RunCheckpoint(self.path, run_date=date(2024, 6, 2))
+        next_day.run('data', collect)
+        self.assertEqual(len(calls), 2)
+
+        much_later = RunCheckpoint(self.path, run_date=date(2024, 6, 10), keep_days=3)
+        self.assertIsNone(RunCheckpoint(self.path, run_date=date(2024, 6, 2)).get('data'))
+        self.assertEqual(much_later.completed(), [])
+
+    def test_retry_only_regenerates_failed_sections(self):
+        """Sections generated before a failure are loaded on the retry."""
+        generator = BlogGenerator.__new__(BlogGenerator)
+        generator.config = Mock()
+        generator.config.get.side_effect = lambda key, default=None: default
+        generator.checkpoint = RunCheckpoint(self.path, run_date=date(2024, 6, 1))
+        gemini = generator.gemini_generator = Mock()
+        gemini.cache_stats.return_value = None
+        gemini.generate_competition_overview.return_value = "overview"
+        gemini.generate_research_summary.return_value = "research"
+        gemini.generate_github_repos_summary.return_value = "github"
+        gemini.predict_trends.side_effect = [RuntimeError("quota"), "trends"]
+
+        data = {'competitions': [], 'leaderboards': {}, 'kernels': {}, 'research_papers': [],
+                'github_repos': [], 'latest_ml_papers': [], 'new_competitions': []}
+        first = generator._generate_sections(data)
+        second = generator._generate_sections(data)
+
+        self.assertTrue(first['trends'].startswith("[Content generation failed"))
+        self.assertEqual(second['trends'], "trends")
+        self.assertEqual(second['overview'], "overview")
+        self.assertEqual(gemini.generate_competition_overview.call_count, 1)
+        self.assertEqual(gemini.generate_research_summary.call_count, 2)
+
+    def _pipeline(self, data):
+        generator = BlogGenerator.__new__(BlogGenerator)
+        generator.config = Mock()
+        settings = {'research.dedup': {'history_days': 0}}
+        generator.config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        generator.checkpoint = RunCheckpoint(self.path, run_date=date(2024, 6, 1))
+        generator._collect_all_data = Mock(return_value=data)
+        generator._generate_sections = Mock(return_value={})
+        generator._render_markdown = Mock(return_value="md")
+        generator._render_html = Mock(return_value="html")
+        generator._save_blog = Mock(return_value={'markdown': 'a.md', 'html': 'a.html'})
+        generator._failed_sources = []
+        return generator
+
+    def test_saved_blog_clears_checkpoints(self):
+        """A successful run leaves nothing for a later run to resume."""
+        data = {'research_papers': [], 'latest_ml_papers': []}
+        generator = self._pipeline(data)
+
+        generator.generate_daily_blog()
+
+        self.assertEqual(generator.checkpoint.completed(), [])
+
+    def test_fresh_run_ignores_checkpoints(self):
+        """A fresh run collects again even if today's data is checkpointed."""
+        data = {'research_papers': [], 'latest_ml_papers': []}
+        generator = self._pipeline(data)
+        generator.checkpoint.save('data', {'stale': True})
+        generator._save_blog.side_effect = RuntimeError("disk full")
+
+        with self.assertRaises(RuntimeError):
+            generator.generate_daily_blog(fresh=True)
+
+        generator._collect_all_data.assert_called_once()
+        self.assertEqual(generator.checkpoint.get('data'), data)
+
+    def test_failed_source_is_recollected_on_resume(self):
+        """Data with a failed source is not checkpointed, so the retry collects again."""
+        generator = self._pipeline({})
+        del generator._collect_all_data
+        generator.kaggle_collector = Mock()
+        generator.kaggle_collector.get_active_competitions.return_value = []
+        generator.kaggle_collector.rank_competitions.return_value = []
+        generator.kaggle_collector.get_new_competitions.return_value = []
+        generator.github_collector = Mock()
+        generator.github_collector.search_repositories_for_competitions.return_value = {}
+        research = generator.research_collector = Mock()
+        research.get_papers_for_competitions.side_effect = [RuntimeError("arXiv down"), {}]
+        research.get_latest_ml_research.return_value = []
+        generator._save_blog.side_effect = [RuntimeError("disk full"), {'markdown': 'a.md', 'html': 'a.html'}]
+
+        with self.assertRaises(RuntimeError):
+            generator.generate_daily_blog()
+        self.assertIsNone(generator.checkpoint.get('data'))
+
+        generator.generate_daily_blog()
+
+        self.assertEqual(research.get_papers_for_competitions.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Unit tests for TaskPool."""
+import unittest
+import threading
+import time
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.task_pool import TaskPool
+
+
+class TestTaskPool(unittest.TestCase):
+    """Test cases for TaskPool."""
+
+    def test_results_in_submission_order(self):
+        """Results come back in submission order regardless of finish order."""
+        def delayed(value, delay):
+            time.sleep(delay)
+            return value
+
+        with TaskPool(max_workers=4) as pool:
+            pool.submit('a', 'slow', delayed, 1, 0.05)
+            pool.submit('b', 'fast', delayed, 2, 0)
+            results = pool.results()
+
+        self.assertEqual(results, [('slow', 1), ('fast', 2)])
+
+    def test_per_source_limit(self):
+        """No more than the configured number of calls run per source."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def track():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+        with TaskPool(max_workers=8, source_limits={'arxiv': 1}) as pool:
+            for i in range(4):
+                pool.submit('arxiv', i, track)
+            pool.results()
+
+        self.assertEqual(max(peak), 1)
+
+    def test_failed_task_returns_none(self):
+        """A failing call is reported as None without affecting others."""
+        def boom():
+            raise RuntimeError("API down")
+
+        with TaskPool(max_workers=2) as pool:
+            pool.submit('kaggle', 'bad', boom)
+            pool.submit('kaggle', 'good', lambda: [1])
+            results = pool.results()
+
+        self.assertEqual(results, [('bad', None), ('good', [1])])
+
+
+if __name__ == '__main__':
+    unittest.main()